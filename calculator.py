@@ -0,0 +1,6722 @@
+"""
+    Filename: calculator.py
+     Version: 4.0
+      Author: Richard E. Rawson
+        Date: 2021-10-09
+ Description: Command line RPN calculator that performs a variety of common functions. This program contains 96 functions that are needed for the operation of the calculator itself, along with help functions and other utility functions such as conversions.
+
+Program and package information:
+            OS: Windows 10 10.0.19041 SP0
+        curses: 2.2
+          json: 2.0.9
+     pyperclip: 1.8.2
+        python: 3.8.0
+
+Versions:
+    1.0 -- The original draft version of ada.
+    2.0 -- Major update to the original version.
+    3.0 -- Updated by incorporating "curses".
+    4.0 -- Re-code for conciseness and better coding.
+
+v4.0 is the version available as "master" on github.
+"""
+
+import atexit
+from array import array
+import bz2
+from collections import OrderedDict
+import csv
+from decimal import Context, Decimal, Inexact, InvalidOperation, localcontext
+import glob
+import gzip
+import itertools
+import json
+import lzma
+import math
+import mmap
+import operator
+import os
+import random
+import re
+import signal
+import struct
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+from string import ascii_uppercase
+
+
+# ==== TODOLIST========================================================================
+
+# FEATURE:
+# -- Save memory registers between sessions.
+
+
+# =====================================================================================
+
+
+# ==== MAIN CALCULATOR FUNCTION =============================
+
+
+def RPN(stack, user_dict, lastx_list, mem, settings, tape, window):
+    """
+    Main function that:
+        1. prints the register and a short menu on screen
+        2. gets the user's input
+        3. does initial processing, so we know what to do with whatever the user enters
+        3. ...otherwise, we stay in the while... loop
+
+    User inputs can be any of the following:
+        -- one or more numbers with or without one or more operators (e.g., +, x, sqrt)
+        -- groups of numbers/operators, delimited with parentheses
+        -- hex or binary numbers or rgb/hex values
+        -- memory register operator
+        -- one or more commands (e.g., index, set, drop, swap)
+        -- one or more shortcut commands (e.g, s, d, c)
+        -- a user-defined operator (expression or constant)
+        -- a named constant (e.g, avogadro, parsec)
+        -- a transparency value (%) for hex colors
+        -- other inputs that cannot be processed at all (e.g, "claer" (not "clear"), or unbalanced parentheses)
+
+        Some inputs can be handled easily within this function, but most are compiled by compile_line() into a Program and then run by initial_processing().
+
+    Args:
+        stack (Stack): the stack
+        user_dict (dict): user-defined operations
+        lastx_list (list): running list of x: values stored in a list
+        mem (dict): dictionary of memory registers
+        settings (dict): settings used by the program
+        tape (list): list of entered_values, entered by the user
+        window (_curses.window): terminal window
+
+    Raises:
+        Exception: handles "h" and "h q" entries so the program doesn't choke
+
+    Returns: None
+    """
+
+    # curses is only needed when ada runs in a terminal, so batch mode doesn't wait for it to be imported.
+    import curses
+
+    # Make sure the terminal environment is what we want.
+    curses.noecho()
+    curses.flushinp()
+    window.clear()
+    window.refresh()
+
+    # Keep a journal of the session, so that it can be recovered if the terminal dies (see Journal). Answers typed at prompts are journaled, too, so the window records them.
+    journal = None
+    if settings.get('autosave', 'on') == 'on':
+        try:
+            journal = Journal(journal_file, stack, Session(user_dict, lastx_list, mem, settings, tape))
+            window = RecordingWindow(window)
+        except OSError:
+            journal = None
+
+    while True:
+        quit = False
+
+        # If the stack has grown past the memory limit in {settings}, move the deepest part of it to disk.
+        stack.spill(int(settings.get('memory_limit', '256')) * 1024 * 1024)
+
+        # Print the register.
+        stack = print_register(stack, settings, window)
+
+        # Generate and print the menu after printing the register.
+        window.addstr('\n')
+        for i in range(0, len(menu), 4):
+            m = ''.join(menu[i:i+4])
+            window.addstr(m + '\n')
+        window.refresh()
+        start_row = 8
+
+        # Get the command line entry from the user. We can't do lower() because the MEM
+        # functions depend on uppercase entries.
+        entered_value = ''
+        entered_value = get_user_input(window, start_row, 0, "").lstrip().rstrip()
+
+        # If the user enters "q", then quit.
+        if entered_value.lower().strip() == 'q':
+            # Save the session, so that it can be picked up again the next time ada starts.
+            if journal:
+                journal.checkpoint(stack, Session(user_dict, lastx_list, mem, settings, tape))
+                journal.close()
+            elif settings.get('autosave', 'on') == 'on':
+                try:
+                    write_snapshot(session_file, stack, Session(user_dict, lastx_list, mem, settings, tape))
+                except OSError:
+                    pass
+            # Write any memory registers or settings that haven't been saved yet.
+            persistence.flush()
+            return
+
+        # If <ENTER> alone was pressed, duplicate the x: value on the stack
+        # and then loop back with <continue>.
+        if len(entered_value) == 0:
+            stack.push(stack.x)
+            if journal:
+                journal.record('', [], 0, stack, Session(user_dict, lastx_list, mem, settings, tape))
+            continue
+
+        # Pick up any changes to the user-defined operations made by another copy of ada. Unless constants.json has changed, this costs one os.stat().
+        user_dict = current_user_ops(user_dict)
+
+        # ! This is the single line of code that will handle the vast majority of inputs.
+        if journal:
+            window.answers, window.waited, window.replayable, started, seed = [], 0, True, time.time(), journal.seed_random()
+        stack, lastx_list, tape, user_dict, settings = evaluate_line(window, stack, entered_value, lastx_list, user_dict, mem, settings, tape)
+        if journal:
+            if window.replayable:
+                journal.record(entered_value, window.answers, time.time() - started - window.waited, stack, Session(user_dict, lastx_list, mem, settings, tape), seed)
+            else:
+                # Replaying the line wouldn't give the same stack, so save the whole session now.
+                journal.checkpoint(stack, Session(user_dict, lastx_list, mem, settings, tape))
+
+        if quit:
+            # Save {settings} to disk before quitting.
+            with open('config.json', 'w+') as file:
+                file.write(json.dumps(settings, ensure_ascii=False))
+            window.addstr('\nEnd program.\n')
+            window.refresh()
+            break
+
+    return None
+
+
+def evaluate_line(window, stack, entered_value, lastx_list, user_dict, mem, settings, tape):
+    """
+    Evaluate one command line, exactly as if the user had typed it, and add it to the tape. This is used by RPN() for everything except "q" and <ENTER> by itself, and by batch mode (see run_batch()), which runs lines without a terminal.
+
+    Args:
+        window (_curses.window): terminal window (or a BatchWindow)
+        stack (Stack): the stack
+        entered_value (str): the command line
+        lastx_list (list): running list of x: values stored in a list
+        user_dict (dict): user-defined operations
+        mem (dict): dictionary of memory registers
+        settings (dict): settings used by the program
+        tape (list): list of entered_values, entered by the user
+
+    Returns:
+        Modified stack, lastx_list, tape, user_dict, and settings
+    """
+    entered_list = []
+
+    # Make sure that any parentheses are paired before proceeding.
+    lst = list(entered_value)
+    if lst.count('(') - lst.count(')') != 0:
+        show_error(window, 'Parentheses are not balanced.\n')
+        return stack, lastx_list, tape, user_dict, settings
+
+    # ==== HERE, WE BEGIN PARSING "entered_value", THE USER'S COMMAND-LINE INPUT.
+    """
+    Step 1 in processing is to take care of inputs that can be handled easily. These include:
+        -- a hex color beginning with a '#'
+        -- a hexadecimal value, beginning with '0x'
+        -- a binary number beginning with "0b"
+
+    Step 2 is to parse more complex command line entries, which includes anything that couldn't be parsed in Step 1. What a user may enter on the command line is very flexible and unpredictable, including any combination of parentheses, floats, integers, math operators (e.g, (45 32 -) 5 x 9 / 273.15 +), or other commands such as "about" or "advanced". Such command lines need to be parsed into the individual items. Then the program can determine what to do with each item via compile_line() and run the result via initial_processing().
+    """
+
+    # If "entered_value" is in {phrases}, translate "entered_value" here before continuing. This allows entering a phrase rather than a shortcut. Example: "grams to ounces" rather than "go". The former makes more sense; the latter is faster.
+    if entered_value.lower() in phrases.keys():
+        entered_value = phrases[entered_value.lower()][0]
+
+    # If "entered_value" is a hex color beginning with a '#', convert to RGB.
+    if entered_value[0] == '#':
+        stack = hex_to_rgb(stack, entered_value, window)
+
+    # If "entered_value" is a hexadecimal value, beginning with '0x', convert to a decimal.
+    elif entered_value[0:2] == '0x':
+        stack = convert_hex_to_dec(stack, window, entered_value.split(' ')[0][2:])
+
+    # If "entered_value" is a binary number beginning with "0b", convert to a decimal.
+    elif entered_value[0:2] == '0b':
+        stack = convert_bin_to_dec(stack, window, entered_value.split(' ')[0][2:])
+
+    # CODENOTE: Except for the special cases above, we're going to have to parse what the user entered.
+        # -- First, we compile the line: get each item (defined as whatever is between spaces) and figure out what to do with each item. A line that has been entered before is already compiled.
+        # -- Second, we run the compiled line.
+    else:
+        program = compile_line(entered_value)
+        entered_list = program.items
+
+        stack, lastx_list, tape, user_dict, settings = initial_processing(window, stack, program, lastx_list, user_dict, mem, settings, tape)
+
+    # Append the command line to the tape. Since some commands, like "0b..." or "0x...", don't go through "entered_list", add those commands from "entered_value"
+    if entered_list:
+        tape.append(entered_list)
+    else:
+        tape.append(entered_value)
+
+    return stack, lastx_list, tape, user_dict, settings
+
+
+# ==== BATCH MODE =============================
+
+class BatchWindow:
+    """
+    Stands in for the curses window when ada runs without a terminal (see run_batch()). Whatever ada would show on the screen is collected in [text] instead. Prompts are answered from [answers], if any are given (e.g., when a journal is replayed; see recover_session()), and otherwise with <ENTER>, since there is no one to answer them.
+
+    Most of what ada shows is ordinary output (e.g., "stats", "about", or help). An error message is shown by show_error(), which sets [failed], so the line can be reported as a failure.
+    """
+
+    def __init__(self, answers=()):
+        self.text = []
+        self.answers = list(answers)
+        self.failed = False
+
+    def addstr(self, *args):
+        # Like curses, the string is always the last argument: addstr(str) or addstr(row, col, str).
+        self.text.append(str(args[-1]))
+
+    def take(self):
+        """Return everything shown since the last call, and whether an error was shown (see show_error()); then start over."""
+        text, failed = ''.join(self.text), self.failed
+        self.text, self.failed = [], False
+        return text, failed
+
+    def clear(self):
+        self.text = []
+
+    def getstr(self, *args):
+        return self.answers.pop(0).encode('utf8') if self.answers else b''
+
+    def getyx(self):
+        return (0, 0)
+
+    def getmaxyx(self):
+        # Large enough that nothing waits for the user to page through help text.
+        return (10000, 80)
+
+    def refresh(self):
+        pass
+
+    def move(self, *args):
+        pass
+
+    def clrtobot(self):
+        pass
+
+    def clrtoeol(self):
+        pass
+
+
+def run_batch(lines, stack, user_dict, lastx_list, mem, settings, tape):
+    """
+    Run command lines without a terminal, exactly as if they had been typed, one after the other: $ python ada.py --batch file.rpn, or $ python ada.py -e "4 16 s 2 ^ 4 / /". Blank lines are skipped and "q" stops.
+
+    Anything ada would show on the screen (e.g., the output of "stats" or "about") is written to stdout. A line that fails -- one that raises an exception or shows an error message (see show_error()), such as "Cannot divide by zero." -- is reported on stderr instead, and the lines after it still run. When all the lines have run, the register is written to stdout, formatted according to {settings}.
+
+    Returns:
+        int, the number of lines that failed
+    """
+    window = BatchWindow()
+    problems = 0
+    for line_number, line in enumerate(lines, 1):
+        entered_value = line.strip()
+        if not entered_value:
+            continue
+        if entered_value.lower() == 'q':
+            break
+        # On screen, the register always shows at least 4 numbers (see print_register()), so every line starts with them.
+        stack.pad(4)
+        try:
+            stack, lastx_list, tape, user_dict, settings = evaluate_line(window, stack, entered_value, lastx_list, user_dict, mem, settings, tape)
+            text, failed = window.take()
+        except Exception as error:
+            text, failed = window.take()[0] + '\nline ' + str(line_number) + ': ' + type(error).__name__ + ': ' + str(error) + '\n', True
+        if failed:
+            problems += 1
+            sys.stderr.write(text.strip('\n') + '\n')
+        elif text.strip():
+            sys.stdout.write(text.strip('\n') + '\n')
+
+    stack = print_register(stack, settings, window)
+    sys.stdout.write(window.take()[0])
+    sys.stdout.flush()
+
+    return problems
+
+
+# Set to False in worker processes (see init_worker()) so that jobs running side by side don't all rewrite memory_registers.json.
+save_memory = True
+
+
+def message_text(text):
+    """
+    Squeeze what ada would have shown on the screen into one line for a report: the "=====" borders and blank lines are dropped.
+    """
+    lines = [line.strip() for line in text.splitlines()]
+    return ' '.join(line for line in lines if line.strip('='))
+
+
+def read_jobs(path):
+    """
+    Read the jobs for worker mode from a file, or from every file in a directory (in name order). Each non-blank line is one job.
+
+    Returns:
+        [list] of (job name, command line), where the job name is "file:line number"
+    """
+    if os.path.isdir(path):
+        files = sorted(os.path.join(path, name) for name in os.listdir(path) if os.path.isfile(os.path.join(path, name)))
+    else:
+        files = [path]
+
+    jobs = []
+    for file_name in files:
+        with open(file_name, 'r') as file:
+            for line_number, line in enumerate(file, 1):
+                if line.strip():
+                    jobs.append((file_name + ':' + str(line_number), line.strip()))
+    return jobs
+
+
+def init_worker(tables, worker_user_dict, worker_mem, worker_settings):
+    """
+    Set up a worker process for run_worker(). The tables ({op1}, {commands}, etc.) are normally created when ada starts, which doesn't happen in a worker process on every operating system, so they are passed in.
+    """
+    global save_memory, user_dict, mem, settings
+    globals().update(tables)
+    user_dict, mem, settings = worker_user_dict, worker_mem, worker_settings
+    save_memory = False
+    build_dispatch_table()
+    compile_user_ops(user_dict)
+
+
+def run_job(job):
+    """
+    Run one job in a worker process, on a stack of its own.
+
+    Returns:
+        (job name, x: formatted according to {settings}, anything ada would have shown on the screen, as one line, and whether the job failed)
+    """
+    name, entered_value = job
+    window = BatchWindow()
+    stack = Stack([Decimal('0.0')] * 4)
+    try:
+        stack, *rest = evaluate_line(window, stack, entered_value, [Decimal('0.0')], user_dict, dict(mem), settings, [])
+        stack.pad(4)
+        text, failed = window.take()
+        # A job that failed has no result, so it can't be mistaken for one that worked.
+        return name, '' if failed else format_number(stack.x, settings), message_text(text), failed
+    except Exception as error:
+        return name, '', message_text(window.take()[0] + '\n' + type(error).__name__ + ': ' + str(error)), True
+
+
+def run_worker(path, workers=None):
+    """
+    Worker mode: $ python ada.py --worker jobs.rpn (or a directory of job files). Every line is an independent job, run on a stack of its own, so the jobs are spread across a pool of processes.
+
+    The x: value of every job is written to stdout, one line per job, in the same order as the jobs. Jobs that show something (e.g., "stats", or "Cannot divide by zero.") don't wait for <ENTER>; since stdout holds only the x: values, what they show is written to stderr with the job's file name and line number. Only a job that raises an exception or shows an error message counts as failed; its line on stdout is left empty.
+
+    Returns:
+        int, the number of jobs that failed
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = read_jobs(path)
+    workers = workers or os.cpu_count() or 1
+    tables = {name: globals()[name] for name in ('menu', 'op1', 'op2', 'commands', 'constants', 'shortcuts', 'alpha', 'phrases')}
+
+    # Send jobs to the processes in chunks, so that small jobs aren't swamped by the cost of passing them around.
+    chunk_size = max(1, min(1000, len(jobs) // (workers * 4)))
+
+    problems = 0
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(tables, user_dict, mem, settings)) as executor:
+        for name, x, message, failed in executor.map(run_job, jobs, chunksize=chunk_size):
+            sys.stdout.write(x + '\n')
+            problems += failed
+            if message:
+                sys.stderr.write(name + ': ' + message + '\n')
+    sys.stdout.flush()
+
+    return problems
+
+
+# Pipe mode writes its results in batches of this many lines, or at least this often (in seconds) while data keeps arriving.
+pipe_batch_size = 1000
+pipe_flush_interval = 0.25
+
+
+def run_pipe(entered_value, stream, output, user_dict, mem, settings):
+    """
+    Pipe mode, like awk: $ cat temperatures.txt | python ada.py --pipe "fc"
+
+    Every line read from "stream" is a record. Its fields (separated by spaces or tabs) are put on a stack of their own, in order, so the last field is in x:. Then the compiled command line is run and x: is written to "output", one line per record (an empty line for a record that failed). The numbers are written in full, without a separator, so other programs can read them.
+
+    Only one record is held in memory at a time, however long the stream. Memory registers (e.g., "M+") carry over from one record to the next, but are not saved. Anything a record shows (e.g., "stats") is written to stderr, with its line number, since "output" holds only the results. A record fails if it isn't all numbers, raises an exception, or shows an error message (e.g., "Cannot divide by zero.").
+
+    Returns:
+        int, the number of records that failed
+    """
+    global save_memory
+    save_memory = False
+
+    program = compile_line(entered_value)
+    window = BatchWindow()
+    session = Session(user_dict, [Decimal('0.0')], mem, settings, [])
+
+    problems, pending, last_flush = 0, [], time.monotonic()
+    for line_number, line in enumerate(stream, 1):
+        result, message, failed = '', '', False
+        try:
+            values = [Decimal(field) for field in line.split()]
+        except InvalidOperation:
+            values = None
+            message, failed = 'not a number: ' + line.strip(), True
+
+        if values:
+            stack = Stack(reversed(values)).pad(4)
+            try:
+                stack = run_program(window, stack, program, session)
+                text, failed = window.take()
+                message = message_text(text)
+                # A record that failed gets an empty line, the same as one that isn't all numbers.
+                if not failed:
+                    result = '{:f}'.format(stack.pad(1).x)
+            except Exception as error:
+                message, failed = message_text(window.take()[0] + '\n' + type(error).__name__ + ': ' + str(error)), True
+
+        problems += failed
+        if message:
+            sys.stderr.write('line ' + str(line_number) + ': ' + message + '\n')
+
+        pending.append(result)
+        if len(pending) >= pipe_batch_size or time.monotonic() - last_flush >= pipe_flush_interval:
+            output.write('\n'.join(pending) + '\n')
+            output.flush()
+            pending, last_flush = [], time.monotonic()
+
+    if pending:
+        output.write('\n'.join(pending) + '\n')
+    output.flush()
+
+    return problems
+
+
+# ==== EXPRESSION EVALUATION FUNCTIONS =============================
+
+
+# A single compiled pattern that splits a command line into items, left to right, in one pass. Each alternative is a named group, so the name of the group that matched tells us what kind of item it is:
+#   number -- an integer, decimal, or exponent (e.g., -43.5, .5, 6.02e23); a leading "-" belongs to the number only if a digit or "." follows
+#    paren -- "(" or ")"
+#     word -- a memory register command (M+, M-, MD, ML, MR), a word that starts with a letter, "_", or "!" and continues with lowercase letters, "_", or ":" (e.g., dup, sqrt, x:), or a single operator symbol
+#    space -- spaces, plus ";" and ":" which are ignored
+#    other -- any other character, which is reported as an unknown command
+TOKEN_PATTERN = re.compile(r"""
+    (?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+  | (?P<paren>[()])
+  | (?P<word>M[-+DLR]|[A-Za-z_!][a-z_:]*|[-+*/%^])
+  | (?P<space>[\s;:]+)
+  | (?P<other>.)
+""", re.VERBOSE)
+
+REGISTERS = ('x:', 'y:', 'z:', 't:')
+
+
+def tokenize(entered_value):
+    """
+    Split a command line into a list of typed tokens. Each token is a tuple: (kind, text), where kind is one of:
+
+        'number' -- e.g., 43, -43.5, 6.02e23
+      'operator' -- a math operation in {op1} or {op2}, e.g., +, sqrt
+       'command' -- anything else with a name: commands, shortcuts, constants, user-defined operations, and unknown words
+      'register' -- x:, y:, z:, or t:
+         'paren' -- ( or )
+
+    Example:
+
+        (43 62 s d dup +) --> [('paren', '('), ('number', '43'), ('number', '62'), ('command', 's'), ('command', 'd'), ('command', 'dup'), ('operator', '+'), ('paren', ')')]
+
+    Numbers and single-character operators/shortcuts don't need spaces around them: "3 5+" and "-43.5d" work as expected. Words do need spaces: "dssqrt" is a single (unknown) word, not "d s sqrt".
+
+    If the user entered a number with commas, the commas are deleted. This means that 3,545 will be converted to 3545. One consequence is that "3,5 +" will be converted to "35 +" and not "3 5+" as might have been intended. The user should use spaces where spaces are intended.
+    """
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(entered_value.replace(',', '')):
+        kind, text = match.lastgroup, match.group()
+        if kind == 'space':
+            continue
+        if kind == 'word':
+            if text in REGISTERS:
+                kind = 'register'
+            elif text in op1 or text in op2:
+                kind = 'operator'
+            else:
+                kind = 'command'
+        elif kind == 'other':
+            kind = 'command'
+        tokens.append((kind, text))
+    return tokens
+
+
+class Program:
+    """
+    A compiled command line: what compile_line() produces and initial_processing() runs.
+
+        opcodes -- [list] of Opcode, one per action, in order
+      registers -- (tuple), the registers (0 for x:, 1 for y:, etc.) that the command line refers to by name
+          items -- [list] of the items on the command line, as typed; this is what goes on the tape
+
+    Register names are not replaced with numbers when the line is compiled. Instead, the values in the named registers are read when the program starts to run, so the same compiled program can be run again and again, whatever is on the stack.
+    """
+
+    def __init__(self, opcodes, registers, items):
+        self.opcodes = opcodes
+        self.registers = registers
+        self.items = items
+        # How many times the program has run, and its translation into a Python function: None if not translated yet, False if it can't be (see native_function()).
+        self.runs = 0
+        self.native = None
+
+
+# Compiled command lines, most recently used last, keyed by the text of the command line.
+program_cache = OrderedDict()
+program_cache_size = 256
+program_cache_stats = {'hits': 0, 'misses': 0}
+
+# Compiled user-defined operations, keyed by name. See compile_user_ops().
+user_programs = {}
+
+# How deeply user-defined operations may call each other (e.g., an operation that uses itself).
+max_call_depth = 50
+
+
+def compile_user_ops(user_dict):
+    """
+    Compile every user-defined operation (and constant) in {user_dict} into a Program, once, and store them in {user_programs}. This is done when ada starts and whenever the user adds, edits, or deletes an operation with "user".
+
+    Because compiled operations are looked up by name, a user-defined operation can be used anywhere in a command line, just like a built-in operation, including inside another user-defined operation.
+    """
+    # Command lines compiled earlier may refer to operations that have changed, so start over.
+    program_cache.clear()
+    user_programs.clear()
+
+    # All the names must be known before anything is compiled, so operations can use each other in any order.
+    for name in user_dict:
+        user_programs[name] = None
+    for name, value in user_dict.items():
+        user_programs[name] = compile_line(str(value[0]))
+
+    return user_programs
+
+
+def compile_line(entered_value):
+    """
+    Compile a command line into a Program: tokenize it, look up what every item on the line does, then optimize the result (see optimize()). The result is kept in {program_cache} so that entering the same line again (e.g., pasted from the tape) skips both steps.
+
+    Example:
+
+        4 16 s 2 ^ --> [Opcode(push, '4'), Opcode(push, '16'), Opcode(stack, 's'), Opcode(push, '2'), Opcode(stack, '^')]
+
+    Arguments:
+        entered_value (str) -- the string that the user entered
+
+    Return:
+        Program
+    """
+    program = program_cache.get(entered_value)
+    if program:
+        program_cache.move_to_end(entered_value)
+        program_cache_stats['hits'] += 1
+        return program
+    program_cache_stats['misses'] += 1
+
+    # A user-defined operation's name, on its own line, is always a call to that operation: even if its name would not survive tokenize() (e.g., "k2" or "myOp"), and even if a built-in operation has the same name, as it always has been. Within a longer line, a built-in operation wins (see resolve_item()).
+    own_line = entered_value.strip() in user_programs
+    if own_line:
+        tokens = [('command', entered_value.strip())]
+    else:
+        tokens = tokenize(entered_value)
+    opcodes, registers = [], set()
+    ndx = 0
+    while ndx < len(tokens):
+        kind, text = tokens[ndx]
+
+        if own_line:
+            opcodes.append(Opcode('call', text, value=text))
+
+        elif kind == 'number':
+            opcodes.append(Opcode('push', text, arity=0, value=Decimal(text)))
+
+        # Register names are looked up when the program runs. See initial_processing().
+        elif kind == 'register':
+            registers.add(REGISTERS.index(text))
+            opcodes.append(Opcode('register', text, arity=0, value=REGISTERS.index(text)))
+
+        # Items within parentheses are handled in the same way as items that are NOT in parentheses, so the parentheses themselves don't need to do anything.
+        elif kind == 'paren':
+            pass
+
+        # "h" by itself shows a help message. "h" + (str) shows help for (str), so (str) is not executed. "h q" must not quit.
+        elif text == 'h' and len(tokens) == 1:
+            opcodes.append(Opcode('help', text))
+        elif text == 'h' and ndx + 1 < len(tokens) and tokens[ndx+1][1] != 'q':
+            opcodes.append(Opcode('help', text, value=tokens[ndx+1][1]))
+            ndx += 1
+
+        # "explain" + (str) shows how the rest of the line is compiled, so the rest of the line is not executed.
+        elif text == 'explain' and ndx + 1 < len(tokens):
+            opcodes.append(Opcode('explain', text, value=' '.join(text for kind, text in tokens[ndx+1:])))
+            break
+
+        else:
+            opcodes.append(resolve_item(text))
+
+        ndx += 1
+
+    program = Program(optimize(opcodes), tuple(sorted(registers)), [text for kind, text in tokens])
+    program_cache[entered_value] = program
+    if len(program_cache) > program_cache_size:
+        program_cache.popitem(last=False)
+
+    return program
+
+
+# ==== PEEPHOLE OPTIMIZER =============================
+"""
+Compiled programs are tidied up before they are run. Looking at the last few opcodes every time an opcode is added, optimize() folds arithmetic on numbers that are known when the line is compiled, removes pairs of opcodes that cancel each other, and replaces some common sequences with a single opcode. The program always leaves the same values on the stack as the line that was typed.
+
+CODENOTE: Only sequences whose result can't depend on rounding are folded or rearranged. For example, in "(45 32 -) 5 x 9 / 273.15 +", "5 x 9 /" multiplies a value on the stack by 5 and then divides by 9; replacing that with one multiplication by 5/9 would round differently, so it is left alone.
+"""
+
+# Pairs of opcodes (by function) that, one right after the other, leave the stack exactly as it was.
+cancelling_pairs = {('swap', 'swap'), ('dup', 'drop'), ('roll_up', 'roll_down'), ('roll_down', 'roll_up'), ('negate', 'negate')}
+
+# Math operators that can be folded when both values are numbers typed on the command line, and what they do with (y, x). Division and modulo by zero are never folded, so the user still sees the error.
+foldable = {
+    'add': lambda y, x: x + y,
+    'sub': lambda y, x: y - x,
+    'mul': lambda y, x: y * x,
+    'truediv': lambda y, x: y / x if x else None,
+    'mod': lambda y, x: y % x if x else None,
+    'power': lambda y, x: y ** x,
+}
+
+# "^" is folded only if the answer is exact. If it had to be rounded, it is left for the following "% m" (see power_mod()) or for when the line runs.
+exact_folds = {'power'}
+
+
+def square_x(stack, value, window):
+    """Replaces "dup *": x: times x:, in one step."""
+    x = stack.x
+    stack.x = x * x
+    return stack
+
+
+def power_mod(stack, value, window):
+    """Replaces "^ m %": y: to the power x:, modulo {value}.
+
+When y: and x: are whole numbers (x: not negative), the remainder is found without working out y: ** x: first, so it is exact and fast even when y: ** x: has far too many digits to hold. Otherwise, "^" and "%" are run as usual."""
+    x, y = stack.x, stack.y
+    try:
+        result = pow(y, x, value)
+    except (InvalidOperation, ValueError, TypeError):
+        stack = power(stack, '^', window)
+        stack.push(value)
+        return mod(stack, '%', window)
+    stack.pop()
+    stack.pop()
+    stack.push(result)
+    return stack
+
+
+def function_name(opcode):
+    """
+    The name of the function an opcode runs, or None. Used to recognize opcodes whatever the user typed (e.g., "s" or "swap").
+    """
+    return getattr(opcode.function, '__name__', None)
+
+
+def optimize(opcodes):
+    """
+    Run the peephole optimizer over a list of opcodes.
+
+    Example:
+
+        2 3 + 4 * s s dup * --> 400
+
+    Arguments:
+        opcodes -- [list] of Opcode
+
+    Return:
+        [list] of Opcode
+    """
+    optimized = []
+    for opcode in opcodes:
+        optimized.append(opcode)
+        while reduce_tail(optimized):
+            pass
+    return optimized
+
+
+def reduce_tail(opcodes):
+    """
+    Apply a single optimization to the end of [opcodes], in place. Return True if something changed.
+    """
+    if len(opcodes) < 2:
+        return False
+    first, last = opcodes[-2], opcodes[-1]
+    pushes = ('push', 'register')
+
+    # "s s", "dup d", "ru rd", and so on.
+    if (function_name(first), function_name(last)) in cancelling_pairs:
+        del opcodes[-2:]
+        return True
+
+    # Putting a value on the stack and dropping it again.
+    if first.kind in pushes and function_name(last) == 'drop':
+        del opcodes[-2:]
+        return True
+
+    # Putting two values on the stack and swapping them: just put them on the stack in the other order.
+    if len(opcodes) >= 3 and opcodes[-3].kind in pushes and first.kind in pushes and function_name(last) == 'swap':
+        opcodes[-3:] = [first, opcodes[-3]]
+        return True
+
+    # A number followed by "n".
+    if first.kind == 'push' and function_name(last) == 'negate':
+        value = Decimal(str(operator.neg(first.value)))
+        opcodes[-2:] = [Opcode('push', str(value), arity=0, value=value)]
+        return True
+
+    # Two numbers followed by a math operator.
+    if len(opcodes) >= 3 and opcodes[-3].kind == 'push' and first.kind == 'push' and last.arity == 2 and function_name(last) in foldable:
+        try:
+            with localcontext() as context:
+                context.traps[Inexact] = function_name(last) in exact_folds
+                value = foldable[function_name(last)](opcodes[-3].value, first.value)
+        except (ArithmeticError, ValueError):
+            value = None
+        if value is not None:
+            opcodes[-3:] = [Opcode('push', str(value), arity=0, value=value)]
+            return True
+
+    # "dup *"
+    if function_name(first) == 'dup' and function_name(last) == 'mul':
+        opcodes[-2:] = [Opcode('fused', '[dup ' + last.item + ']', square_x, arity=1)]
+        return True
+
+    # "^ m %", where m is a number.
+    if len(opcodes) >= 3 and function_name(opcodes[-3]) == 'power' and first.kind == 'push' and function_name(last) == 'mod':
+        opcodes[-3:] = [Opcode('fused', '[^ ' + first.item + ' %]', power_mod, arity=2, value=first.value)]
+        return True
+
+    # Two numbers followed by "^ m %".
+    if len(opcodes) >= 3 and opcodes[-3].kind == 'push' and first.kind == 'push' and last.function is power_mod:
+        try:
+            value = pow(opcodes[-3].value, first.value, last.value)
+        except (ArithmeticError, ValueError, TypeError):
+            return False
+        opcodes[-3:] = [Opcode('push', str(value), arity=0, value=value)]
+        return True
+
+    return False
+
+
+# ==== NATIVE CODE =============================
+"""
+A program that is run again and again (e.g., a user-defined operation, or a line pasted from the tape) is translated into a Python function the second time it runs, if every step's effect on the stack is known ahead of time: numbers, register names, + - * / % ^, n, s, dup, d, ru, rd, steps combined by optimize(), and user-defined operations made of the same things.
+
+The function works on local variables instead of the stack. Only when it has finished without an error are its results put on the stack, so if anything goes wrong (e.g., division by zero), the stack is untouched and the program is simply run again, one step at a time, which reports the error as usual.
+
+Example: "x: y: dup rd - 2 / s d +" (from "mid") becomes:
+
+    def native(stack, registers, lastx):
+        i0 = stack[0]
+        v0 = registers[0]
+        v1 = registers[1]
+        v2 = v0 - v1
+        if c0 == 0: raise ZeroDivisionError
+        v3 = v2 / c0
+        v4 = v3 + v1
+        return 1, (v4, ), (i0, v3)
+
+where c0 is Decimal('2'), and the result means: take one value (the x: that was zeroed) off the stack and put v4 on.
+"""
+
+# Python expressions for the math operations that translate directly. {x} and {y} are the values in x: and y:.
+native_binary = {
+    'add': '{x} + {y}',
+    'sub': '{y} - {x}',
+    'mul': '{y} * {x}',
+    'truediv': '{y} / {x}',
+    'mod': '{y} % {x}',
+    'power': '{y} ** {x}',
+    'power_mod': 'pow({y}, {x}, {value})',
+}
+native_unary = {
+    'negate': 'Decimal(str(-{x}))',
+    'square_x': '{x} * {x}',
+}
+
+# A program is translated the second time it runs. Set settings['native'] to 'off' to always run programs one step at a time.
+native_threshold = 2
+native_stats = {'compiled': 0, 'rejected': 0, 'fallbacks': 0}
+
+
+class NotNative(Exception):
+    """Raised while translating a program that can't be turned into a Python function."""
+
+
+class NativeBuilder:
+    """
+    Translates a Program into the source of a Python function, keeping track of what would be on the stack as a list of variable names.
+
+        stack -- [list] of variable names, x: last, for the values the program has touched so far
+       inputs -- how many values, counting from x:, the program reads from the stack it is given
+       consts -- {dict} of Decimal values the function needs, keyed by variable name
+        lines -- [list] of the statements in the body of the function
+         tops -- [list] of the variable names that were in x: before each step (for lastx)
+    """
+
+    def __init__(self):
+        self.stack = []
+        self.inputs = 0
+        self.consts = {}
+        self.lines = []
+        self.tops = []
+        self.count = 0
+
+    def variable(self, expression):
+        """Add a statement that saves "expression" in a new variable, and return the variable's name."""
+        name = 'v' + str(self.count)
+        self.count += 1
+        self.lines.append(name + ' = ' + expression)
+        return name
+
+    def const(self, value):
+        name = 'c' + str(len(self.consts))
+        self.consts[name] = value
+        return name
+
+    def need(self, size):
+        """Make sure the top "size" values are known, reading more of the program's input from the stack if necessary."""
+        while len(self.stack) < size:
+            self.stack.insert(0, 'i' + str(self.inputs))
+            self.inputs += 1
+
+    def add_program(self, program, depth=0):
+        """Translate every opcode in "program"."""
+        if depth > max_call_depth:
+            raise NotNative(program)
+
+        # A program's register names refer to the values in those registers when the program starts, and those registers start at zero. For the program itself (depth 0), run_program() has already done this; the saved values are passed to the function as {registers}.
+        registers = {}
+        for ndx in program.registers:
+            if depth == 0:
+                registers[ndx] = self.variable('registers[' + str(ndx) + ']')
+            else:
+                self.need(ndx + 1)
+                registers[ndx] = self.stack[-1 - ndx]
+                self.stack[-1 - ndx] = self.const(Decimal('0.0'))
+
+        for opcode in program.opcodes:
+            self.need(1)
+            self.tops.append(self.stack[-1])
+            self.add_opcode(opcode, registers, depth)
+
+    def add_opcode(self, opcode, registers, depth):
+        kind, name = opcode.kind, function_name(opcode)
+        stack = self.stack
+
+        if kind == 'push':
+            stack.append(self.const(opcode.value))
+        elif kind == 'register':
+            stack.append(registers[opcode.value])
+        elif kind == 'call':
+            self.add_program(user_programs[opcode.value], depth + 1)
+        elif kind not in ('stack', 'fused'):
+            raise NotNative(opcode)
+
+        elif name in native_binary:
+            self.need(2)
+            x, y = stack.pop(), stack.pop()
+            if name == 'truediv':
+                self.lines.append('if ' + x + ' == 0: raise ZeroDivisionError')
+            value = self.const(opcode.value) if kind == 'fused' else ''
+            stack.append(self.variable(native_binary[name].format(x=x, y=y, value=value)))
+        elif name in native_unary:
+            self.need(1)
+            stack.append(self.variable(native_unary[name].format(x=stack.pop())))
+        elif name == 'swap':
+            self.need(2)
+            stack[-1], stack[-2] = stack[-2], stack[-1]
+        elif name == 'dup':
+            self.need(1)
+            stack.append(stack[-1])
+        elif name == 'drop':
+            self.need(1)
+            stack.pop()
+        elif name == 'roll_up':
+            self.need(4)
+            stack[-4:] = stack[-3:] + stack[-4:-3]
+        elif name == 'roll_down':
+            self.need(4)
+            stack[-4:] = stack[-1:] + stack[-4:-1]
+        else:
+            raise NotNative(opcode)
+
+    def source(self):
+        """The source of the finished function."""
+        reads = ['i' + str(ndx) + ' = stack[' + str(ndx) + ']' for ndx in range(self.inputs)]
+        lastx = (['lastx'] + self.tops)[-2:]
+        result = 'return ' + str(self.inputs) + ', (' + ''.join(name + ', ' for name in self.stack) + '), (' + ', '.join(lastx) + ')'
+        body = reads + self.lines + [result]
+        return 'def native(stack, registers, lastx):\n' + ''.join('    ' + line + '\n' for line in body)
+
+
+def native_function(program):
+    """
+    Translate "program" into a Python function, or return None if it can't be done. The function is called as native(stack, registers, lastx), where "registers" are the values saved by run_program(), and returns:
+
+        (number of values to take off the stack, (values to put back on the stack, x: last), (new lastx_list))
+    """
+    builder = NativeBuilder()
+    try:
+        builder.add_program(program)
+    except (NotNative, KeyError, TypeError):
+        native_stats['rejected'] += 1
+        return None
+
+    source = builder.source()
+    namespace = {'Decimal': Decimal}
+    namespace.update(builder.consts)
+    exec(compile(source, '<ada native>', 'exec'), namespace)
+    native_stats['compiled'] += 1
+    return namespace['native']
+
+
+class Session:
+    """
+    Everything, other than the stack, that the items on a command line can read or change. Keeping these together means every opcode can be called the same way: opcode.run(stack, session, window).
+
+        user_dict -- {dict}, user-defined operations
+       lastx_list -- [list], running list of x: values
+              mem -- {dict}, dictionary of memory registers
+         settings -- {dict}, dictionary of program settings
+             tape -- [list], list of entered_values, entered by the user
+    """
+
+    def __init__(self, user_dict, lastx_list, mem, settings, tape):
+        self.user_dict = user_dict
+        self.lastx_list = lastx_list
+        self.mem = mem
+        self.settings = settings
+        self.tape = tape
+
+
+class Opcode:
+    """
+    A single step of a compiled command line. Every operation ada knows is turned into an Opcode once, when ada starts (see build_dispatch_table()), so looking up an item on the command line is a single dictionary lookup.
+
+    The many different ways ada's functions are called -- operation(stack, item, window), operation(stack, mem, window), operation(stack, settings, window), and so on -- are hidden behind run(stack, session, window), which always returns the stack.
+
+        kind -- how to run the opcode:
+                 'push' -- put {value} on the stack (a number or a constant)
+                'stack' -- function(stack, item, window)
+                  'op1' -- function(stack, item, window), reporting math domain errors
+               'memory' -- function(stack, mem, window), then save {mem}
+                'stats' -- function(stack, settings, window), for commands that use {settings} (e.g., "stats", "import", "export")
+              'session' -- function(stack, session, window), for commands that save or replace the whole session
+                 'tape' -- print_tape()
+                 'user' -- user_defined()
+             'settings' -- calculator_settings()
+                'fused' -- function(stack, value, window); several opcodes combined into one by optimize()
+                 'help' -- help for {value}, or general help if {value} is None
+              'explain' -- show how the command line {value} is compiled
+              'unknown' -- the item is not recognized
+            The following are run by run_program(), itself:
+                 'quit' -- stop processing the command line
+             'register' -- push the value register {value} held when the program started
+                 'call' -- run the user-defined operation named {value}
+        function -- the function that does the work, if any
+        item -- (str), the item, as typed
+        arity -- (int), how many values the opcode takes off the stack, if that is always the same; otherwise None
+        value -- for 'push', 'register', 'fused', 'help', 'explain', and 'call', as described above
+    """
+    __slots__ = ('kind', 'function', 'item', 'arity', 'value', 'run')
+
+    def __init__(self, kind, item, function=None, arity=None, value=None):
+        self.kind = kind
+        self.function = function
+        self.item = item
+        self.arity = arity
+        self.value = value
+        self.run = getattr(self, 'run_' + kind, None)
+
+    def __repr__(self):
+        return 'Opcode(' + self.kind + ', ' + repr(self.item) + ')'
+
+    def run_push(self, stack, session, window):
+        stack.push(self.value)
+        return stack
+
+    def run_stack(self, stack, session, window):
+        return self.function(stack, self.item, window)
+
+    def run_op1(self, stack, session, window):
+        # Several math operations catch their own exceptions, but the following catches anything I have not thought about.
+        try:
+            stack = self.function(stack, self.item, window)
+        except ValueError as error:
+            show_error(window, 'Math domain error. Common examples:\n-- divide by zero\n-- square root of a negative number\n-- arccos or arcsin of value outside expeced range' + '\n')
+        return stack
+
+    def run_memory(self, stack, session, window):
+        stack, session.mem = self.function(stack, session.mem, window)
+        # NOTE: Save {mem} to a .json file after calls to the memory functions that change it (not "MR" or "ML"). The file is written in the background, a moment later, so a loop full of "M+" costs nothing but the arithmetic.
+        if save_memory and self.item in ['M+', 'M-', 'MD']:
+            save_memory_registers(session.mem)
+        return stack
+
+    def run_fused(self, stack, session, window):
+        return self.function(stack, self.value, window)
+
+    def run_explain(self, stack, session, window):
+        return explain(stack, self.value, window)
+
+    def run_stats(self, stack, session, window):
+        return self.function(stack, session.settings, window)
+
+    def run_session(self, stack, session, window):
+        return self.function(stack, session, window)
+
+    def run_tape(self, stack, session, window):
+        entered_list = []
+        session.tape = print_tape(window, stack, entered_list, session.lastx_list, session.user_dict, session.mem, session.settings, session.tape)
+        return stack
+
+    def run_user(self, stack, session, window):
+        stack, session.user_dict = user_defined(stack, session.user_dict, window)
+        return stack
+
+    def run_settings(self, stack, session, window):
+        session.settings = calculator_settings(stack, session.settings, window)
+        return stack
+
+    # If "h" is by itself, show a help message. If user enters "h" + (str), send (str) to help_fxn(), which will figure out what help to display.
+    def run_help(self, stack, session, window):
+        if self.value:
+            help_fxn(stack, self.value, window)
+        else:
+            window.move(8, 0)
+            window.clrtobot()
+            window.move(9, 0)
+            window.addstr('='*45)
+            window.addstr('\nFor help with individual commands, type:')
+            window.addstr('\n\n     h [command]\n\n')
+            window.addstr('where [command] is any command or operation.\n\nType:\n\n     index\n\nto access lists of commands and operations.\n')
+            window.addstr('\nType:\n\n     basics\n\nfor help with how to use an RPN calculator\n')
+            window.addstr('='*45 + '\n\n')
+            window.refresh()
+            input = get_user_input(window, 28, 0, "Press <ENTER> to continue...")
+            window.move(8, 0)
+            window.clrtobot()
+            window.refresh()
+        return stack
+
+    # The user entered something unrecognizable. Any unrecognized operation (a garbage entry) is ignored. The user is notified and the program simply continues.
+    def run_unknown(self, stack, session, window):
+        show_error(window, '"' + self.item + '"\n' + find_error(self.item) + '\n')
+        return stack
+
+
+# Every built-in item ada recognizes, mapped to its Opcode. See build_dispatch_table().
+dispatch_table = {}
+
+
+def build_dispatch_table():
+    """
+    Build {dispatch_table} from {shortcuts}, {op1}, {op2}, {constants}, and {commands}. This is done once, when ada starts.
+
+    Where the same name appears in more than one dictionary, the first one in the list above wins (e.g., "n" is the shortcut, not the math operation). Entries that only format the lists of commands (e.g., "====") are left out.
+    """
+    dispatch_table.clear()
+    dispatch_table['q'] = Opcode('quit', 'q')
+    dispatch_table['set'] = Opcode('settings', 'set', calculator_settings)
+
+    for item, (function, description) in shortcuts.items():
+        if callable(function):
+            dispatch_table.setdefault(item, Opcode('stack', item, function))
+    for item, (function, description) in op1.items():
+        if callable(function):
+            dispatch_table.setdefault(item, Opcode('op1', item, function, arity=1))
+    for item, (function, description) in op2.items():
+        if callable(function):
+            dispatch_table.setdefault(item, Opcode('stack', item, function, arity=2))
+    for item, (value, description) in constants.items():
+        dispatch_table.setdefault(item, Opcode('push', item, arity=0, value=value))
+    for item, (function, description) in commands.items():
+        if not callable(function):
+            continue
+        if item in ['M+', 'M-', 'MD', 'MR', 'ML']:
+            dispatch_table.setdefault(item, Opcode('memory', item, function))
+        elif item in ['stats', 'tape', 'user']:
+            dispatch_table.setdefault(item, Opcode(item, item, function))
+        elif item in ['import', 'export']:
+            # These use the settings of the session, which "set" may have changed.
+            dispatch_table.setdefault(item, Opcode('stats', item, function))
+        elif item in ['save', 'load']:
+            dispatch_table.setdefault(item, Opcode('session', item, function))
+        else:
+            dispatch_table.setdefault(item, Opcode('stack', item, function))
+
+    return dispatch_table
+
+
+def resolve_item(item):
+    """
+    Figure out what a single item from the command line does: a built-in operation from {dispatch_table}, a user-defined operation from {user_programs}, or something ada doesn't recognize. This is done once, when the command line is compiled. If a user-defined operation has the same name as a built-in one, the built-in one is used here; the user-defined operation can still be run on its own line (see compile_line()).
+
+    Return:
+        Opcode
+    """
+    opcode = dispatch_table.get(item)
+    if opcode:
+        return opcode
+    if item in user_programs:
+        return Opcode('call', item, value=item)
+    return Opcode('unknown', item)
+
+
+def initial_processing(window, stack, program, lastx_list, user_dict, mem, settings, tape):
+    """
+    Run a compiled command line (a Program from compile_line()). See run_program().
+
+    Args:
+          program: Program, the compiled command line
+       lastx_list: [list], running list of x: values stored in a list
+              mem: {dict}, dictionary of memory registers
+         settings: {dict}, dictionary of program settings
+            stack: Stack, holds the stack; unlimited length
+             tape: [list], list of entered_values, entered by the user
+        user_dict: {dict}, user-defined operations
+           window: _curses.window, the terminal instance
+
+    Return:
+        Modified stack, lastx_list, tape, user_dict, and settings
+    """
+    session = Session(user_dict, lastx_list, mem, settings, tape)
+    stack = run_program(window, stack, program, session)
+    return stack, session.lastx_list, session.tape, session.user_dict, session.settings
+
+
+def run_program(window, stack, program, session, depth=0):
+    """
+    Run a compiled program one opcode at a time:
+        1. append to [lastx_list] to keep track of what was in the x: register last
+        2. if the opcode is a register name, put the value that register held when the program started on the stack
+        3. if the opcode is a user-defined operation, run that operation's Program (the same way: a user-defined operation's register names refer to the stack when the operation starts)
+        4. if the opcode is "q", stop
+        5. if the opcode is anything else, run it
+
+    Args:
+          program: Program, the compiled command line
+          session: Session, everything other than the stack that opcodes may use
+            depth: int, how many user-defined operations deep this program is running
+
+    Return:
+        Modified stack
+    """
+
+    # In case x:, y:, z:, t: are used, save the values in those registers, then set those registers to zero. The saved values are put back on the stack wherever the register names appear in the command line.
+    registers = {}
+    for ndx in program.registers:
+        registers[ndx] = stack[ndx]
+        stack[ndx] = Decimal('0.0')
+
+    # If the program has been translated into a Python function, run that instead. If anything goes wrong, the stack hasn't been changed, so run the program one step at a time, below.
+    if program.opcodes and session.settings.get('native', 'on') == 'on':
+        program.runs += 1
+        if program.native is None and program.runs >= native_threshold:
+            program.native = native_function(program) or False
+        if program.native:
+            try:
+                inputs, values, lastx = program.native(stack, registers, session.lastx_list[-1])
+            except Exception:
+                native_stats['fallbacks'] += 1
+            else:
+                for i in range(inputs):
+                    stack.pop()
+                for value in values:
+                    stack.push(value)
+                session.lastx_list = list(lastx)
+                return stack
+
+    for opcode in program.opcodes:
+        kind = opcode.kind
+
+        # Save this item as lastx_list; retrieved by get_lastx().
+        session.lastx_list = [session.lastx_list[-1], stack.x]
+
+        if kind == 'quit':
+            break
+        elif kind == 'register':
+            stack.push(registers[opcode.value])
+        elif kind == 'call':
+            if depth >= max_call_depth:
+                show_error(window, '"' + opcode.item + '"\nUser-defined operations are calling each\nother too many times. Check for an operation\nthat uses itself.\n')
+                break
+            stack = run_program(window, stack, user_programs[opcode.value], session, depth + 1)
+        else:
+            stack = opcode.run(stack, session, window)
+
+    return stack
+
+
+def find_error(item):
+    """
+    If user enters something unintelligible, try to provide some help for common errors.
+    """
+    if item in ['m', 'ml', 'mr', 'md', 'm+', 'm-']:
+        err = 'Commands related to memory registers\nrequire capitalization.'
+    else:
+        err = 'Unknown command. A user-defined operation\nwhose name has digits, capitals (after the\nfirst letter), or other symbols needs to\nbe on its own line.'
+    return err
+
+
+def print_register(stack, settings, window):
+    """
+    Display the stack register, as formatted numbers, in the terminal. Via "settings", the user can choose to display numbers in either normal or scientific format, with or without a "," separator, and with a specified number of decimal places.
+    """
+
+    stack_names = [' x', ' y', ' z', ' t']
+    window.move(0, 0)
+    window.clear()
+    window.addstr('')
+
+    # Get the thousands separator and the numbering format from {settings}. See format_number() for the rest.
+    separator = settings['separator']
+    number_notation = settings['notation']
+
+    # Stack must always have at least 4 elements.
+    stack.pad(4)
+
+    # Make sure the registers contain only numbers. That the stack would contain anything other than a float, Decimal or int is very unlikely (impossible?), but if it did, it would be a disaster. Only the four registers on screen are checked, so a deep stack costs nothing here.
+    for ndx in range(4):
+        try:
+            r = int(stack[ndx])
+        except (ValueError, OverflowError):
+            stack[ndx] = Decimal('0.0')
+
+    """
+    If the number_notation is normal, then we need to find the longest number on the stack and format the whole stack accordingly. This means that the decimal places in the register will always line up, giving space for the longest (largest) number. Two examples:
+
+            t:   0.0000
+            z:   0.0000
+            y: 456.0000
+            x:  45.0000
+
+            t:                          0.0000
+            z:                          0.0000
+            y: 45,624,562,456,546,234,523.0000
+            x:                         45.0000
+
+    For scientific notation, numbers under 1,000 are not printed with an exponent. Thus, alignment looks like this:
+
+            t:   0.0000
+            z: 456.0000
+            y:   5.7323e+5
+            x:   6.9932
+
+    """
+
+    if number_notation == 'normal':
+
+        # Find the number with the most digits ahead of the decimal separator.
+        indent_amount, max_commas = 0, 0
+        for i in [stack.x, stack.y, stack.z, stack.t]:
+
+            # Whether a Decimal or a float, a very large "i" will be represented as an exponent, so we need to use format() to get the whole number.
+            non_exponent = '{0:.28f}'.format(i)
+
+            # Find the length of the number to the left of the decimal point.
+            whole_number_part = non_exponent.find('.') if non_exponent.find('.') >= 0 else len(non_exponent)
+
+            # "indent_amount" is the length of the largest number. For example, the "indent_amount" for 7832.45 is 4 and for 874.99834 is 3.
+            indent_amount = whole_number_part if whole_number_part > indent_amount else indent_amount
+
+            # If the separator is a comma, rather then None, then we need to account for the space that the commas take up.
+            if separator:
+                max_commas = math.ceil(whole_number_part / 3) - 1 if math.ceil(whole_number_part / 3) - 1 > max_commas else max_commas
+
+        # Calculate the total amount by which numbers should be indented. This takes into account the length of the longest number, so all decimal points will be aligned.
+        indent_amount = indent_amount + max_commas + 1
+
+        # Print the register, from the last item to the first item.
+        for i in range(3, -1, -1):
+            # Create the format string for the number.
+            fs = format_number(stack[i], settings)
+            # Line up decimal points.
+            p = indent_amount + len(fs) - fs.find('.')
+            # Print one line of the register.
+            window.addstr(str(stack_names[i]) + ':' + ('{:>' + str(p) + '}').format(fs) + '\n')
+            window.refresh()
+
+    else:
+
+        # Find the number with the most digits ahead of the decimal separator.
+        indent_amount, max_commas = 0, 0
+        for i in [stack.x, stack.y, stack.z, stack.t]:
+
+            # Find the length of the number to the left of the decimal point. Since, with scientific notation, we are always going to print numbers > 1,000 with an exponent, the number of digits to the left of the decimal will always be one for those numbers.
+            if i < 1000:
+                whole_number_part = str(i).find('.') if str(i).find('.') >= 0 else len(str(i))
+            else:
+                whole_number_part = 1
+
+            # "indent_amount" is the length of the largest number. For example, the "indent_amount" for 732.45 is 3 and for 8748.99834 is 1. The latter is the case because in scientific notation, it will appear as 8.7490e+3
+            indent_amount = whole_number_part if whole_number_part > indent_amount else indent_amount
+
+        # Calculate the total amount by which numbers should be indented. This takes into account the length of the longest number, so all decimal points will be aligned.
+        indent_amount = 3 if indent_amount > 3 else indent_amount
+        indent_amount = indent_amount + 1
+
+        # Print the register, from the last item to the first item.
+        for i in range(3, -1, -1):
+
+            # Create the format string for the number. Numbers less than 1000 are formatted normally. This avoids the cumbersome display of, say 845.6 as 8.456e+2
+            fs = format_number(stack[i], settings)
+            # Line up decimal points.
+            p = indent_amount + len(fs) - fs.find('.')
+            # Print one line of the register.
+            window.addstr(str(stack_names[i]) + ':' + ('{:>' + str(p) + '}').format(fs) + '\n')
+            window.refresh()
+
+    window.refresh()
+
+    return stack
+
+
+def format_number(value, settings):
+    """
+    Format one number the way the register shows it: according to {settings}, in normal or scientific notation, with or without a "," separator, and with the chosen number of decimal places. In scientific notation, numbers less than 1000 are not given an exponent.
+    """
+    return number_formatter(settings)(value)
+
+
+def number_formatter(settings):
+    """
+    Return a function that formats numbers like format_number(). Working out the format once is much faster when many numbers are formatted (e.g., by "export").
+    """
+    dp, separator = settings['dec_point'], settings['separator']
+    normal = ('{:' + separator + '.0' + dp + 'f}').format
+    if settings['notation'] == 'normal':
+        return normal
+    scientific = ('{:' + separator + '.0' + dp + 'e}').format
+    return lambda value: normal(value) if value < 1000 else scientific(value)
+
+
+# ==== IMPORT FILE FUNCTIONS =============================
+
+
+def get_file_data(stack, settings, window):  # command: import
+    """Import a text file and put the data on the stack.
+
+Since the stack is only a one-dimensional list of
+numbers, the file that you import should contain only
+one column of numbers, one number to a line. Lines that
+don't contain numbers will be skipped (and listed in the
+report). If you mean for a blank line to be zero, then
+put a zero on that line!
+
+A large file is read in chunks, showing how much has
+been imported. Press CTRL-C to stop the import; the
+numbers read so far are kept.
+
+Imported data is stored compactly (8 bytes per number),
+so very large files can be imported. Numbers with up to
+18 decimal places are kept exactly; if a number has
+more digits than that, the file is stored as floats.
+
+Options can be typed after the file name:
+
+    data.txt lazy
+
+"lazy" leaves the numbers in the file and reads each
+one only when it is used, so even a huge file is
+imported instantly. The file must not change while it
+is on the stack. (A compressed file or a table can't be
+read this way, so "lazy" is ignored for one.)
+
+CSV, TSV, and JSON-lines files (.csv, .tsv, .jsonl) can
+be imported, too. Choose columns by name or by number
+(counting from 1); each column goes on the stack
+separately, with the first column on top:
+
+    sales.csv cols=price,qty
+    log.jsonl cols=latency
+
+Add "rows" to interleave the columns, row by row:
+
+    points.csv cols=1,2 rows
+
+Binary files are put on the stack instantly, without
+reading them: raw 64-bit floats (.f64) or integers
+(.i64), or a NumPy array (.npy). For a raw file with
+another extension, say which it is:
+
+    samples.f64
+    counts.bin format=i64
+
+A compressed binary file (e.g., samples.f64.gz) can't
+be imported instantly; it is decompressed into memory.
+
+"follow" watches a file that is still being written
+(like a log), putting each new number on the stack as
+it arrives, so the newest number is in x:. The count,
+mean, standard deviation, minimum, maximum, and sum of
+the new numbers are kept up to date on the screen.
+Press CTRL-C to stop following:
+
+    sensor.log follow
+
+Files compressed with gzip, bzip2, or xz (.gz, .bz2,
+.xz) are decompressed as they are read:
+
+    server.log.gz
+    sales.csv.xz cols=price
+
+Several files can be imported at once: use a pattern
+like "*" or "?" in the file name, or list the files,
+separated by commas. The files are read at the same
+time and put on the stack one after another, with the
+first file on top. Files matching a pattern are taken
+in name order. Each file is imported according to its
+own kind (text, table, or binary), and options such as
+"cols" apply to every file:
+
+    shards/day-*.txt
+    jan.txt, feb.txt, mar.txt
+    shards/*.csv cols=price"""
+
+    data_file = get_user_input(window, None, None, '\nFile name: ')
+    data_file, options = split_file_options(data_file, ['lazy', 'rows', 'follow'])
+
+    if 'follow' in options:
+        return get_follow_data(stack, data_file, settings, window)
+
+    # Split a pattern or a list of files first; each file is then imported according to its own format.
+    if not os.path.exists(data_file) and (',' in data_file or glob.has_magic(data_file)):
+        return get_many_files_data(stack, data_file, options, window)
+
+    file_format = import_format(data_file, options)
+    if file_format in binary_formats.values():
+        return get_binary_data(stack, data_file, file_format, window)
+
+    if file_format == 'table':
+        return get_table_data(stack, data_file, options, window)
+
+    # A compressed file can't be read lazily, so it is imported in the usual way.
+    if 'lazy' in options and not compression(data_file):
+        return get_lazy_file_data(stack, data_file, window)
+
+    # Read the data file, a chunk at a time, into a compact array. The first line in the file becomes x:.
+    try:
+        report = read_number_file(data_file, window)
+
+    # Notify user if no file was found, or if it couldn't be read (e.g., a damaged compressed file).
+    except (OSError, EOFError, UnicodeDecodeError, lzma.LZMAError) as error:
+        if isinstance(error, (FileNotFoundError, IsADirectoryError)):
+            show_error(window, 'File not found. Stack unmodified.\n', 55)
+        else:
+            show_error(window, textwrap.fill('Could not read the file: ' + str(error), 55) + '\nStack unmodified.\n', 55)
+        return stack
+
+    # In case nothing was read in, keep the existing stack. Otherwise, the data goes into the stack as a single segment, underneath the registers.
+    if len(report['values']):
+        stack = Stack().push_segment(report['values'].segment())
+
+    # Provide a report to the user
+    import_report(window, report)
+
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+
+    return stack
+
+
+def import_format(data_file, options):
+    """
+    Decide how a file is imported, from its extension (see file_extension()) and the "format=" and "cols=" options: as a binary array ('f64', 'i64', or 'npy'; see get_binary_data()), as a 'table' (see get_table_data()), or as a column of numbers in a 'text' file.
+    """
+    file_format = options.get('format') or binary_formats.get(file_extension(data_file))
+    if file_format in binary_formats.values():
+        return file_format
+    if options.get('format') or 'cols' in options or file_extension(data_file) in table_formats:
+        return 'table'
+    return 'text'
+
+
+def get_lazy_file_data(stack, data_file, window):
+    """
+    Put a text file on the stack without reading it: the file becomes a LazyFileSegment, and numbers are read from it only as they are used. Called by get_file_data() for "import [file] lazy".
+    """
+    try:
+        index = LineIndex(data_file)
+    except (FileNotFoundError, IsADirectoryError):
+        show_error(window, 'File not found. Stack unmodified.\n', 55)
+        return stack
+    except ValueError:
+        # mmap can't map an empty file.
+        index = None
+
+    # Only the first few numbers are located now, to fill the x:, y:, z:, and t: registers.
+    if index:
+        index.extend(4)
+    if index and len(index.starts):
+        stack = Stack().push_segment(LazyFileSegment(index))
+        report = 'Numbers are read from the file as they are used.\n'
+    else:
+        report = 'No numbers found. Stack unmodified.\n'
+
+    # Provide a report to the user
+    window.addstr('\n' + '='*24 + ' REPORT ' + '='*23 + '\n')
+    window.addstr('    Size of file:' + str(os.path.getsize(data_file)) + ' bytes\n')
+    window.addstr(report)
+    window.addstr('='*55 + '\n\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+
+    return stack
+
+
+def get_many_files_data(stack, data_files, options, window):
+    """
+    Import several files at once, given a pattern (e.g., "shards/*.txt") or a list of file names separated by commas. Called by get_file_data(). The files are read in parallel, by a pool of processes, and put on the stack in order -- the order of the list, or name order for a pattern -- with the first file on top. Each file is imported according to its own format (see import_format()), with the same {options}, and is reported separately.
+    """
+    file_names = []
+    for name in data_files.split(','):
+        name = name.strip()
+        if glob.has_magic(name):
+            file_names += sorted(glob.glob(name))
+        elif name:
+            file_names.append(name)
+
+    if not file_names:
+        show_error(window, 'No files found. Stack unmodified.\n', 55)
+        return stack
+
+    reports = import_files(file_names, options, window)
+
+    # The first file goes on the stack last, so it ends up on top. Likewise, the first column of a table goes on top of the file's other columns.
+    if any(report['numbers'] for report in reports):
+        stack = Stack()
+        for report in reversed(reports):
+            for block in reversed(report['blocks']):
+                stack.push_segment(block.segment() if isinstance(block, ArrayBuilder) else block)
+
+    # Provide a report to the user: a line for each file, then the totals.
+    window.addstr('\n' + '='*24 + ' REPORT ' + '='*23 + '\n')
+    for file_name, report in zip(file_names, reports):
+        name = os.path.basename(file_name)
+        name = name if len(name) <= 24 else '...' + name[-21:]
+        if report.get('error'):
+            window.addstr('{:>24}: {}\n'.format(name, report['error']))
+            continue
+        if report['unit']:
+            window.addstr('{:>24}: {:,} of {:,} {}\n'.format(name, report['numbers'], report['lines'], report['unit']))
+        else:
+            window.addstr('{:>24}: {:,} numbers\n'.format(name, report['numbers']))
+        if report['bad']:
+            listed = ', '.join(str(n) for n in report['bad_lines']) + (', ...' if report['bad'] > len(report['bad_lines']) else '')
+            window.addstr(textwrap.fill('Not numbers (' + str(report['bad']) + '): ' + listed, 55, initial_indent=' '*4, subsequent_indent=' '*4) + '\n')
+    if len(reports) < len(file_names):
+        window.addstr(textwrap.fill('Import stopped with CTRL-C; ' + str(len(file_names) - len(reports)) + ' file(s) were not imported.', 55) + '\n')
+    window.addstr('      Files read:' + str(len(reports)) + ' of ' + str(len(file_names)) + '\n')
+    window.addstr('  Lines in files:' + str(sum(report['lines'] for report in reports)) + '\n')
+    window.addstr('Numbers imported:' + str(sum(report['numbers'] for report in reports)) + '\n')
+    window.addstr('='*55 + '\n\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+
+    return stack
+
+
+def import_files(file_names, options, window):
+    """
+    Import each file in [file_names], showing progress as each file finishes. Text files and tables are read in a pool of processes, one file per process at a time (see import_worker_file()). Binary files are mapped by this process, since that is instant (see map_binary_file()). Pressing CTRL-C stops the import; files that are already read are kept.
+
+    Returns:
+        [list] of {report}s, in the same order as [file_names], for the files that were read. Each has 'blocks' ([list] of ArrayBuilders or segments, top first), 'numbers' (how many numbers in all), 'lines' and 'unit' ('lines' or 'rows'; None for a binary file), 'bad', and 'bad_lines'; a file that couldn't be read has no blocks and an 'error'
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    reports = []
+    if not file_names:
+        return reports
+    show_progress = not isinstance(window, BatchWindow)
+    if show_progress:
+        row, col = get_current_yx(window)
+
+    jobs = [(file_name, options) for file_name in file_names if import_format(file_name, options) not in binary_formats.values()]
+    executor = ProcessPoolExecutor(max(1, min(len(jobs), os.cpu_count() or 1)), initializer=init_import_worker)
+    try:
+        # map() returns the reports in the order of the files, whichever process finishes first.
+        read = executor.map(import_worker_file, jobs)
+        for file_name in file_names:
+            file_format = import_format(file_name, options)
+            report = next(read) if file_format not in binary_formats.values() else import_binary_file(file_name, file_format)
+            reports.append(report)
+            if show_progress:
+                window.move(row, 0)
+                window.clrtoeol()
+                window.addstr('Importing: ' + str(len(reports)) + ' of ' + str(len(file_names)) + ' files, ' + '{:,}'.format(sum(report['numbers'] for report in reports)) + ' numbers  (CTRL-C to stop)')
+                window.refresh()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    if show_progress:
+        window.move(row, 0)
+        window.clrtoeol()
+
+    return reports
+
+
+def init_import_worker():
+    """
+    Set up a process for import_files(). CTRL-C is left to the main process, which stops handing out files; a file that is being read is finished.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def import_worker_file(job):
+    """
+    Read one file for import_files(), in a worker process: a column of numbers from a text file, or the columns chosen in {options} from a table. Nothing is shown on the screen; problems are returned in the report.
+    """
+    data_file, options = job
+    try:
+        if import_format(data_file, options) == 'table':
+            columns, table = read_table_file(data_file, options, BatchWindow())
+            bad_lines = sorted(set(itertools.chain.from_iterable(column['bad_lines'] for column in table['columns'])))
+            return {'blocks': [column['values'] for column in table['columns']], 'numbers': sum(len(column['values']) for column in table['columns']), 'lines': table['rows'], 'unit': 'rows', 'bad': sum(column['bad'] for column in table['columns']), 'bad_lines': bad_lines[:10]}
+        report = read_number_file(data_file, BatchWindow())
+        return {'blocks': [report['values']], 'numbers': len(report['values']), 'lines': report['lines'], 'unit': 'lines', 'bad': report['bad'], 'bad_lines': report['bad_lines']}
+    except (FileNotFoundError, IsADirectoryError):
+        error = 'file not found'
+    except KeyError as missing:
+        error = 'column ' + str(missing) + ' not found'
+    except (OSError, EOFError, ValueError, UnicodeDecodeError, csv.Error, lzma.LZMAError):
+        error = 'could not read the file'
+    return {'blocks': [], 'numbers': 0, 'lines': 0, 'unit': 'lines', 'bad': 0, 'bad_lines': [], 'error': error}
+
+
+def import_binary_file(data_file, file_format):
+    """
+    Map one binary file for import_files(). Problems are returned in the report, as import_worker_file() does.
+    """
+    try:
+        segment = map_binary_file(data_file, file_format)
+        return {'blocks': [segment], 'numbers': len(segment), 'lines': 0, 'unit': None, 'bad': 0, 'bad_lines': []}
+    except (FileNotFoundError, IsADirectoryError):
+        error = 'file not found'
+    except (OSError, ValueError, EOFError, lzma.LZMAError):
+        error = 'could not read the file'
+    return {'blocks': [], 'numbers': 0, 'lines': 0, 'unit': None, 'bad': 0, 'bad_lines': [], 'error': error}
+
+
+# In follow mode, the screen is redrawn at most this often (in seconds), however fast numbers arrive, and the file is checked for new lines this often when nothing has arrived.
+follow_refresh_interval = 0.25
+follow_poll_interval = 0.1
+
+
+def get_follow_data(stack, data_file, settings, window):
+    """
+    Follow a file that is still being written, like "tail -f": starting at the current end of the file, each new line that holds a number is pushed onto the stack as it arrives. Called by get_file_data() for "import [file] follow".
+
+    Statistics for the numbers that arrive are kept in a RunningStats, so they are updated without going back over the stack. If the file is truncated or replaced (e.g., a rotated log), following starts again at the top of the new file. Pressing CTRL-C stops following.
+
+    Following only stops when someone presses CTRL-C, so there must be a terminal: in batch mode, or when a journal is replayed, the file is not followed. The numbers that arrived can't be replayed, either, so a journal saves the whole session after following instead of journaling the line (see RecordingWindow).
+    """
+    if isinstance(window, BatchWindow):
+        show_error(window, 'Cannot follow a file without a terminal.\nStack unmodified.\n', 55, prompt=None)
+        return stack
+    if isinstance(window, RecordingWindow):
+        window.replayable = False
+
+    try:
+        file = open(data_file, 'r')
+    except (FileNotFoundError, IsADirectoryError):
+        show_error(window, 'File not found. Stack unmodified.\n', 55)
+        return stack
+
+    running, bad, leftover = RunningStats(), 0, ''
+    file.seek(0, os.SEEK_END)
+    drawn = 0
+    try:
+        while True:
+            chunk = file.read(import_chunk_size)
+            if chunk:
+                lines = (leftover + chunk).split('\n')
+                # The last line may not have been completely written yet.
+                leftover = lines.pop()
+                for number in follow_numbers(lines):
+                    if number is None:
+                        bad += 1
+                        continue
+                    stack.push(number)
+                    running.add(number)
+            else:
+                # Start again if the file has been cut short or replaced by a new one.
+                try:
+                    replaced = os.stat(data_file).st_ino != os.fstat(file.fileno()).st_ino
+                    if replaced or os.path.getsize(data_file) < file.tell():
+                        file.close()
+                        file, leftover = open(data_file, 'r'), ''
+                except FileNotFoundError:
+                    pass
+                time.sleep(follow_poll_interval)
+
+            if time.time() - drawn >= follow_refresh_interval:
+                show_following(stack, data_file, running, bad, settings, window)
+                drawn = time.time()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        file.close()
+
+    show_following(stack, data_file, running, bad, settings, window)
+    window.addstr('Stopped following ' + os.path.basename(data_file) + '.\n\n')
+    window.refresh()
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+
+    return stack
+
+
+def follow_numbers(lines):
+    """
+    Convert the [lines] that arrive in follow mode to Decimals, all at once if possible. Blank lines are skipped; a line that isn't a number gives None.
+    """
+    try:
+        return list(map(Decimal, lines))
+    except InvalidOperation:
+        pass
+    numbers = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            numbers.append(Decimal(line))
+        except InvalidOperation:
+            numbers.append(None)
+    return numbers
+
+
+def show_following(stack, data_file, running, bad, settings, window):
+    """
+    Draw the screen for follow mode: the register, then the statistics for the numbers that have arrived, formatted according to {settings}.
+    """
+    stack.spill(int(settings.get('memory_limit', '256')) * 1024 * 1024)
+    print_register(stack, settings, window)
+    window.addstr('\nFollowing: ' + os.path.basename(data_file) + '  (CTRL-C to stop)\n')
+    print_running_stats(running, settings, window)
+    if bad:
+        window.addstr('Lines that are not numbers: ' + str(bad) + '\n')
+    window.refresh()
+
+
+def read_number_file(data_file, window):
+    """
+    Open a text file (which may be compressed) and read its column of numbers with read_numbers().
+    """
+    with open_data_file(data_file) as file:
+        # Progress can only be shown as a percentage if the size of the uncompressed text is known.
+        size = 0 if compression(data_file) else os.fstat(file.fileno()).st_size
+        return read_numbers(file, window, size)
+
+
+# Compressed files are recognized by their first few bytes, whatever they are named, and read with the module that decompresses them. The extension is only used to find the format of the file inside (see file_extension()).
+compressed_formats = [(b'\x1f\x8b', '.gz', gzip), (b'BZh', '.bz2', bz2), (b'\xfd7zXZ\x00', '.xz', lzma)]
+
+
+def compression(data_file):
+    """
+    Find out whether a file is compressed with gzip, bzip2, or xz. Return the module (gzip, bz2, or lzma) that reads the file, or None if the file isn't compressed (or can't be read).
+    """
+    try:
+        with open(data_file, 'rb') as file:
+            magic = file.read(6)
+    except OSError:
+        return None
+    for signature, extension, module in compressed_formats:
+        if magic.startswith(signature):
+            return module
+    return None
+
+
+def open_data_file(data_file, newline=None):
+    """
+    Open a file to import as text. A compressed file is decompressed as it is read, so it never has to be decompressed to disk.
+    """
+    module = compression(data_file)
+    if module:
+        return module.open(data_file, 'rt', newline=newline)
+    return open(data_file, 'r', newline=newline)
+
+
+def file_extension(data_file):
+    """
+    The extension of a file name, in lower case, ignoring the extension of a compressed file: "sales.csv.gz" is a ".csv" file.
+    """
+    name = data_file.lower()
+    for signature, extension, module in compressed_formats:
+        if name.endswith(extension):
+            name = name[:-len(extension)]
+    return os.path.splitext(name)[1]
+
+
+# Files are read this many characters at a time (see read_numbers()).
+import_chunk_size = 1024 * 1024
+
+
+def read_numbers(file, window, size=0):
+    """
+    Read a column of numbers from the open text file "file" into an ArrayBuilder, a large chunk at a time. Each chunk is converted in bulk where possible. Blank lines are skipped; other lines that aren't numbers are counted, so they can be listed once, in the report, when the import is done.
+
+    Unless "window" is a BatchWindow, a progress counter is shown (as a percentage of "size", the size of the file in bytes, if it is known). Pressing CTRL-C stops the import, keeping the numbers read so far.
+
+    Returns:
+        {report}: 'values' (ArrayBuilder), 'lines' (lines read), 'bad' (lines that aren't numbers), 'bad_lines' (line numbers of the first few), and 'cancelled' (True if CTRL-C was pressed)
+    """
+    report = {'values': ArrayBuilder(), 'lines': 0, 'bad': 0, 'bad_lines': [], 'cancelled': False}
+    show_progress = not isinstance(window, BatchWindow)
+    if show_progress:
+        row, col = get_current_yx(window)
+
+    leftover, done = '', 0
+    try:
+        while True:
+            chunk = file.read(import_chunk_size)
+            if not chunk:
+                break
+            done += len(chunk)
+            lines = (leftover + chunk).split('\n')
+            # The last line may continue in the next chunk.
+            leftover = lines.pop()
+            parse_lines(lines, report)
+
+            if show_progress:
+                window.move(row, 0)
+                window.clrtoeol()
+                window.addstr('Importing: ' + '{:,}'.format(len(report['values'])) + ' numbers' + (' ({:.0%})'.format(min(done / size, 1)) if size else '') + '  (CTRL-C to stop)')
+                window.refresh()
+        if leftover:
+            parse_lines([leftover], report)
+    except KeyboardInterrupt:
+        report['cancelled'] = True
+
+    if show_progress:
+        window.move(row, 0)
+        window.clrtoeol()
+
+    return report
+
+
+def parse_lines(lines, report, line_numbers=None, blank_is_bad=False):
+    """
+    Convert a list of lines to numbers, adding them to report['values'] (see read_numbers()). A list made only of numbers is converted in one step (fastest if they are whole numbers); otherwise, the lines are converted one at a time.
+
+    Lines that aren't numbers are reported by line number: from [line_numbers], if given, or by counting from report['lines']. Blank lines are skipped, and only reported if "blank_is_bad" is True (e.g., an empty field in a table).
+    """
+    values, first_line = report['values'], report['lines'] + 1
+    report['lines'] += len(lines)
+    if line_numbers is None:
+        line_numbers = range(first_line, first_line + len(lines))
+
+    if values.scale == 0 and values.values.typecode == 'q':
+        try:
+            values.values.extend(array('q', map(int, lines)))
+            return
+        except (ValueError, OverflowError):
+            pass
+
+    # Any other list that is all numbers is converted in one step, too.
+    try:
+        numbers = list(map(Decimal, lines))
+    except InvalidOperation:
+        numbers = None
+    if numbers is not None:
+        values.extend(numbers, decimal_places(lines))
+        return
+
+    for ndx, line in enumerate(lines):
+        if not line.strip() and not blank_is_bad:
+            continue
+        try:
+            values.append(Decimal(line))
+        except InvalidOperation:
+            report['bad'] += 1
+            if len(report['bad_lines']) < 10:
+                report['bad_lines'].append(line_numbers[ndx])
+
+
+def decimal_places(lines):
+    """
+    The most decimal places in a list of numbers, as text, found without converting them: the most digits after a ".". Return None if that can't be trusted, because a number is written with an exponent (or is NaN or Infinity).
+    """
+    text = ''.join(lines)
+    if any(letter in text for letter in 'eEnNiI'):
+        return None
+    return max(map(len, map(operator.itemgetter(2), map(operator.methodcaller('partition', '.'), lines))), default=0)
+
+
+def import_report(window, report, lines_label='   Lines in file:'):
+    """
+    Show the report at the end of an import: how many lines were read and how many numbers were imported, which lines weren't numbers, and whether the import was stopped early.
+    """
+    window.addstr('\n' + '='*24 + ' REPORT ' + '='*23 + '\n')
+    window.addstr(lines_label + str(report['lines']) + '\n')
+    window.addstr('Numbers imported:' + str(len(report['values'])) + '\n')
+    if report['bad']:
+        listed = ', '.join(str(n) for n in report['bad_lines']) + (', ...' if report['bad'] > len(report['bad_lines']) else '')
+        window.addstr(textwrap.fill('Lines that are not numbers (' + str(report['bad']) + '): ' + listed, 55) + '\n')
+    if report['cancelled']:
+        window.addstr('Import stopped with CTRL-C; the numbers read so far\nwere kept.\n')
+    window.addstr('='*55 + '\n\n')
+    window.refresh()
+
+
+# File name extensions that import as binary arrays (see get_binary_data()), and the format each one means.
+binary_formats = {'.f64': 'f64', '.i64': 'i64', '.npy': 'npy'}
+
+# The NumPy types that can be read from a .npy file (little-endian only), and the matching array typecode.
+npy_types = {'<f8': 'd', '<f4': 'f', '<i8': 'q', '<i4': 'i', '<i2': 'h', '|i1': 'b', '<u8': 'Q', '<u4': 'I', '<u2': 'H', '|u1': 'B'}
+
+
+def get_binary_data(stack, data_file, file_format, window):
+    """
+    Import a binary file of numbers: raw little-endian 64-bit floats ("f64") or integers ("i64"), or a NumPy .npy file ("npy"). Called by get_file_data().
+
+    Nothing is parsed: the file is memory-mapped and becomes a MappedSegment of the stack, so even a file of hundreds of millions of numbers is imported instantly. The operating system reads the parts of the file that are used. The first number in the file becomes x:. The file must not change while it is on the stack. A compressed file (e.g., "samples.f64.gz") can't be mapped, so it is decompressed into memory instead.
+    """
+    try:
+        segment = map_binary_file(data_file, file_format)
+    except (OSError, ValueError, EOFError, lzma.LZMAError) as error:
+        if isinstance(error, (FileNotFoundError, IsADirectoryError)):
+            show_error(window, 'File not found. Stack unmodified.\n', 55)
+        else:
+            show_error(window, textwrap.fill('Could not read the file: ' + str(error), 55) + '\nStack unmodified.\n', 55)
+        return stack
+
+    count = len(segment)
+    if count:
+        stack = Stack().push_segment(segment)
+
+    # Provide a report to the user
+    window.addstr('\n' + '='*24 + ' REPORT ' + '='*23 + '\n')
+    window.addstr('    Size of file:' + str(os.path.getsize(data_file)) + ' bytes\n')
+    window.addstr('Numbers imported:' + str(count) + '\n')
+    window.addstr('='*55 + '\n\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+
+    return stack
+
+
+def map_binary_file(data_file, file_format):
+    """
+    Memory-map a binary file of numbers (see get_binary_data()) and return it as a MappedSegment. Raise ValueError if the file isn't in the expected format.
+    """
+    module = compression(data_file)
+    if module:
+        return read_compressed_binary_file(data_file, file_format, module)
+
+    file = open(data_file, 'rb')
+    size = os.fstat(file.fileno()).st_size
+    try:
+        if file_format == 'npy':
+            typecode, offset, count = npy_header(file)
+        else:
+            typecode, offset = ('d' if file_format == 'f64' else 'q'), 0
+            if size % 8:
+                raise ValueError('the size of the file is not a multiple of 8 bytes')
+            count = size // 8
+        if offset + count * array(typecode).itemsize > size:
+            raise ValueError('the file is shorter than its header says')
+    except (ValueError, KeyError, SyntaxError) as error:
+        file.close()
+        # A damaged .npy header can't be read as a dict (SyntaxError) or is missing an entry (KeyError).
+        raise ValueError(str(error) if isinstance(error, ValueError) else 'not a valid .npy file')
+
+    if not count:
+        file.close()
+        return MappedSegment(array(typecode))
+
+    # Numbers in the file are little-endian. On a big-endian computer, they have to be read in and byte-swapped instead.
+    if sys.byteorder != 'little':
+        file.seek(offset)
+        values = array(typecode)
+        values.fromfile(file, count)
+        values.byteswap()
+        file.close()
+        return ArraySegment(values)
+
+    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    values = memoryview(mapped)[offset:offset + count * array(typecode).itemsize].cast(typecode)
+    return MappedSegment(values, 0, 0, file, mapped)
+
+
+def read_compressed_binary_file(data_file, file_format, module):
+    """
+    Read a compressed binary file of numbers (e.g., "samples.f64.gz") for map_binary_file(). A compressed file can't be memory-mapped, so it is decompressed into an ArraySegment instead; the numbers are still not parsed one by one.
+    """
+    with module.open(data_file, 'rb') as file:
+        try:
+            if file_format == 'npy':
+                typecode, offset, count = npy_header(file)
+                data = file.read(count * array(typecode).itemsize)
+                if len(data) < count * array(typecode).itemsize:
+                    raise ValueError('the file is shorter than its header says')
+            else:
+                typecode, data = ('d' if file_format == 'f64' else 'q'), file.read()
+                if len(data) % 8:
+                    raise ValueError('the size of the file is not a multiple of 8 bytes')
+        except (KeyError, SyntaxError):
+            raise ValueError('not a valid .npy file')
+
+    values = array(typecode)
+    values.frombytes(data)
+    # Numbers in the file are little-endian.
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return ArraySegment(values)
+
+
+def npy_header(file):
+    """
+    Read the header of a NumPy .npy file, which says what kind of numbers the file holds and how many.
+
+    Returns:
+        typecode (str) of the numbers, offset (int) of the first number in the file, and count (int) of numbers
+    """
+    magic = file.read(8)
+    if magic[:6] != b'\x93NUMPY':
+        raise ValueError('not a NumPy .npy file')
+    # Version 1 files give the length of the header in 2 bytes; later versions use 4.
+    length_size = 2 if magic[6] == 1 else 4
+    length = int.from_bytes(file.read(length_size), 'little')
+    import ast
+    header = ast.literal_eval(file.read(length).decode('latin-1'))
+    if header['descr'] not in npy_types:
+        raise ValueError('NumPy type ' + repr(header['descr']) + ' is not supported')
+    if header['fortran_order'] and len(header['shape']) > 1:
+        raise ValueError('the array is in Fortran order')
+    return npy_types[header['descr']], 8 + length_size + length, math.prod(header['shape'])
+
+
+# File name extensions that import as tables (see get_table_data()), and the format each one means.
+table_formats = {'.csv': 'csv', '.tsv': 'tsv', '.tab': 'tsv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+# Tables are converted this many rows at a time.
+table_chunk_rows = 100000
+
+
+def get_table_data(stack, data_file, options, window):
+    """
+    Import one or more columns from a CSV, TSV, or JSON-lines file. Called by get_file_data() when the file name ends in .csv, .tsv, .tab, .jsonl, or .ndjson, or when a "format=" or "cols=" option is given.
+
+    Options:
+        cols=a,b,...  -- the columns to import, by name (from the first row of a CSV/TSV file, or the keys of a JSON object) or by number, counting from 1; the default is the first column
+        format=...    -- csv, tsv, or jsonl, if the file name doesn't say
+        sep=...       -- the delimiter for a CSV file, if it isn't ","
+        rows          -- interleave the columns, row by row, instead of putting each column on the stack separately
+
+    "lazy" can't be used with a table (the columns have to be found in every row), so it is ignored, and the report says so.
+
+    Without "rows", each column goes on the stack as a segment of its own, with the first column on top: x: is the first value in the first column. With "rows", x: is the first column of the first row, y: is the second column of the first row, and so on; a row is skipped if any of its columns isn't a number.
+    """
+    interleave = 'rows' in options
+    try:
+        columns, report = read_table_file(data_file, options, window)
+
+    except (OSError, EOFError, KeyError, ValueError, csv.Error, lzma.LZMAError) as error:
+        if isinstance(error, (FileNotFoundError, IsADirectoryError)):
+            show_error(window, 'File not found. Stack unmodified.\n', 55)
+        elif isinstance(error, KeyError):
+            show_error(window, 'Column ' + str(error) + ' not found. Stack unmodified.\n', 55)
+        else:
+            show_error(window, textwrap.fill('Could not read the file: ' + str(error), 55) + '\nStack unmodified.\n', 55)
+        return stack
+
+    # The first column goes on the stack last, so it ends up on top.
+    if any(len(column['values']) for column in report['columns']):
+        stack = Stack()
+        for column in reversed(report['columns']):
+            stack.push_segment(column['values'].segment())
+
+    # Provide a report to the user
+    window.addstr('\n' + '='*24 + ' REPORT ' + '='*23 + '\n')
+    window.addstr('    Rows in file:' + str(report['rows']) + '\n')
+    for name, column in zip(columns, report['columns']):
+        if not interleave:
+            window.addstr(('{:>16}'.format(name[:16])) + ':' + str(len(column['values'])) + ' numbers\n')
+        if column['bad']:
+            listed = ', '.join(str(n) for n in column['bad_lines']) + (', ...' if column['bad'] > len(column['bad_lines']) else '')
+            window.addstr(textwrap.fill(('Rows skipped' if interleave else 'Not numbers') + ' (' + str(column['bad']) + '): ' + listed, 55, initial_indent=' '*4, subsequent_indent=' '*4) + '\n')
+    if interleave:
+        window.addstr('Numbers imported:' + str(len(report['columns'][0]['values'])) + '\n')
+    if report['cancelled']:
+        window.addstr('Import stopped with CTRL-C; the rows read so far\nwere kept.\n')
+    if 'lazy' in options:
+        window.addstr('A table can\'t be imported lazily; the whole file was\nread.\n')
+    window.addstr('='*55 + '\n\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+
+    return stack
+
+
+def read_table_file(data_file, options, window):
+    """
+    Read the columns chosen in {options} (see get_table_data()) from a CSV, TSV, or JSON-lines file with read_table(). Raise KeyError if a column isn't in the file.
+
+    Returns:
+        [list] of the column names or numbers, as given in "cols=", and the {report} from read_table()
+    """
+    file_format = options.get('format') or table_formats.get(file_extension(data_file), 'csv')
+    columns = [column.strip() for column in str(options.get('cols', '1')).split(',') if column.strip()]
+
+    with open_data_file(data_file, newline='') as file:
+        if file_format == 'jsonl':
+            chunks = jsonl_chunks(file, columns)
+        else:
+            delimiter = '\t' if file_format == 'tsv' else options.get('sep') or ','
+            chunks = csv_chunks(file, columns, delimiter)
+        return columns, read_table(chunks, len(columns), 'rows' in options, window)
+
+
+def column_index(column, names):
+    """
+    Find a column by name in [names] or by number (counting from 1). Raise KeyError if there's no such column.
+    """
+    if column in names:
+        return names.index(column)
+    if column.isdigit() and int(column) >= 1:
+        return int(column) - 1
+    raise KeyError(column)
+
+
+def csv_chunks(file, columns, delimiter):
+    """
+    Read a CSV or TSV file with the csv module, table_chunk_rows rows at a time. For each chunk, yield (the row number of its first row, [the fields of each selected column]). If any column is chosen by name, the first row is the header; otherwise, a first row whose fields aren't numbers is taken to be a header and skipped.
+    """
+    reader = csv.reader(file, delimiter=delimiter)
+    first = next(reader, None)
+    if first is None:
+        return
+    named = not all(column.isdigit() for column in columns)
+    positions = [column_index(column, first if named else []) for column in columns]
+
+    rows, row_number = [], 2
+    if not named:
+        try:
+            [Decimal(first[ndx]) for ndx in positions]
+            rows, row_number = [first], 1
+        except (InvalidOperation, IndexError):
+            pass
+
+    while True:
+        rows += itertools.islice(reader, table_chunk_rows)
+        if not rows:
+            return
+        yield row_number, [column_fields(rows, ndx) for ndx in positions]
+        row_number += len(rows)
+        rows = []
+
+
+def column_fields(rows, ndx):
+    """
+    Get one column from a list of rows, in one step. Rows too short to have the column give a blank field.
+    """
+    try:
+        return list(map(operator.itemgetter(ndx), rows))
+    except IndexError:
+        return [row[ndx] if ndx < len(row) else '' for row in rows]
+
+
+def jsonl_chunks(file, columns):
+    """
+    Read a JSON-lines file, table_chunk_rows lines at a time, yielding chunks like csv_chunks(). A line may be a JSON object (columns chosen by key) or a list (columns chosen by number, counting from 1). Numbers are read exactly, as Decimals.
+    """
+    row_number = 1
+    while True:
+        lines = list(itertools.islice(file, table_chunk_rows))
+        if not lines:
+            return
+        fields = [[] for column in columns]
+        for line in lines:
+            try:
+                record = json.loads(line, parse_float=Decimal)
+            except ValueError:
+                record = None
+            for ndx, column in enumerate(columns):
+                if isinstance(record, dict):
+                    value = record.get(column, '')
+                elif isinstance(record, list) and column.isdigit() and 1 <= int(column) <= len(record):
+                    value = record[int(column) - 1]
+                else:
+                    value = ''
+                # true/false, null, and nested values aren't numbers.
+                fields[ndx].append('' if isinstance(value, (bool, dict, list)) or value is None else str(value))
+        yield row_number, fields
+        row_number += len(lines)
+
+
+def read_table(chunks, width, interleave, window):
+    """
+    Convert the chunks from csv_chunks() or jsonl_chunks() into numbers, showing progress. Pressing CTRL-C stops the import, keeping the rows read so far.
+
+    Returns:
+        {report}: 'columns' ([list] of {report}s like those from read_numbers(), one per column; with interleaving, a single one holding all the values), 'rows', and 'cancelled'
+    """
+    columns = [{'values': ArrayBuilder(), 'lines': 0, 'bad': 0, 'bad_lines': [], 'cancelled': False} for ndx in range(1 if interleave else width)]
+    report = {'columns': columns, 'rows': 0, 'cancelled': False}
+    show_progress = not isinstance(window, BatchWindow)
+    if show_progress:
+        row, col = get_current_yx(window)
+
+    try:
+        for first_row, fields in chunks:
+            line_numbers = range(first_row, first_row + len(fields[0]))
+            report['rows'] = line_numbers[-1]
+            if interleave:
+                interleave_rows(line_numbers, fields, columns[0])
+            else:
+                for column, column_fields in zip(columns, fields):
+                    parse_lines(column_fields, column, line_numbers, blank_is_bad=True)
+
+            if show_progress:
+                window.move(row, 0)
+                window.clrtoeol()
+                window.addstr('Importing: ' + '{:,}'.format(report['rows']) + ' rows  (CTRL-C to stop)')
+                window.refresh()
+    except KeyboardInterrupt:
+        report['cancelled'] = True
+
+    if show_progress:
+        window.move(row, 0)
+        window.clrtoeol()
+
+    return report
+
+
+def interleave_rows(line_numbers, fields, column):
+    """
+    Add the [fields] of each column to column['values'], one row after another. A row is skipped (and counted in column['bad']) unless every field is a number.
+    """
+    try:
+        numbers = [list(map(Decimal, column_fields)) for column_fields in fields]
+        places = [decimal_places(column_fields) for column_fields in fields]
+        column['values'].extend([number for row in zip(*numbers) for number in row], None if None in places else max(places))
+        return
+    except InvalidOperation:
+        pass
+
+    for line_number, fields in zip(line_numbers, zip(*fields)):
+        try:
+            numbers = [Decimal(field) for field in fields]
+            if not all(field.strip() for field in fields):
+                raise InvalidOperation
+        except InvalidOperation:
+            column['bad'] += 1
+            if len(column['bad_lines']) < 10:
+                column['bad_lines'].append(line_number)
+            continue
+        for number in numbers:
+            column['values'].append(number)
+
+
+def split_file_options(text, keywords):
+    """
+    Split what the user typed at a "File name:" prompt into the file name and the options that follow it. An option is either one of the "keywords" (e.g., "lazy") or a name=value pair. File names may contain spaces.
+
+    Returns:
+        file name (str) and {options}; keywords map to True, name=value pairs map to the value
+    """
+    text, options = text.strip(), {}
+    while ' ' in text:
+        head, word = text.rsplit(' ', 1)
+        if word.lower() not in keywords and '=' not in word:
+            break
+        name, equals, value = word.partition('=')
+        options[name.lower()] = value if equals else True
+        text = head.rstrip()
+    return text, options
+
+
+# ==== EXPORT FILE FUNCTIONS =============================
+
+# Exported numbers are formatted and written this many at a time.
+export_chunk_size = 65536
+
+
+def export_stack(stack, settings, window):  # command: export
+    """Export the stack to a text file, one number to a
+line, with x: on the first line. The numbers are
+written the way the register shows them, using the
+decimal places, separator, and notation in "set".
+
+The file can be imported again with "import". (If the
+separator is ",", turn it off first, or the numbers
+won't import.) As with "stats", zeros at the bottom of
+the stack are left out.
+
+Options can be typed after the file name. "count"
+exports only that many numbers, from x: down, and
+"skip" leaves out that many numbers at the top. For
+example:
+
+    data.txt
+    top100.txt count=100
+    rest.txt skip=100
+
+A file name ending in .csv is written as a CSV file,
+with a "value" header.
+
+A large stack is written in chunks, showing how much
+has been exported. Press CTRL-C to stop; the numbers
+written so far are kept in the file."""
+
+    data_file = get_user_input(window, None, None, '\nFile name: ')
+    data_file, options = split_file_options(data_file, [])
+    if not data_file:
+        return stack
+
+    try:
+        skip, count = int(options.get('skip', 0)), options.get('count')
+        count = None if count is None else int(count)
+        if skip < 0 or (count is not None and count < 0):
+            raise ValueError
+    except ValueError:
+        show_error(window, '"skip" and "count" must be whole numbers.\nNothing exported.\n', 55)
+        return stack
+
+    # Leave out the zeros at the bottom of the stack, as "stats" does.
+    end = len(stack)
+    while end > 1 and stack[end - 1] == 0:
+        end -= 1
+    end = end if count is None else min(end, skip + count)
+
+    try:
+        with open(data_file, 'w', newline='') as file:
+            report = write_numbers(file, itertools.islice(stack, skip, end), max(end - skip, 0), data_file.lower().endswith('.csv'), settings, window)
+    except OSError as error:
+        show_error(window, textwrap.fill('Could not write the file: ' + str(error), 55) + '\nNothing exported.\n', 55)
+        return stack
+
+    # Provide a report to the user
+    window.addstr('\n' + '='*24 + ' REPORT ' + '='*23 + '\n')
+    window.addstr('       File name:' + data_file + '\n')
+    window.addstr('Numbers exported:' + str(report['written']) + '\n')
+    if report['cancelled']:
+        window.addstr('Export stopped with CTRL-C; the numbers written so\nfar were kept.\n')
+    window.addstr('='*55 + '\n\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+
+    return stack
+
+
+def write_numbers(file, values, total, as_csv, settings, window):
+    """
+    Write numbers from the iterable "values" (e.g., a slice of the stack) to an open text file, formatted with format_number() according to {settings}, export_chunk_size numbers at a time, so the whole stack is never held in memory as text. "total" is used only to show progress. With "as_csv", the file is a one-column CSV file, and numbers that contain the separator are quoted.
+
+    Unless "window" is a BatchWindow, progress is shown. Pressing CTRL-C stops the export; the numbers written so far are kept.
+
+    Returns:
+        {report}: 'written' (how many numbers were written) and 'cancelled' (True if CTRL-C was pressed)
+    """
+    report = {'written': 0, 'cancelled': False}
+    show_progress = not isinstance(window, BatchWindow)
+    if show_progress:
+        row, col = get_current_yx(window)
+
+    if as_csv:
+        writer = csv.writer(file)
+        writer.writerow(['value'])
+    values, formatter = iter(values), number_formatter(settings)
+    try:
+        while True:
+            chunk = list(map(formatter, itertools.islice(values, export_chunk_size)))
+            if not chunk:
+                break
+            if as_csv:
+                writer.writerows(zip(chunk))
+            else:
+                file.write('\n'.join(chunk) + '\n')
+            report['written'] += len(chunk)
+
+            if show_progress:
+                window.move(row, 0)
+                window.clrtoeol()
+                window.addstr('Exporting: ' + '{:,}'.format(report['written']) + ' numbers' + (' ({:.0%})'.format(report['written'] / total) if total else '') + '  (CTRL-C to stop)')
+                window.refresh()
+    except KeyboardInterrupt:
+        report['cancelled'] = True
+
+    if show_progress:
+        window.move(row, 0)
+        window.clrtoeol()
+
+    return report
+
+
+# ==== SESSION FILES =============================
+
+# The session is saved here when ada quits, and loaded again when it starts (see "set").
+session_file = 'session.ada'
+
+# A session file starts with these 8 bytes and a version number. Version 1 is the only version so far.
+snapshot_magic = b'ADASNAP\x00'
+snapshot_version = 1
+
+# Command lines are journaled here (see Journal). The journal is forced onto the disk at most this often (in seconds), and the session is saved, and the journal emptied, after this many lines or after a line that takes this long (in seconds) to run.
+journal_file = 'session.journal'
+journal_sync_interval = 1.0
+journal_checkpoint_lines = 500
+journal_checkpoint_seconds = 1.0
+
+# A block of the stack with fewer values than this is saved as text, exactly as it is; a larger block is packed into an array, if possible.
+snapshot_text_limit = 1000
+
+
+def save_session(stack, session, window):  # command: save
+    """Save the session to a file: the stack, memory
+registers, tape, and settings. The file is binary and
+compact, so even a stack of millions of numbers is
+saved and loaded quickly.
+
+Press <ENTER> at the "File name:" prompt to use the
+usual session file, session.ada.
+
+Use "load" to pick up the session again. Unless
+autosave is turned off (see "set"), the session is
+saved to session.ada when you quit, and loaded again
+the next time ada starts."""
+
+    data_file = get_user_input(window, None, None, '\nFile name (<ENTER> for ' + session_file + '): ').strip() or session_file
+
+    try:
+        size = write_snapshot(data_file, stack, session)
+    except OSError as error:
+        show_error(window, textwrap.fill('Could not save the session: ' + str(error), 55) + '\n', 55)
+        return stack
+
+    window.addstr('\n' + '='*24 + ' REPORT ' + '='*23 + '\n')
+    window.addstr('   Session saved:' + data_file + '\n')
+    window.addstr('Numbers on stack:' + str(len(stack)) + '\n')
+    window.addstr('    Size of file:' + str(size) + ' bytes\n')
+    window.addstr('='*55 + '\n\n')
+    window.refresh()
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+    return stack
+
+
+def load_session(stack, session, window):  # command: load
+    """Load a session saved with "save" (or when you quit):
+the stack, memory registers, tape, and settings are
+all replaced by the ones in the file.
+
+Press <ENTER> at the "File name:" prompt to use the
+usual session file, session.ada."""
+
+    data_file = get_user_input(window, None, None, '\nFile name (<ENTER> for ' + session_file + '): ').strip() or session_file
+
+    try:
+        snapshot = read_snapshot(data_file)
+    except (OSError, ValueError) as error:
+        if isinstance(error, (FileNotFoundError, IsADirectoryError)):
+            show_error(window, 'File not found. Session unchanged.\n', 55)
+        else:
+            show_error(window, textwrap.fill('Could not load the session: ' + str(error), 55) + '\nSession unchanged.\n', 55)
+        return stack
+
+    # {mem}, {settings}, and [tape] are changed in place, because RPN() holds on to them.
+    session.mem.clear()
+    session.mem.update(snapshot['mem'])
+    session.settings.update(snapshot['settings'])
+    session.tape[:] = snapshot['tape']
+    session.lastx_list = snapshot['lastx']
+    if save_memory:
+        save_memory_registers(session.mem)
+        save_settings(session.settings)
+
+    window.addstr('\n' + '='*24 + ' REPORT ' + '='*23 + '\n')
+    window.addstr('  Session loaded:' + data_file + '\n')
+    window.addstr('Numbers on stack:' + str(len(snapshot['stack'])) + '\n')
+    window.addstr('='*55 + '\n\n')
+    window.refresh()
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+    return snapshot['stack']
+
+
+def write_snapshot(file_name, stack, session, journal_seq=0):
+    """
+    Write the session to a file in one piece. The file is:
+
+        snapshot_magic, the version (4 bytes), and the length of the header (4 bytes)
+        the header: JSON holding the memory registers, tape, settings, and a description of each block of the stack
+        the blocks of the stack that are packed arrays, as raw bytes, each starting on a multiple of 8 bytes
+
+    The file is written under a temporary name and then renamed, so an existing session file is never left half-written. "journal_seq" is the number of the last journal record (see Journal) that the snapshot includes.
+
+    Returns:
+        int, the size of the file in bytes
+    """
+    # The registers and then each segment, from the top of the stack down.
+    blocks, buffers, offset = [], [], 0
+    for block in [list(reversed(stack.data))] + list(reversed(stack.segments)):
+        if isinstance(block, list) or type(block) is ListSegment:
+            packed = pack_decimals(block) if len(block) >= snapshot_text_limit else None
+            if packed is None:
+                blocks.append({'kind': 'text', 'values': [str(value) for value in block]})
+                continue
+            block = packed
+        if isinstance(block, LazyFileSegment):
+            blocks.append({'kind': 'lazy', 'file': os.path.abspath(block.index.file.name), 'start': block.start})
+            continue
+        if isinstance(block, TextSegment):
+            blocks.append({'kind': 'text', 'values': [str(value) for value in block]})
+            continue
+        data = memoryview(block.values)[block.start:]
+        blocks.append({'kind': 'array', 'typecode': block.typecode, 'scale': block.scale, 'count': len(data), 'offset': offset})
+        buffers.append(data)
+        offset += -(-data.nbytes // 8) * 8
+
+    header = json.dumps({
+        'byteorder': sys.byteorder,
+        'blocks': blocks,
+        'mem': [[str(k), str(v)] for k, v in session.mem.items()],
+        'lastx': [str(value) for value in session.lastx_list],
+        'tape': session.tape,
+        'settings': session.settings,
+        'journal_seq': journal_seq,
+    }, ensure_ascii=False).encode('utf-8')
+    header += b' ' * (-(16 + len(header)) % 8)
+
+    temporary = file_name + '.tmp'
+    with open(temporary, 'wb') as file:
+        file.write(struct.pack('<8sII', snapshot_magic, snapshot_version, len(header)))
+        file.write(header)
+        for data in buffers:
+            file.write(data)
+            file.write(b'\x00' * (-data.nbytes % 8))
+        size = file.tell()
+    os.replace(temporary, file_name)
+    return size
+
+
+def read_snapshot(file_name):
+    """
+    Read a session file written by write_snapshot(). The packed blocks of the stack are read straight into arrays, without converting any numbers, so even a very large stack loads in a fraction of a second. Raise ValueError if the file isn't a session file ada can read.
+
+    Returns:
+        {snapshot}: 'stack' (Stack), 'mem' ({dict}), 'lastx' ([list]), 'tape' ([list]), 'settings' ({dict}), and 'journal_seq' (int)
+    """
+    with open(file_name, 'rb') as file:
+        header, base = read_snapshot_header(file)
+
+        segments = []
+        for block in header['blocks']:
+            if block['kind'] == 'text':
+                segment = ListSegment([Decimal(value) for value in block['values']])
+            elif block['kind'] == 'lazy':
+                try:
+                    segment = LazyFileSegment(LineIndex(block['file']), block['start'])
+                except (OSError, ValueError):
+                    raise ValueError('the imported file ' + block['file'] + ' is missing')
+            else:
+                values = array(block['typecode'])
+                file.seek(base + block['offset'])
+                values.frombytes(file.read(block['count'] * values.itemsize))
+                if len(values) != block['count']:
+                    raise ValueError('the file is incomplete')
+                if header['byteorder'] != sys.byteorder:
+                    values.byteswap()
+                segment = ArraySegment(values, block['scale'])
+            segments.append(segment)
+
+    # The blocks were saved top first; the stack keeps its segments bottom first. Filling the registers from the top block is all the converting that loading does.
+    stack = Stack()
+    stack.segments = [segment for segment in reversed(segments) if len(segment)]
+    stack.refill()
+
+    return {
+        'stack': stack,
+        'mem': {Decimal(k): Decimal(v) for k, v in header['mem']},
+        'lastx': [Decimal(value) for value in header['lastx']] or [Decimal('0.0')],
+        'tape': header['tape'],
+        'settings': header['settings'],
+        'journal_seq': header.get('journal_seq', 0),
+    }
+
+
+def read_snapshot_header(file):
+    """
+    Read the header of a session file written by write_snapshot() from an open file. Raise ValueError if the file isn't a session file ada can read.
+
+    Returns:
+        {header}, and the offset in the file where the packed blocks start
+    """
+    try:
+        magic, version, length = struct.unpack('<8sII', file.read(16))
+        if magic != snapshot_magic:
+            raise ValueError
+        header = json.loads(file.read(length).decode('utf-8'))
+    except (struct.error, ValueError, UnicodeDecodeError):
+        raise ValueError('not an ada session file')
+    if version > snapshot_version:
+        raise ValueError('the file was saved by a newer version of ada')
+    return header, 16 + length
+
+
+class RecordingWindow:
+    """
+    Wraps the curses window while a Journal is kept, so that whatever the user types at a prompt during a command line (e.g., the file name for "import") is recorded in [answers], to be journaled with the command line. The seconds spent waiting for those answers are added up in [waited]. A command line that can't be replayed (e.g., "import [file] follow") sets [replayable] to False. Everything else is passed straight through to the curses window.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.answers = []
+        self.waited = 0
+        self.replayable = True
+
+    def __getattr__(self, name):
+        return getattr(self.window, name)
+
+    def getstr(self, *args):
+        started = time.time()
+        answer = self.window.getstr(*args)
+        self.waited += time.time() - started
+        self.answers.append(answer.decode(encoding='utf8'))
+        return answer
+
+
+class Journal:
+    """
+    An append-only log of the command lines run in a session, so the session can be recovered if ada doesn't quit normally (e.g., the terminal is closed). See recover_session().
+
+    Each record is one line of JSON: a sequence number, the command line, the answers typed at any prompts it showed, and the seed the random numbers (see "rand") were drawn from, so that replaying the line gives the same numbers. A record reaches the operating system as soon as it is written, so it survives ada crashing; it is forced onto the disk (fsync) at most once every journal_sync_interval seconds, so journaling doesn't slow ada down.
+
+    Replaying a long journal would be slow, so every so often -- after journal_checkpoint_lines lines, or after a line that took journal_checkpoint_seconds or longer to run (e.g., a large import), not counting time spent waiting at its prompts -- the whole session is saved to session_file instead, and the journal starts over. The session file records the last sequence number it includes, so a record is never replayed twice, even if ada stops between saving the session and emptying the journal.
+    """
+
+    def __init__(self, file_name, stack, session):
+        self.file = open(file_name, 'a', encoding='utf-8')
+        # Carry on numbering from the last record journaled or saved already. If the first checkpoint fails, the old records are kept, and new records must not be mistaken for them.
+        self.seq = max([record['seq'] for record in read_journal(file_name)] + [saved_journal_seq()])
+        self.lines = 0
+        self.synced = time.time()
+        self.checkpoint(stack, session)
+
+    def seed_random(self):
+        """Seed the random number generator afresh before a command line is run, and return the seed, to be journaled with the line."""
+        seed = int.from_bytes(os.urandom(8), 'little')
+        random.seed(seed)
+        return seed
+
+    def record(self, entered_value, answers, elapsed, stack, session, seed=None):
+        """Add a command line to the journal. "elapsed" is how long (in seconds) the line took to run, not counting time spent waiting at prompts, and "seed" is from seed_random()."""
+        self.seq += 1
+        self.lines += 1
+        entry = {'seq': self.seq, 'line': entered_value, 'answers': answers}
+        if seed is not None:
+            entry['seed'] = seed
+        self.file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self.file.flush()
+        if self.lines >= journal_checkpoint_lines or elapsed >= journal_checkpoint_seconds:
+            self.checkpoint(stack, session)
+        elif time.time() - self.synced >= journal_sync_interval:
+            self.sync()
+
+    def sync(self):
+        os.fsync(self.file.fileno())
+        self.synced = time.time()
+
+    def checkpoint(self, stack, session):
+        """Save the whole session to session_file, then empty the journal."""
+        try:
+            write_snapshot(session_file, stack, session, self.seq)
+        except OSError:
+            # Without a new session file, the journal has to be kept.
+            return
+        self.file.seek(0)
+        self.file.truncate()
+        self.sync()
+        self.lines = 0
+
+    def close(self):
+        self.file.close()
+
+
+def recover_session(stack, lastx_list, tape, user_dict, mem, settings):
+    """
+    When ada starts, load the session saved in session_file and replay any command lines that were journaled after it was saved, without a terminal (see Journal). The session is then saved again and the journal emptied.
+
+    Memory registers and settings are saved in their own files in the background, half a second or so after they change (see WriteBehind), so after a crash those files may already include some or all of the journaled lines. To avoid running those lines twice, they are replayed starting from the memory registers and settings in the session file.
+
+    If the session can't be recovered (e.g., an imported file it uses is missing, or a journaled line fails when it is replayed), an exception is raised, and session_file and journal_file are left as they were (see set_aside_session()).
+
+    Returns:
+        stack, lastx_list, tape, and user_dict
+    """
+    if not os.path.exists(session_file):
+        return stack, lastx_list, tape, user_dict
+    snapshot = read_snapshot(session_file)
+    stack, lastx_list, tape, seq = snapshot['stack'], snapshot['lastx'], snapshot['tape'], snapshot['journal_seq']
+
+    records = [record for record in read_journal(journal_file) if record['seq'] > seq]
+    if not records:
+        return stack, lastx_list, tape, user_dict
+
+    mem.clear()
+    mem.update(snapshot['mem'])
+    settings.update(snapshot['settings'])
+    # 'set' starts from config.json, and returns a new dict rather than changing this one
+    save_settings(settings)
+    replayed = settings
+    window = BatchWindow()
+    for record in records:
+        window.answers = list(record['answers'])
+        if 'seed' in record:
+            random.seed(record['seed'])
+        # Every line was typed with at least 4 numbers in the register (see print_register()).
+        stack.pad(4)
+        if record['line']:
+            stack, lastx_list, tape, user_dict, replayed = evaluate_line(window, stack, record['line'], lastx_list, user_dict, mem, replayed, tape)
+        else:
+            # <ENTER> by itself
+            stack.push(stack.x)
+        window.clear()
+        seq = record['seq']
+    settings.update(replayed)
+
+    if save_memory:
+        save_memory_registers(mem)
+    save_settings(settings)
+    write_snapshot(session_file, stack, Session(user_dict, lastx_list, mem, settings, tape), seq)
+    with open(journal_file, 'w'):
+        pass
+
+    return stack, lastx_list, tape, user_dict
+
+
+def saved_journal_seq():
+    """Return the number of the last journal record included in session_file, or 0 if there's no session file ada can read."""
+    try:
+        with open(session_file, 'rb') as file:
+            return read_snapshot_header(file)[0].get('journal_seq', 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def read_journal(file_name):
+    """
+    Read the records in a journal file (see Journal). Reading stops at a record that is incomplete, as the last one may be if ada stopped while writing it.
+    """
+    records = []
+    try:
+        with open(file_name, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def set_aside_session():
+    """
+    Rename session_file and journal_file (adding ".failed") when the session in them couldn't be recovered, so the new session's journal doesn't write over them. They can then be looked at, or recovered by hand.
+
+    Returns:
+        [list] of the new file names, or None if the files couldn't be renamed
+    """
+    moved = []
+    for file_name in (session_file, journal_file):
+        if os.path.exists(file_name):
+            try:
+                os.replace(file_name, file_name + '.failed')
+            except OSError:
+                return None
+            moved.append(file_name + '.failed')
+    return moved
+
+
+# Changed files are written this long (in seconds) after the last change, so a burst of changes is written once (see WriteBehind).
+write_behind_delay = 0.5
+
+
+class WriteBehind:
+    """
+    Saves files on a background thread, so that changing a memory register or a setting never waits for the disk. save() only notes that a file needs writing; the file is written once no more changes have come in for write_behind_delay seconds. Pending files are also written by flush(), which runs when ada exits.
+
+    Each file is written to a temporary file and then renamed over the old one, so a file is never left half-written, even if ada stops in the middle of saving it.
+    """
+
+    def __init__(self, delay):
+        self.delay = delay
+        # {pending} maps a file name to a function that returns the file's new contents. The contents are made when the file is written, so they are always the latest.
+        self.pending = {}
+        self.last_change = 0
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+        # Only one flush() writes at a time, so an older version of a file can't be written over a newer one.
+        self.writing = threading.Lock()
+        self.thread = None
+
+    def save(self, file_name, contents):
+        with self.lock:
+            self.pending[file_name] = contents
+            self.last_change = time.monotonic()
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+            self.changed.notify()
+
+    def run(self):
+        while True:
+            with self.lock:
+                while not self.pending:
+                    self.changed.wait()
+                while time.monotonic() - self.last_change < self.delay:
+                    self.changed.wait(self.delay - (time.monotonic() - self.last_change))
+            self.flush()
+
+    def flush(self):
+        """Write every pending file now."""
+        with self.writing:
+            with self.lock:
+                pending, self.pending = self.pending, {}
+            for file_name, contents in pending.items():
+                try:
+                    write_file_atomically(file_name, contents())
+                except OSError:
+                    pass
+
+
+def write_file_atomically(file_name, text):
+    """
+    Write "text" to a temporary file in the same directory as "file_name", make sure it is on the disk, and then rename it to "file_name". Anyone reading the file sees either the old contents or the new, never a mixture.
+    """
+    file = tempfile.NamedTemporaryFile('w', dir=os.path.dirname(os.path.abspath(file_name)), prefix='.' + os.path.basename(file_name), suffix='.tmp', delete=False, encoding='utf-8')
+    try:
+        with file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(file.name, file_name)
+    except OSError:
+        os.unlink(file.name)
+        raise
+
+
+persistence = WriteBehind(write_behind_delay)
+atexit.register(persistence.flush)
+
+
+# Parsed JSON files, keyed by file name: ((modification time, size, inode), contents). See read_json_file().
+json_cache = {}
+
+# The contents of constants.json that the user-defined operations were last compiled from. See current_user_ops().
+user_ops_source = None
+
+
+def read_json_file(file_name):
+    """
+    Read a JSON file (e.g., constants.json or config.json). The contents are kept, and as long as the file's modification time, size, and inode are the same the next time, the kept contents are returned without reading the file again. If the file has changed -- possibly by another copy of ada -- it is read again.
+
+    Raises FileNotFoundError, like open(), if there is no such file, and ValueError if the file isn't valid JSON. The contents returned are shared by every caller, so they must not be changed; copy them first.
+    """
+    try:
+        stat = os.stat(file_name)
+    except FileNotFoundError:
+        json_cache.pop(file_name, None)
+        raise
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = json_cache.get(file_name)
+    if cached and cached[0] == signature:
+        return cached[1]
+    with open(file_name, 'r') as file:
+        contents = json.load(file)
+    json_cache[file_name] = (signature, contents)
+    return contents
+
+
+def current_user_ops(user_dict):
+    """
+    Return the user-defined operations, compiled and ready to use. If constants.json has changed since they were compiled (e.g., it was edited by another copy of ada), it is read and the operations compiled again; otherwise {user_dict} is returned as it is, and nothing is read or compiled.
+
+    If constants.json can't be read (it doesn't exist, or is being written), {user_dict} is returned as it is.
+    """
+    global user_ops_source
+    try:
+        source = read_json_file('constants.json')
+    except (FileNotFoundError, ValueError):
+        return user_dict
+    if source is not user_ops_source:
+        user_ops_source = source
+        user_dict = dict(source)
+        compile_user_ops(user_dict)
+    return user_dict
+
+
+def save_memory_registers(mem):
+    """
+    Save {mem} to memory_registers.json, in the background (see WriteBehind). JSON does not like the decimal.Decimal number type, so keys and values are converted to strings before saving to file. When the file is read at startup, strings are converted back to decimal types.
+    """
+    # list() copies the registers in one step, so they can't change while they're being converted, even though that happens on another thread.
+    persistence.save('memory_registers.json', lambda: json.dumps({str(k): str(v) for k, v in list(mem.items())}, ensure_ascii=False))
+
+
+def save_settings(settings):
+    """
+    Save {settings} to config.json, in the background (see WriteBehind).
+    """
+    persistence.save('config.json', lambda: json.dumps(dict(settings), ensure_ascii=False))
+
+
+# ==== FUNCTIONS THAT PRINT THE VARIOUS DICTIONARIES (i.e., {math}, {shortcuts}) ====
+
+def manual(stack, item, window):  # command: index
+    """Menu to access the various parts of the index."""
+    txt, line_width = ' INDEX ', 45
+    ctr1 = math.floor((line_width - len(txt)) / 2)
+    ctr2 = math.ceil((line_width - len(txt)) / 2)
+    window.addstr('\n' + '='*ctr1 + txt + '='*ctr2 + '\n')
+    window.addstr(
+        '<com>mands and stack operations\n' +
+        '<math> operations\n' +
+        '<short>cuts\n' +
+        '<con>stants/conversions\n' +
+        '<user>-defined <op>erations\n' +
+        '<phrases>\n')
+
+    window.addstr('='*line_width + '\n')
+    window.addstr("\nPress <ENTER> to continue...")
+    window.refresh()
+
+    input = get_user_input(window, 19, 29, "")
+
+    return stack
+
+
+def print_commands(stack, item, window):  # command: com
+    """List commands that are not "math functions" (like add,
+subtract, etc.). Rather, "commands" perform functions
+that provide information, change settings, access help,
+manipulate the stack, etc.
+
+To get a list of commands, math operations, shortcuts,
+constants, user-defined operations, or phrases type:
+
+    com --> (commands)
+
+    math --> (math operations)
+
+    short --> (shortcuts)
+
+      con --> (built-in constants)
+
+    userop --> (user-defined operations)
+
+    phrases --> (defined phrases)"""
+
+    # print all the keys in {shortcuts}
+    txt, line_width = ' COMMANDS ', 56
+    ctr1 = math.floor((line_width - len(txt)) / 2)
+    ctr2 = math.ceil((line_width - len(txt)) / 2)
+    window.addstr('\n' + '='*ctr1 + txt + '='*ctr2 + '\n')
+    window.refresh()
+
+    print_info_utility(window, commands)
+
+    return stack
+
+
+def print_phrases(stack, item, window):       # command: phrases
+    """
+List all the phrases that can be used instead of
+shortcuts when doing conversions. Most of the
+conversions use shortcuts such as "og" (ounces to
+grams). "phrases" allows the user to use the phrase
+rather than the shortcut. To a large extent, the
+phrases make more sense, but the shortcut is faster
+to type.
+
+IMPORTANT:
+    (1) Phrases must be used alone on the command line
+since they comprise two or more separate words.
+    (2) Phrases are not case-sensitive.
+
+Example:
+    Put 16 on the stack:
+
+        t: 0.00
+        z: 0.00
+        y: 0.00
+        x: 16
+
+    ounces to grams (or use: og)
+
+        t: 0.00
+        z: 0.00
+        y: 0.00
+        x: 453.5924
+
+To get a list of commands, math operations, shortcuts,
+constants, user-defined operations, or phrases type:
+
+    com --> (commands)
+
+    math --> (math operations)
+
+    short --> (shortcuts)
+
+      con --> (built-in constants)
+
+    userop --> (user-defined operations)
+
+    phrases --> (defined phrases)"""
+
+    # print all the keys, values in {phrases}
+    txt, line_width = ' PHRASES ', 56
+    ctr1 = math.floor((line_width - len(txt)) / 2)
+    ctr2 = math.ceil((line_width - len(txt)) / 2)
+    window.addstr('\n' + '='*ctr1 + txt + '='*ctr2 + '\n')
+
+    window.refresh()
+
+    # Print out only the first 15 phrases. The rest of this dictionary simply provides possible substitute commands that a user might mistakenly type.
+    print_info_utility(window, dict(list(phrases.items())[:15]))
+
+    return stack
+
+
+def print_math_ops(stack, item, window):  # command: math
+    """List all math operations.
+
+To get a list of commands, math operations, shortcuts,
+constants, user-defined operations, or phrases type:
+
+    com --> (commands)
+
+    math --> (math operations)
+
+    short --> (shortcuts)
+
+      con --> (built-in constants)
+
+    userop --> (user-defined operations)
+
+    phrases --> (defined phrases)"""
+
+    # print all the keys, values in {op1} and {op2}
+    txt, line_width = ' MATH OPERATIONS ', 56
+    ctr1 = math.floor((line_width - len(txt)) / 2)
+    ctr2 = math.ceil((line_width - len(txt)) / 2)
+    window.addstr('\n' + '='*ctr1 + txt + '='*ctr2 + '\n')
+
+    window.refresh()
+
+    # "op1" and "op2" need to be combined, because both contain math operations.
+    all_math_ops = {**op2, **op1}
+
+    print_info_utility(window, all_math_ops)
+
+    return stack
+
+
+def print_shortcuts(stack, item, window):  # command: short
+    """List shortcuts to frequently used math operations and
+other commands.
+
+To get a list of commands, math operations, shortcuts,
+constants, user-defined operations, or phrases type:
+
+    com --> (commands)
+
+    math --> (math operations)
+
+    short --> (shortcuts)
+
+      con --> (built-in constants)
+
+    userop --> (user-defined operations)
+
+    phrases --> (defined phrases)"""
+
+    # print all the keys, values in {shortcuts}
+    txt, line_width = ' SHORTCUTS ', 56
+    ctr1 = math.floor((line_width - len(txt)) / 2)
+    ctr2 = math.ceil((line_width - len(txt)) / 2)
+    window.addstr('\n' + '='*ctr1 + txt + '='*ctr2 + '\n')
+
+    window.refresh()
+
+    print_info_utility(window, shortcuts)
+
+    return stack
+
+
+def print_constants(stack, item, window):  # command: con
+    """List constants and conversions.
+
+Note: This list does not include user-defined constants.
+That list is accessed by typing:
+
+    userop
+
+To get a list of commands, math operations, shortcuts,
+constants, user-defined operations, or phrases type:
+
+    com --> (commands)
+
+    math --> (math operations)
+
+    short --> (shortcuts)
+
+      con --> (built-in constants)
+
+    userop --> (user-defined operations)
+
+    phrases --> (defined phrases)"""
+
+    # print all the keys, values in {constants}
+    txt, line_width = ' CONSTANTS & UNCOMMON CONVERSIONS ', 56
+    ctr1 = math.floor((line_width - len(txt)) / 2)
+    ctr2 = math.ceil((line_width - len(txt)) / 2)
+    window.addstr('\n' + '='*ctr1 + txt + '='*ctr2 + '\n')
+
+    print_info_utility(window, constants)
+
+    return stack
+
+
+def print_dict(stack, item, window):  # command: userop
+    """List user-defined operations.
+
+To use a user-defined operation, type its name. Either
+the constant's value will be placed on the stack or
+the operation will be executed.
+
+NOTE: A name made of lowercase letters and "_" can be
+used anywhere in a command line, just like a built-in
+operation. Any other name must be typed on its own
+command line. On its own line, a user-defined name also
+takes precedence over a built-in operation with the
+same name.
+
+Related commands:
+
+         user --> create, edit, save user-defined
+                  constants and operations
+
+    userhelp --> details on how to create a
+                  user-defined operation"""
+
+    # print all the keys, values in {user_dict}
+    try:
+        user_dict = read_json_file("constants.json")
+    except FileNotFoundError:
+        user_dict = {}
+
+    txt, line_width = ' USER-DEFINED OPERATIONS ', 56
+    ctr1 = math.floor((line_width - len(txt)) / 2)
+    ctr2 = math.ceil((line_width - len(txt)) / 2)
+    window.addstr('\n' + '='*ctr1 + txt + '='*ctr2 + '\n')
+
+    for k, v in user_dict.items():
+        # String together k and v[1] to it is no longer than 56
+        i = k + ': ' + str(v[0]) + ' -- '
+        j = str(v[1])
+        j = j[0:(56 - len(i))]
+        window.addstr(i + j + '\n')
+
+    window.addstr('='*line_width + '\n')
+    window.addstr('\n\n')
+    window.addstr("Press <ENTER> to continue...")
+    window.refresh()
+
+    current_row, current_col = get_current_yx(window)
+    input = get_user_input(window, current_row, current_col, '')
+
+    return stack
+
+
+def print_info_utility(window, dict):
+    """
+    Utility to print the contents of {commands}, {op1}, etc. so user can get quick information about any of those commands, operations, etc.
+
+    Args:
+        window ([curses.window]): [this terminal window]
+        dict ([dict]): [any dictionary that gets pass in]
+    """
+    max_terminal_rows, max_terminal_cols = get_terminal_dims(window)
+    current_row, current_col = get_current_yx(window)
+
+    row_num, line_width = 10, 56
+    for k, v in dict.items():
+        row_num += 1
+        if row_num == max_terminal_rows - 4:
+            r, c = max_terminal_rows - 4, 29
+            window.addstr('\n')
+            input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+            window.move(9, 0)
+            window.clrtobot()
+            window.move(9, 0)
+            window.refresh()
+            row_num = 9
+
+        # NOTE: {Phrases} contains long strings, so we have to display this dictionary differently.
+        if "decimal to binary" in dict.keys():
+            txt = '{:>25}'.format(k) + '|' + v[1] + '\n'
+        else:
+            txt = '{:>13}'.format(k) + '|' + v[1] + '\n'
+        window.addstr(txt)
+        window.refresh()
+
+    window.addstr('='*line_width + '\n\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+
+    return None
+
+
+# ==== CALCULATOR SETTINGS =============================
+
+def calculator_settings(stack, settings, window):  # command: set
+    """Access and edit calculator settings. You can:
+
+   (1) Change the number of decimals that display in
+       the stack.
+
+   (2) Turn the thousands separator on or off.
+
+   (3) Determine number format (normal/scientific)
+
+   (4) Set how much memory (in MB) the stack may use
+       before the deepest part of the stack is moved
+       to a temporary file on disk (0 = no limit)
+
+   (5) Turn on or off translating programs that are
+       run more than once (e.g., user-defined
+       operations) into Python, so they run faster
+
+   (6) Turn on or off saving the session (stack,
+       memory registers, and tape) when you quit, and
+       loading it again when ada starts. If ada stops
+       without quitting (e.g., the terminal is
+       closed), the session is recovered from a
+       journal of the lines you entered"""
+
+    # retrieve settings from config.json, once any changes waiting to be saved have been written
+    persistence.flush()
+    try:
+        settings = dict(read_json_file("config.json"))
+    except FileNotFoundError:
+        # save default settings to config.json:
+        settings = {
+            'dec_point': '4',
+            'separator': ',',
+            'notation': 'normal',
+            'memory_limit': '256',
+            'native': 'on',
+            'autosave': 'on'
+        }
+        save_settings(settings)
+    original_settings = dict(settings)
+
+    while True:
+        window.move(8, 0)
+        window.clrtobot()
+        # Print the current settings
+        window.addstr('\n' + '='*13 + ' CURRENT SETTINGS ' + '='*13 + '\n')
+        for k, v in settings.items():
+            if k == "dec_point":
+                window.addstr('Decimal points (0-28): ' + v + '\n')
+            elif k == 'separator':
+                if settings['separator'] == '':
+                    window.addstr('            Separator: ' + 'none' + '\n')
+                else:
+                    window.addstr('            Separator: ' + ',' + '\n')
+            elif k == 'notation':
+                if settings['notation'] == 'normal':
+                    window.addstr('             Notation: ' + 'normal' + '\n')
+                else:
+                    window.addstr('             Notation: ' + 'scientific' + '\n')
+            elif k == 'memory_limit':
+                window.addstr('    Memory limit (MB): ' + ('none' if v == '0' else v) + '\n')
+            elif k == 'native':
+                window.addstr('    Compile to Python: ' + v + '\n')
+            elif k == 'autosave':
+                window.addstr('     Autosave session: ' + v + '\n')
+            else:
+                pass
+        window.addstr('='*45 + '\n')
+        window.refresh()
+
+        # Print a menu of setting options.
+        window.addstr("\n\n========= CHANGE SETTINGS =========\n")
+        window.addstr("\n      Set decimal <p>oint")
+        window.addstr("\nSet thousands <s>eparator")
+        window.addstr("\n        Number <n>otation")
+        window.addstr("\n         <M>emory limit")
+        window.addstr("\n    <C>ompile to Python")
+        window.addstr("\n     <A>utosave session")
+        window.addstr("\n                   <E>xit\n\n")
+        window.addstr('===================================\n\n')
+        window.addstr(" <p> <s> <n> <m> <c> <a> or <e>: ")
+        window.refresh()
+
+        """
+        NOTE:
+            The following code listens for instances where the <ENTER> key is pressed when the user has not entered a menu choice. In this case, either the user exits settings or, if the user is in one of the settings options, the user leaves without changing the setting.
+        """
+        menu_choice = ''
+        menu_choice = get_user_input(window, None, None, "")
+        menu_choice = menu_choice.lower()
+
+        if not menu_choice or menu_choice not in ['p', 's', 'n', 'm', 'c', 'a', 'e']:
+            break
+
+        # Change menu setting
+        if menu_choice == 'p':
+            while True:
+                m = get_user_input(window, None, None, "\nEnter number of decimal points (0-28): ")
+                window.addstr(m)
+                window.refresh()
+                if not m:
+                    break
+                # If this try...except fails, user did not enter an int.
+                try:
+                    # m has to be 0-28, since floats are only accurate to 18 places.
+                    # If m not between 0 and 18, create an error.
+                    t = int(m) if (0 <= int(m) <= 28) else int('x')
+                    settings['dec_point'] = str(int(t))
+                    break
+                except:
+                    show_error(window, 'Enter an integer between 0 and 28, inclusive.\n', prompt='')
+                    break
+
+        # change thousands separator setting
+        elif menu_choice == 's':
+            separator = get_user_input(window, None, None, "\nThousands separator ('none' or ','): ")
+            window.addstr(separator)
+            window.refresh()
+            if separator.strip().lower() == 'none':
+                settings['separator'] = ''
+            elif separator.strip() == ',':
+                settings['separator'] = ','
+            else:
+                pass
+
+        elif menu_choice == 'n':
+            notation = get_user_input(window, None, None, "\nNumber notation ('<n>ormal' or '<s>cientific'): ")
+            window.addstr(notation)
+            window.refresh()
+            if notation.strip().lower() == 's':
+                settings['notation'] = 'scientific'
+            elif notation.strip().lower() == 'n':
+                settings['notation'] = 'normal'
+            else:
+                pass
+
+        elif menu_choice == 'm':
+            limit = get_user_input(window, None, None, "\nMemory limit in MB (0 for no limit): ")
+            window.addstr(limit)
+            window.refresh()
+            if limit.strip().isdigit():
+                settings['memory_limit'] = str(int(limit))
+            else:
+                pass
+
+        elif menu_choice == 'c':
+            native = get_user_input(window, None, None, "\nCompile to Python ('on' or 'off'): ")
+            window.addstr(native)
+            window.refresh()
+            if native.strip().lower() in ['on', 'off']:
+                settings['native'] = native.strip().lower()
+            else:
+                pass
+
+        elif menu_choice == 'a':
+            autosave = get_user_input(window, None, None, "\nAutosave session ('on' or 'off'): ")
+            window.addstr(autosave)
+            window.refresh()
+            if autosave.strip().lower() in ['on', 'off']:
+                settings['autosave'] = autosave.strip().lower()
+            else:
+                pass
+        else:
+            pass
+
+        # e or exit to exit out of settings
+        if menu_choice == 'e' or menu_choice == 'exit' or menu_choice == 'None' or not menu_choice:
+            break
+
+    # save {settings} to file, if they were changed
+    if settings != original_settings:
+        save_settings(settings)
+
+    # Print the register, considering the new settings.
+    stack = print_register(stack, settings, window)
+
+    return settings
+
+
+# ==== MATH OPERATIONS from {op1} =================================
+
+def log(stack, item, window):     # command: log
+    """Returns the log(10) of the x: value.
+
+Example:
+
+    100 log --> x: 2, since 10^2 = 100."""
+    if stack.x <= 0:
+        show_error(window, 'Cannot return log of numbers <= 0.\n', prompt="")
+        return stack
+    x = stack.x
+    stack.x = Decimal(str(math.log10(x)))
+    return stack
+
+
+def ceil(stack, item, window):  # command: ceil
+    """Returns to ceiling, the next higher integer, of x:
+
+Example:
+
+    6.3 ceil -> 7"""
+    x = stack.x
+    stack.x = Decimal(str(math.ceil(x)))
+    return stack
+
+
+def floor(stack, item, window):  # command: floor
+    """Returns the floor, the next lower integer, of x:
+
+Example:
+
+    6.9 floor -> 6"""
+    x = stack.x
+    stack.x = Decimal(str(math.floor(x)))
+    return stack
+
+
+def factorial(stack, item, window):  # command: !
+    """x: factorial
+
+Example (1):
+
+    4 ! --> x: 24"""
+    if stack.x < 0:
+        show_error(window, 'Factorial not defined for negative numbers.\n', prompt="")
+        return stack
+    x = int(stack.x)
+    stack.x = Decimal(str(math.factorial(x)))
+    return stack
+
+
+def negate(stack, item, window):  # command: n
+    """Negative of x:
+
+Example:
+
+    4 n --> x: -4"""
+    x = stack.x
+    stack.x = Decimal(str(operator.neg(x)))
+    return stack
+
+
+def sin(stack, item, window):     # command: sin
+    """sin(x) -- x: must be radians."""
+    x = stack.x
+    stack.x = Decimal(str(math.sin(x)))
+    return stack
+
+
+def cos(stack, item, window):  # command: cos
+    """cos(x) -- x: must be radians."""
+    x = stack.x
+    stack.x = Decimal(str(math.cos(x)))
+    return stack
+
+
+def tan(stack, item, window):     # command: tan
+    """tan(x) -- x: must be radians."""
+    x = stack.x
+    stack.x = Decimal(str(math.tan(x)))
+    return stack
+
+
+def asin(stack, item, window):    # command: asin
+    """asin(x) -- x: must be radians."""
+    x = stack.x
+    stack.x = Decimal(str(math.asin(x)))
+    return stack
+
+
+def acos(stack, item, window):    # command: acos
+    """acos(x) -- x: must be radians."""
+    x = stack.x
+    stack.x = Decimal(str(math.acos(x)))
+    return stack
+
+
+def atan(stack, item, window):    # command: atan
+    """atan(x) -- x: must be radians."""
+    x = stack.x
+    stack.x = Decimal(str(math.atan(x)))
+    return stack
+
+
+def pi_value(stack, item, window):  # command: pi
+    """Puts the value of pi on the stack."""
+    stack.push(Decimal(str(math.pi)))
+    return stack
+
+
+def deg(stack, item, window):     # command: deg
+    """Convert x: value from radians to degrees."""
+    stack.x = Decimal(str(math.degrees(stack.x)))
+    return stack
+
+
+def rad(stack, item, window):     # command: rad
+    """Convert x: value from degrees to radians."""
+    stack.x = Decimal(str(math.radians(stack.x)))
+    return stack
+
+
+def absolute(stack, item, window):  # command: abs
+    """Put the absolute value of x: on the stack."""
+    x = stack.x
+    stack.x = Decimal(str(abs(x)))
+    return stack
+
+
+def random_number(stack, item, window):  # command: rand
+    """Generate a random integer between y (exclusive) and
+    x (inclusive).
+
+Example:
+
+    1 100 rand --> x: 43 (random number between 1
+        (exclusive) and 100 (inclusive))"""
+    # make sure x: and y: are in correct order
+    x, y = int(stack.x), int(stack.y)
+    if x == y:
+        show_error(window, 'Must have a range of numbers.\n', prompt="")
+        return stack
+    if y > x:
+        x, y = y, x
+    ri = random.randint(y, x)
+    stack.push(Decimal(str(ri)))
+    return stack
+
+
+def add(stack, item, window):     # command: +
+    """y: + x:
+
+Example:
+    4 3 + --> x: 7"""
+    x, y = stack.x, stack.y
+    stack.pop()
+    stack.pop()
+    stack.push(x + y)
+    return stack
+
+
+def sub(stack, item, window):     # command: -
+    """y: - x:
+
+Example:
+
+    4 3 - --> x: 1"""
+    x, y = stack.x, stack.y
+    stack.pop()
+    stack.pop()
+    stack.push(y - x)
+    return stack
+
+
+def mul(stack, item, window):  # command: * or x
+    """y: times x:
+
+Example:
+
+    5 3 * --> x: 15"""
+    x, y = stack.x, stack.y
+    stack.pop()
+    stack.pop()
+    stack.push(y * x)
+    return stack
+
+
+def truediv(stack, item, window):  # command: /
+    """y: divided by x:
+
+Example:
+
+    12 3 / --> x: 4
+
+Note: division by zero will generate an error."""
+    if stack.x == 0:
+        show_error(window, 'Cannot divide by zero.\n')
+        return stack
+    x, y = stack.x, stack.y
+    stack.pop()
+    stack.pop()
+    stack.push(y / x)
+    return stack
+
+
+def mod(stack, item, window):  # command: %
+    """
+Modulo: remainder after dividing one number by another.
+
+Example (1):
+    5 2 % --> x: 1
+
+Example (2):
+    4 2 % --> x: 0
+
+Note: A useful fact is that only even numbers will
+result in a modulo of zero when divided by 2."""
+    x, y = stack.x, stack.y
+    stack.pop()
+    stack.pop()
+    stack.push(y % x)
+    return stack
+
+
+def power(stack, item, window):      # command: ^
+    """y: to the power of x:
+
+Example:
+
+    10 2 ^ --> x: 100
+
+NOTE: In python, "**" is used for exponents, where
+2 ** 3 yields 8. However, ada can't distinguish "**"
+from "* *" since both of these appear to be two
+multiplication symbols in a row. For this reason, use
+"^", instead of "**" for power operations."""
+    x, y = stack.x, stack.y
+    stack.pop()
+    stack.pop()
+    try:
+        stack.push(y ** x)
+    except Exception as error:
+        show_error(window, "Cannot find root of a negative number." + '\n')
+    return stack
+
+
+# ==== NUMBER SYSTEM CONVERSIONS =============================
+
+def convert_bin_to_dec(stack, window, bin_value):  # command: bindec
+    """Convert a binary value to decimal. Replaces the value
+in x: with the decimal value.
+
+TIP: As a shortcut, it is not necessary to issue the
+     the command: "bindec". Entering a binary number
+     beginning with '0b' is sufficient.
+
+Example:
+
+    0b1000 --> x: 8"""
+
+    # -- RPN() handles this directly without going through the dispatch table
+    # -- entering '0b' is sufficient to convert binary to decimal
+    # -- so entering 'bindec' actually does nothing
+
+    # If user tries to convert a string that does not start with "0b...", then window is passed in as a string, not a "curses" object. In this case, no error message can be printed, since no "window" exists.
+    if isinstance(window, str):
+        return stack
+
+    try:
+        stack.push(Decimal(str(int(bin_value, 2))))
+    except:
+        show_error(window, 'Not a valid binary value.\nExample: 0b1000\n')
+
+    return stack
+
+
+def convert_dec_to_bin(stack, item, window):  # command: decbin
+    """Convert x: from decimal to binary. Binary value is a
+string so it is reported as a string, and not placed on
+the stack.
+
+Example:
+
+    8 decbin --> "0b1000"
+
+Note: The x: value remains on the stack.
+      The binary value is shown as a string."""
+    window.addstr('\n' + '='*45 + '\n')
+    window.addstr(bin(int(stack.x)) + '\n')
+    window.addstr('='*45 + '\n\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+    return stack
+
+
+def convert_dec_to_hex(stack, item, window):  # command: dechex
+    """Convert x: from decimal to hexadecimal. The resulting
+hexadecimal number is a string, so it is reported as a
+string, and not placed on the stack.
+
+Note: The x: value remains on the stack.
+      The hex value is shown as a string."""
+
+    # SOURCE:
+    # https://owlcation.com/stem/Convert-Hex-to-Decimal
+    hex_dict = {
+        '0': '0', '1': '1', '2': '2', '3': '3', '4': '4', '5': '5',
+        '6': '6', '7': '7', '8': '8', '9': '9', '10': 'A',
+        '11': 'B', '12': 'C', '13': 'D', '14': 'E', '15': 'F'
+    }
+    result = 1
+    hex_value = ''
+    cnt = 0
+    dec_number = stack.x
+    while True:
+        stack.x = stack.x / Decimal('16')
+        stack = split_number(stack, item, window)
+        result = int(stack.x * 16)
+        if stack.x == 0 and stack.y == 0:
+            break
+        result = hex_dict[str(result)]
+        hex_value += result
+        stack.pop()
+        cnt += 1
+
+    # A decimal value of zero, won't be caught by the while loop, so...
+    if cnt == 0:
+        hex_value = '0'
+    hex_value = '0x' + hex_value[::-1]
+    stack.x = dec_number
+
+    window.addstr('\n' + '='*45 + '\n')
+    window.addstr(hex_value + '\n')
+    window.addstr('='*45 + '\n\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+
+    return stack
+
+
+def convert_hex_to_dec(stack, window, hex_value='not_hex'):  # command: hexdec
+    """Convert a hexadecimal (string beginning with "0x") to
+decimal. Since the hexadecimal number is a string, it
+is not placed on the stack.
+
+It is not necessary to issue a command. Entering a hex
+number beginning with '0x' is sufficient.
+
+Example:
+    0xA --> x: 10"""
+
+    # -- RPN() handles this directly without going through the dispatch table.Entering '0x' is sufficient to convert hex to decimal, so entering 'hexdec' actually does nothing
+
+    # If there is not hex value, then just return
+    if isinstance(window, str):
+        return stack
+
+    # SOURCE:
+    # https://owlcation.com/stem/Convert-Hex-to-Decimal
+    if hex_value == 'not_hex':
+        show_error(window, 'Enter hex values preceded with "0x".\n')
+        return stack
+    else:
+        hex_dict = {
+            '0': '0', '1': '1', '2': '2', '3': '3', '4': '4', '5': '5',
+            '6': '6', '7': '7', '8': '8', '9': '9', '10': 'A',
+            '11': 'B', '12': 'C', '13': 'D', '14': 'E', '15': 'F'
+        }
+        hex_value = hex_value[::-1].upper()
+        result = 0
+        try:
+            for ndx, i in enumerate(hex_value):
+                n = [k for k, v in hex_dict.items() if v == i]
+                result += (int(n[0]) * math.pow(16, ndx))
+            stack.push(Decimal(str(result)))
+        except IndexError:
+            show_error(window, 'Not a valid hex value.\n')
+        return stack
+
+# ==== USER-DEFINED OPERATIONS =============================
+
+
+def user_defined(stack, user_dict, window):  # command: user
+    """Define, edit, or delete a user-defined operation or
+constant.
+
+    Related commands:
+
+          userop --> list the currently defined
+                      operations
+
+        userhelp --> help on how to create
+                     user-defined operations"""
+
+    # Copy the operations, rather than change the ones read from the file (see read_json_file()).
+    try:
+        user_dict = dict(read_json_file("constants.json"))
+    except:
+        user_dict = {}
+
+    name, value, description = '', '', ''
+
+    break_loop = False
+    while True:
+
+        current_row, current_col = get_current_yx(window)
+        window.move(current_row-1, 0)
+        window.clrtoeol()
+
+        window.addstr('\n')
+        window.addstr(' NAME: lowercase; enter a current name to delete\n       or redefine.\n')
+        window.addstr('VALUE: Enter either a number or an operation.\n\n')
+        window.addstr('If you need information on operations,\npress <ENTER> then:\n\n     userhelp\n\n\n')
+        window.refresh()
+        name = get_user_input(window, None, None, "Name of operation/constant: ")
+
+        # if no name was entered, leave this function
+        if not name:
+            break
+
+        # check to see if there are any uppercase letters: ada can't handle them.
+        upper = False
+        for i in range(len(name)):
+            if name[i] in ascii_uppercase:
+                show_error(window, 'Cannot use uppercase letters in a name.\n')
+                upper = True
+                break
+        if upper:
+            continue
+
+        # if the constant already exists, edit or delete it
+        if name in user_dict.keys():
+            window.addstr("\nEnter new value to redefine " + name + ".\n")
+            window.addstr('Enter no value to delete ' + name + ".\n")
+        # make sure name is not a "system" name
+        elif name in op1.keys() or \
+                name in op2.keys() or \
+                name in constants.keys() or \
+                name in commands.keys() or \
+                name in shortcuts.keys() or \
+                name in alpha.keys() or \
+                name in phrases.keys():
+            show_error(window, 'Name already in use. Choose another.\n', prompt=None)
+            continue
+
+        # if you entered a name, get a value
+        if name:
+            value = get_user_input(window, None, None, '\nValue or operation: ')
+            if value != '':
+                try:
+                    value = str(value)
+                except:
+                    value = value.strip()
+                    # if user put commas in a number, strip them
+                    try:
+                        value = value.replace(',', '')
+                    except ValueError:
+                        pass
+
+        # if you enter no name and no value, then exit...
+        if not name and value == '':
+            break
+
+        # if you gave a name, but enter no value, then offer to delete name
+        if name:
+            if name in user_dict.keys() and value == '':
+                ok_delete = get_user_input(window, None, None, 'Delete ' + name + '? (Y/N) ')
+                if ok_delete.upper() == 'Y':
+                    del user_dict[name]
+
+            elif (not name in user_dict.keys()) and value == '':
+                show_error(window, 'When you enter no value, it is presumed you want\nto delete the name "' + name + '". However, no such name\nexists.\n')
+            else:
+                pass
+
+        # if you entered a name and a value, get a description
+        if name and value != '':
+            description = get_user_input(window, None, None, "\nDescription (optional): ")
+
+        # if you entered a name and a value (description is optional), update {user_dict}
+        if name and value != '':
+            user_dict.update({name: (value, description)})
+
+        if not name and value == '':
+            break_loop = True
+
+        repeat = ''
+        while repeat.upper() not in ['Y', 'N']:
+            repeat = get_user_input(window, None, None, "\nAdd or edit another constant? (Y/N): ")
+        if repeat.upper() == 'N':
+            break_loop = True
+
+        # Another copy of ada may read the file at any time (see current_user_ops()), so it is never left half-written.
+        write_file_atomically('constants.json', json.dumps(user_dict, ensure_ascii=False))
+
+        window.move(8, 0)
+        window.clrtobot()
+        window.move(9, 0)
+
+        item = None
+        print_dict(stack, item, window)
+
+        if break_loop:
+            break
+
+    # Recompile the user-defined operations so the changes can be used right away.
+    user_dict = current_user_ops(user_dict)
+
+    return stack, user_dict
+
+
+# ==== THE STACK =============================
+
+class Stack:
+    """
+    The calculator's stack. Register x: is item 0, y: is item 1, and so on, exactly as when the stack was a plain [list]. The difference is that the values are stored with x: at the END of the underlying list, so putting a number on the stack (push) or taking one off (pop) costs the same whether the stack holds four numbers or four million.
+
+    Underneath the list of Decimal values, the stack can hold "segments": large blocks of numbers, such as an imported data file, stored compactly (see ArraySegment). The x:, y:, z:, and t: registers are always kept in the list, so operations never see a segment; a value is only turned into a Decimal when it is popped up into the registers.
+
+    Operations should use push(), pop(), and the x, y, z, t registers. Indexing (stack[n]) and iteration (x: first) are provided for code that needs to walk the whole stack, like "list" and "export".
+
+    Once "stats" has been used, the stack keeps running statistics (see RunningStats) for the list and for each segment, and push() and pop() keep them current, so asking again doesn't mean going back over the whole stack (see summary()).
+
+    Args:
+        values (iterable): initial values, x: first (the same order as the old [list] stack)
+    """
+
+    def __init__(self, values=()):
+        self.data = list(values)
+        self.data.reverse()
+        # Segments are ordered from the bottom of the stack to the top; segments[-1] sits directly under data[0].
+        self.segments = []
+        # Statistics for the values in the list; None until summary() is first used, or after a change too big to follow.
+        self.stats = None
+
+    def push(self, value):
+        """Put "value" in x:, moving everything else up one register."""
+        self.data.append(value)
+        if self.stats is not None:
+            self.stats.add(value)
+
+    def pop(self):
+        """Remove x: from the stack and return it."""
+        value = self.data.pop()
+        if self.stats is not None and not self.stats.remove(value):
+            self.stats = None
+        if len(self.data) < 4 and self.segments:
+            self.refill()
+        return value
+
+    def refill(self, size=4):
+        """Move values up from the segments until the list holds at least "size" values (or the segments are empty)."""
+        while len(self.data) < size and self.segments:
+            segment = self.segments[-1]
+            value = segment.pop()
+            self.data.insert(0, value)
+            if segment.stats is not None and not segment.stats.remove(value):
+                segment.stats = None
+            if self.stats is not None:
+                self.stats.add(value)
+            if not segment:
+                self.segments.pop()
+
+    def push_segment(self, segment):
+        """Put a whole segment on top of the stack. The top of the segment becomes x:."""
+        if not segment:
+            return self
+        # Whatever is in the list now sits under the new segment, so it becomes a segment of its own.
+        if self.data:
+            below = ListSegment(list(reversed(self.data)))
+            below.stats = self.stats
+            self.segments.append(below)
+            self.data = []
+            if self.stats is not None:
+                self.stats = RunningStats()
+        self.segments.append(segment)
+        self.refill()
+        return self
+
+    def __len__(self):
+        return len(self.data) + sum(len(segment) for segment in self.segments)
+
+    def __bool__(self):
+        return len(self.data) > 0 or len(self.segments) > 0
+
+    def locate(self, ndx):
+        """Find the segment holding stack[ndx] and the position of that value in the segment, counted from the segment's top."""
+        ndx -= len(self.data)
+        for segment in reversed(self.segments):
+            if ndx < len(segment):
+                return segment, ndx
+            ndx -= len(segment)
+        raise IndexError('stack index out of range')
+
+    def __getitem__(self, ndx):
+        # stack[0] is x:, stack[1] is y:, etc.
+        if ndx < 0:
+            ndx += len(self)
+        if 0 <= ndx < len(self.data):
+            return self.data[-1 - ndx]
+        if ndx < 0:
+            raise IndexError('stack index out of range')
+        segment, position = self.locate(ndx)
+        return segment[position]
+
+    def __setitem__(self, ndx, value):
+        if ndx < 0:
+            ndx += len(self)
+        if ndx < 0:
+            raise IndexError('stack index out of range')
+        # Values in a segment are read-only, so bring them up into the list before changing one.
+        if ndx >= len(self.data):
+            self.locate(ndx)
+            self.refill(ndx + 1)
+        if self.stats is not None:
+            if self.stats.remove(self.data[-1 - ndx]):
+                self.stats.add(value)
+            else:
+                self.stats = None
+        self.data[-1 - ndx] = value
+
+    def __iter__(self):
+        # Iterate from x: down to the bottom of the stack.
+        yield from reversed(self.data)
+        for segment in reversed(self.segments):
+            yield from segment
+
+    def __repr__(self):
+        return 'Stack(' + repr(list(self)) + ')'
+
+    @property
+    def x(self):
+        return self[0]
+
+    @x.setter
+    def x(self, value):
+        self[0] = value
+
+    @property
+    def y(self):
+        return self[1]
+
+    @y.setter
+    def y(self, value):
+        self[1] = value
+
+    @property
+    def z(self):
+        return self[2]
+
+    @z.setter
+    def z(self, value):
+        self[2] = value
+
+    @property
+    def t(self):
+        return self[3]
+
+    @t.setter
+    def t(self, value):
+        self[3] = value
+
+    def copy(self):
+        """Return an independent copy of the stack. Segments are never modified in place, so their buffers are shared."""
+        stack = Stack()
+        stack.data = self.data.copy()
+        stack.segments = [segment.copy() for segment in self.segments]
+        for segment, copied in zip(self.segments, stack.segments):
+            if segment.stats is not None:
+                copied.stats = segment.stats.copy()
+        if self.stats is not None:
+            stack.stats = self.stats.copy()
+        return stack
+
+    def pad(self, size=4):
+        """Add zeros at the bottom of the stack until it holds at least "size" elements."""
+        self.refill(size)
+        if len(self.data) < size:
+            zeros = [Decimal('0.0')] * (size - len(self.data))
+            self.data[0:0] = zeros
+            if self.stats is not None:
+                for zero in zeros:
+                    self.stats.add(zero)
+        return self
+
+    def memory_use(self):
+        """Approximate number of bytes of RAM used by the stack's values (spilled segments don't count)."""
+        return len(self.data) * ListSegment.decimal_size + sum(segment.nbytes for segment in self.segments if segment.in_memory)
+
+    def spill(self, memory_limit, keep=1000):
+        """
+        Keep the stack's memory use under "memory_limit" bytes. First, all but the top "keep" Decimal values are packed into a compact ArraySegment or, if they can't all be stored exactly that way (e.g., the result of "1 3 /"), into a TextSegment, which keeps every digit. Then, if that isn't enough, segments are spilled to temporary files, starting with the deepest (least used) segment.
+
+        A "memory_limit" of 0 means there is no limit.
+        """
+        if not memory_limit or self.memory_use() <= memory_limit:
+            return self
+
+        if len(self.data) > keep:
+            values = self.data[:-keep][::-1]
+            del self.data[:-keep]
+            self.segments.append(pack_decimals(values) or pack_text(values))
+            # The packed values' statistics would have to be taken out of the list's one at a time; it's quicker to find both again when they're next needed.
+            self.stats = None
+
+        for ndx, segment in enumerate(self.segments):
+            if self.memory_use() <= memory_limit:
+                break
+            if type(segment) is ListSegment:
+                segment = pack_decimals(segment) or pack_text(segment)
+            if segment.in_memory and isinstance(segment, (ArraySegment, TextSegment)) and len(segment):
+                segment = segment.to_disk()
+            # The numbers are the same; only where they're kept has changed.
+            segment.stats = self.segments[ndx].stats
+            self.segments[ndx] = segment
+
+        return self
+
+    def trim(self, size=4):
+        """Remove everything from the stack except the top "size" registers."""
+        self.refill(size)
+        self.segments = []
+        if len(self.data) > size:
+            del self.data[:len(self.data) - size]
+            self.stats = None
+        return self
+
+    def summary(self):
+        """
+        Return a RunningStats for the whole stack. Statistics are found by a scan only for the parts of the stack that don't have them yet (the first time this is used, or after a change that couldn't be followed); from then on, push() and pop() keep them current. A minimum or maximum that has been popped is found again by a scan of that part alone.
+        """
+        if self.stats is None:
+            self.stats = RunningStats(self.data)
+        elif not self.stats.extremes:
+            nonzero = [value for value in self.data if value and not value.is_nan()]
+            self.stats.low, self.stats.high = min(nonzero, default=None), max(nonzero, default=None)
+            self.stats.extremes = True
+
+        running = RunningStats().merge(self.stats)
+        for segment in self.segments:
+            if segment.stats is None:
+                segment.stats = segment_stats(segment)
+            elif not segment.stats.extremes:
+                fresh = segment_stats(segment)
+                segment.stats.low, segment.stats.high = fresh.low, fresh.high
+                segment.stats.extremes = True
+            running.merge(segment.stats)
+        return running
+
+
+class ListSegment:
+    """
+    A block of Decimal values that sits in the stack under the registers. Values are stored top first; popping a value just moves "start" down the list.
+    """
+
+    # Approximate memory used by one Decimal in a list: the object itself plus the list's pointer to it.
+    decimal_size = 112
+    in_memory = True
+    # A RunningStats for the values in the segment, once the stack has needed one (see Stack.summary()).
+    stats = None
+
+    def __init__(self, values, start=0):
+        self.values = values
+        self.start = start
+
+    @property
+    def nbytes(self):
+        return len(self.values) * self.decimal_size
+
+    def __len__(self):
+        return len(self.values) - self.start
+
+    def __getitem__(self, ndx):
+        return self.values[self.start + ndx]
+
+    def __iter__(self):
+        for ndx in range(self.start, len(self.values)):
+            yield self.values[ndx]
+
+    def pop(self):
+        value = self.values[self.start]
+        self.start += 1
+        return value
+
+    def copy(self):
+        return ListSegment(self.values, self.start)
+
+
+class ArraySegment(ListSegment):
+    """
+    A block of numbers stored in a compact array rather than as individual Decimal objects: 8 bytes per number instead of 100+. Values are stored top first.
+
+    If every number can be stored exactly, the array holds scaled integers (typecode 'q'): 12.345 is stored as 12345 with a "scale" of 3. Otherwise the array holds floats (typecode 'd'). Either way, a number only becomes a Decimal when it is read.
+    """
+
+    def __init__(self, values, scale=0, start=0):
+        self.values = values
+        self.scale = scale
+        self.start = start
+        # An array() has a "typecode"; a memoryview of a spilled segment has the same thing as "format".
+        self.typecode = getattr(values, 'typecode', None) or values.format
+
+    @property
+    def nbytes(self):
+        return len(self.values) * self.values.itemsize
+
+    def __getitem__(self, ndx):
+        return self.to_decimal(self.values[self.start + ndx])
+
+    def __iter__(self):
+        # Convert the numbers with map(), rather than calling to_decimal() for each one, because walking a whole segment (e.g., "stats" or "export") can mean millions of numbers.
+        values = itertools.islice(self.values, self.start, None)
+        if self.typecode == 'd':
+            return map(Decimal, map(repr, values))
+        if self.typecode == 'f':
+            return map(Decimal, map('{:.7g}'.format, values))
+        if self.scale:
+            return map(operator.methodcaller('scaleb', -self.scale), map(Decimal, values))
+        return map(Decimal, values)
+
+    def to_decimal(self, n):
+        if self.typecode == 'd':
+            return Decimal(str(n))
+        if self.typecode == 'f':
+            # A 4-byte float has about 7 significant digits; str() would show the error in the 8th.
+            return Decimal('{:.7g}'.format(n))
+        return Decimal(n).scaleb(-self.scale)
+
+    def pop(self):
+        value = self[0]
+        self.start += 1
+        return value
+
+    def copy(self):
+        return ArraySegment(self.values, self.scale, self.start)
+
+    def to_disk(self):
+        """Write the segment to a temporary file and return a MappedSegment that reads it back from disk."""
+        file = tempfile.TemporaryFile()
+        file.write(memoryview(self.values)[self.start:])
+        file.flush()
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return MappedSegment(memoryview(mapped).cast(self.typecode), self.scale, 0, file, mapped)
+
+
+class MappedSegment(ArraySegment):
+    """
+    An ArraySegment that has been spilled to a memory-mapped temporary file. The operating system reads pages of the file back into memory only when they are needed (e.g., by "list" or "stats"), and drops them again when memory is short. The temporary file is deleted when the segment is no longer used.
+    """
+
+    in_memory = False
+
+    def __init__(self, values, scale=0, start=0, file=None, mapped=None):
+        super().__init__(values, scale, start)
+        # Keep the file and the map open for as long as the segment exists.
+        self.file = file
+        self.mapped = mapped
+
+    def copy(self):
+        return MappedSegment(self.values, self.scale, self.start, self.file, self.mapped)
+
+    def to_disk(self):
+        return self
+
+
+class ArrayBuilder:
+    """
+    Collect numbers, one at a time, into an ArraySegment. Numbers are stored as exact scaled integers for as long as possible; if a number can't be stored exactly (too many digits, or NaN/Infinity), the whole array switches to floats.
+    """
+
+    # 10 ** 18 is the largest power of 10 that fits in a signed 64-bit integer.
+    max_scale = 18
+
+    def __init__(self):
+        self.values = array('q')
+        self.scale = 0
+
+    def __len__(self):
+        return len(self.values)
+
+    def append(self, number):
+        """Add a Decimal to the end (the bottom) of the array."""
+        if self.values.typecode == 'd':
+            self.values.append(float(number))
+            return
+        exponent = number.as_tuple().exponent
+        try:
+            if -exponent > self.scale:
+                self.rescale(-exponent)
+            self.values.append(int(number.scaleb(self.scale)))
+        except (OverflowError, TypeError, ValueError):
+            # TypeError/ValueError: NaN and Infinity have no integer value.
+            self.to_float()
+            self.values.append(float(number))
+
+    def extend(self, numbers, places=None):
+        """Add a list of Decimals to the end of the array. The whole list is converted at once, which is much faster than append(), one at a time. If the caller knows that none of the numbers has more than "places" decimal places, finding out is skipped."""
+        if self.values.typecode == 'q':
+            try:
+                # NaN and Infinity have a letter for an exponent (TypeError); too many digits overflow (OverflowError).
+                if places is None:
+                    places = -min(map(operator.attrgetter('exponent'), map(Decimal.as_tuple, numbers)), default=0)
+                if places > self.scale:
+                    self.rescale(places)
+                self.values.extend(array('q', map(int, map(operator.methodcaller('scaleb', self.scale), numbers))))
+                return
+            except (OverflowError, TypeError, ValueError):
+                pass
+        for number in numbers:
+            self.append(number)
+
+    def rescale(self, scale):
+        if scale > self.max_scale:
+            raise OverflowError('too many decimal places')
+        factor = 10 ** (scale - self.scale)
+        self.values = array('q', [n * factor for n in self.values])
+        self.scale = scale
+
+    def to_float(self):
+        divisor = 10 ** self.scale
+        self.values = array('d', [n / divisor for n in self.values])
+        self.scale = 0
+
+    def segment(self):
+        return ArraySegment(self.values, self.scale)
+
+
+def pack_decimals(values):
+    """
+    Pack Decimal values (top first) into an ArraySegment. Returns None if the values can't all be stored exactly, in which case they should stay as Decimals, or be packed by pack_text() instead.
+    """
+    packed = ArrayBuilder()
+    for value in values:
+        packed.append(value)
+        if packed.values.typecode == 'd':
+            return None
+    return packed.segment()
+
+
+def pack_text(values):
+    """
+    Pack Decimal values (top first) into a TextSegment. Unlike pack_decimals(), this always works, since every value is kept exactly, as its digits.
+    """
+    strings = list(map(str, values))
+    return TextSegment(''.join(strings).encode('ascii'), array('q', itertools.accumulate(map(len, strings))))
+
+
+class TextSegment(ListSegment):
+    """
+    A block of numbers stored as their digits, for numbers that can't be stored exactly in an ArraySegment (e.g., "1 3 /" gives 28 decimal places). The digits of all the numbers are kept end to end in [text], and [ends] records where each number ends, so a number costs its length in characters plus 8 bytes, rather than 100+ as a Decimal. Each number is turned back into exactly the same Decimal when it is read. Values are stored top first.
+
+    A TextSegment that has been spilled (see to_disk()) reads [text] and [ends] from a memory-mapped temporary file instead.
+    """
+
+    def __init__(self, text, ends, start=0, file=None, mapped=None):
+        self.text = text
+        self.ends = ends
+        self.start = start
+        # Keep the file and the map open for as long as a spilled segment exists.
+        self.file = file
+        self.mapped = mapped
+        self.in_memory = file is None
+
+    @property
+    def nbytes(self):
+        return len(self.text) + len(self.ends) * self.ends.itemsize
+
+    def __len__(self):
+        return len(self.ends) - self.start
+
+    def __getitem__(self, ndx):
+        ndx += self.start
+        begin = self.ends[ndx - 1] if ndx else 0
+        return Decimal(bytes(self.text[begin:self.ends[ndx]]).decode('ascii'))
+
+    def __iter__(self):
+        for ndx in range(len(self)):
+            yield self[ndx]
+
+    def pop(self):
+        value = self[0]
+        self.start += 1
+        return value
+
+    def copy(self):
+        return TextSegment(self.text, self.ends, self.start, self.file, self.mapped)
+
+    def to_disk(self):
+        """Write the segment to a temporary file ([ends], then [text]) and return a TextSegment that reads it back from disk."""
+        if not self.in_memory:
+            return self
+        file = tempfile.TemporaryFile()
+        file.write(memoryview(self.ends))
+        file.write(self.text)
+        file.flush()
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        size = len(self.ends) * self.ends.itemsize
+        return TextSegment(memoryview(mapped)[size:], memoryview(mapped)[:size].cast('q'), self.start, file, mapped)
+
+
+class LineIndex:
+    """
+    An index of the lines in a text file that contain a number. The file is memory-mapped, and the index is built a chunk at a time, only as far into the file as has been needed so far. Each entry records where a number starts and ends in the file; the number itself is not parsed until it is used.
+    """
+
+    # Chunks start small, so the first few numbers are found quickly, and grow to "max_chunk_size".
+    chunk_size, max_chunk_size = 16 * 1024, 1024 * 1024
+
+    # A line holding a single number, with optional spaces around it (and "\r" for Windows line endings).
+    number = re.compile(rb'^[ \t]*[-+]?(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][-+]?\d+)?[ \t\r]*$', re.M)
+
+    def __init__(self, file_name):
+        self.file = open(file_name, 'rb')
+        self.mapped = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.starts, self.ends = array('q'), array('q')
+        self.scanned, self.lines = 0, 0
+
+    @property
+    def complete(self):
+        return self.scanned >= len(self.mapped)
+
+    def extend(self, count=None):
+        """Index more of the file, until "count" numbers have been found or, if count is None, to the end of the file."""
+        while not self.complete and (count is None or len(self.starts) < count):
+            # Always stop a chunk at the end of a line.
+            end = self.mapped.find(b'\n', self.scanned + self.chunk_size)
+            end = len(self.mapped) if end < 0 else end + 1
+            chunk = self.mapped[self.scanned:end]
+            for match in self.number.finditer(chunk):
+                self.starts.append(self.scanned + match.start())
+                self.ends.append(self.scanned + match.end())
+            self.lines += chunk.count(b'\n')
+            self.scanned = end
+            self.chunk_size = min(self.chunk_size * 2, self.max_chunk_size)
+
+    def value(self, ndx):
+        if ndx >= len(self.starts):
+            self.extend(ndx + 1)
+        return Decimal(self.mapped[self.starts[ndx]:self.ends[ndx]].decode('ascii'))
+
+
+class LazyFileSegment:
+    """
+    A read-only segment of the stack that is backed by a text file, one number to a line (see "import"). The first number in the file is the top of the segment. Nothing is read from the file until a value is needed, so importing a file of any size is instant, and only the values actually used cost any time or memory.
+    """
+
+    in_memory = True
+    stats = None
+
+    def __init__(self, index, start=0):
+        self.index = index
+        self.start = start
+
+    @property
+    def nbytes(self):
+        # The file itself is on disk; only the index is in memory.
+        return len(self.index.starts) * self.index.starts.itemsize * 2
+
+    def __len__(self):
+        self.index.extend()
+        return len(self.index.starts) - self.start
+
+    def __bool__(self):
+        # Unlike len(), this only reads as far into the file as it needs to.
+        self.index.extend(self.start + 1)
+        return self.start < len(self.index.starts)
+
+    def __getitem__(self, ndx):
+        return self.index.value(self.start + ndx)
+
+    def __iter__(self):
+        ndx = self.start
+        while True:
+            if ndx >= len(self.index.starts):
+                self.index.extend(ndx + 1)
+                if ndx >= len(self.index.starts):
+                    break
+            yield self.index.value(ndx)
+            ndx += 1
+
+    def pop(self):
+        value = self[0]
+        self.start += 1
+        return value
+
+    def copy(self):
+        return LazyFileSegment(self.index, self.start)
+
+
+# The running sums in a RunningStats are kept with far more digits than the calculator's usual 28, so that they are exact for any realistic data. Nothing is trapped: a NaN or Infinity on the stack just makes the sums NaN or Infinity, as sum() would.
+stats_context = Context(prec=80, traps=[])
+
+
+class RunningStats:
+    """
+    Summary statistics that are kept up to date as numbers are added and removed, without going back over the numbers: the count, the sum, the sum of squares, the minimum, and the maximum. The mean and standard deviation are found from these when they are asked for.
+
+    The sums are kept in "stats_context", so they are exact: removing a number undoes adding it exactly, and the standard deviation doesn't suffer from the cancellation that makes a floating-point sum of squares unreliable (the usual reason for Welford's method). If a sum ever does have to be rounded (or holds a NaN or Infinity), "exact" becomes False: the statistics are still right, but a number can no longer be taken out again (see remove()).
+
+    Zeros are counted separately from the smallest and largest non-zero numbers ("low" and "high"), because "stats" leaves out the zeros at the bottom of the stack (see extremes_without()). Adding or removing a zero never costs a scan. The low and high can't be updated when the low or high itself is removed; then "extremes" becomes False, and they have to be found again by a scan (see Stack.summary()).
+    """
+
+    def __init__(self, values=()):
+        self.count = 0
+        self.total = Decimal(0)
+        self.squares = Decimal(0)
+        self.zeros = 0
+        self.low = self.high = None
+        self.exact = True
+        self.extremes = True
+        for value in values:
+            self.add(value)
+
+    def add(self, value):
+        if type(value) is not Decimal:
+            value = Decimal(value)
+        self.count += 1
+        self.total = stats_context.add(self.total, value)
+        self.squares = stats_context.fma(value, value, self.squares)
+        self.check(value)
+        # A NaN can't be compared with anything, so it can't be a minimum or maximum.
+        if value.is_nan():
+            return
+        if not value:
+            self.zeros += 1
+            return
+        if self.low is None or value < self.low:
+            self.low = value
+        if self.high is None or value > self.high:
+            self.high = value
+
+    def remove(self, value):
+        """Take out a number that was added earlier. Returns False if that can't be done exactly, in which case the statistics have to be found again by a scan."""
+        if not self.exact:
+            return False
+        if type(value) is not Decimal:
+            value = Decimal(value)
+        self.count -= 1
+        self.total = stats_context.subtract(self.total, value)
+        self.squares = stats_context.fma(value.copy_negate(), value, self.squares)
+        self.check(value)
+        if value == 0:
+            self.zeros -= 1
+        elif self.count == self.zeros:
+            self.low = self.high = None
+            self.extremes = True
+        elif value == self.low or value == self.high:
+            self.extremes = False
+        return self.exact
+
+    def check(self, value):
+        if stats_context.flags[Inexact] or not value.is_finite():
+            self.exact = False
+        stats_context.clear_flags()
+
+    def merge(self, other):
+        """Add all the numbers counted in another RunningStats."""
+        self.count += other.count
+        self.total = stats_context.add(self.total, other.total)
+        self.squares = stats_context.add(self.squares, other.squares)
+        self.exact = self.exact and other.exact and not stats_context.flags[Inexact]
+        stats_context.clear_flags()
+        self.zeros += other.zeros
+        self.extremes = self.extremes and other.extremes
+        if other.low is not None and (self.low is None or other.low < self.low):
+            self.low = other.low
+        if other.high is not None and (self.high is None or other.high > self.high):
+            self.high = other.high
+        return self
+
+    def copy(self):
+        running = RunningStats()
+        running.__dict__.update(self.__dict__)
+        return running
+
+    def extremes_without(self, zeros=0):
+        """Return the minimum and maximum, leaving out "zeros" of the zeros that were counted."""
+        minimum, maximum = self.low, self.high
+        if self.zeros > zeros:
+            minimum = Decimal(0) if minimum is None or minimum > 0 else minimum
+            maximum = Decimal(0) if maximum is None or maximum < 0 else maximum
+        return minimum, maximum
+
+    @property
+    def minimum(self):
+        return self.extremes_without()[0]
+
+    @property
+    def maximum(self):
+        return self.extremes_without()[1]
+
+    @property
+    def mean(self):
+        if not self.count:
+            return None
+        return +stats_context.divide(self.total, self.count)
+
+    @property
+    def stdev(self):
+        """The sample standard deviation, or None if there are fewer than two numbers."""
+        if self.count < 2:
+            return None
+        # Sum of squared differences from the mean, found without going back over the numbers.
+        deviations = stats_context.subtract(self.squares, stats_context.divide(stats_context.multiply(self.total, self.total), self.count))
+        return +stats_context.sqrt(stats_context.divide(max(deviations, Decimal(0)), self.count - 1))
+
+
+def segment_stats(segment):
+    """
+    Find the statistics for the numbers in a segment by a scan. Exact integer arrays (the usual result of "import") are summed as plain integers, which is much faster than adding millions of Decimals.
+    """
+    if isinstance(segment, ArraySegment) and segment.typecode == 'q':
+        values = segment.values[segment.start:]
+        running = RunningStats()
+        if len(values):
+            running.count = len(values)
+            running.total = stats_context.scaleb(Decimal(sum(values)), -segment.scale)
+            running.squares = stats_context.scaleb(Decimal(sum(map(operator.mul, values, values))), -2 * segment.scale)
+            running.zeros = operator.countOf(values, 0)
+            # filter(None, ...) skips the zeros.
+            low, high = min(values), max(values)
+            if running.zeros and (low == 0 or high == 0):
+                low, high = min(filter(None, values), default=None), max(filter(None, values), default=None)
+            if low is not None:
+                running.low = Decimal(low).scaleb(-segment.scale)
+                running.high = Decimal(high).scaleb(-segment.scale)
+            running.check(running.total)
+        return running
+    return RunningStats(segment)
+
+
+def print_running_stats(running, settings, window):
+    """
+    Show the statistics in a RunningStats, in the same layout as "stats".
+    """
+    fs = '{:.' + settings['dec_point'] + 'f}'
+    window.addstr('='*12 + ' SUMMARY STATISTICS ' + '='*13 + '\n')
+    window.addstr('        Count:' + fs.format(running.count) + '\n')
+    if running.count:
+        window.addstr('         Mean:' + fs.format(running.mean) + '\n')
+        window.addstr('      Std Dev:' + (fs.format(running.stdev) if running.stdev is not None else ' not computed') + '\n')
+        window.addstr('      Minimum:' + fs.format(running.minimum) + '\n')
+        window.addstr('      Maximum:' + fs.format(running.maximum) + '\n')
+    window.addstr('          Sum:' + fs.format(running.total) + '\n')
+    window.addstr('='*45 + '\n')
+
+
+# ==== STACK FUNCTIONS =============================
+
+def clear(stack, item, window):  # command: clear or c
+    """Clear all elements from the stack. The shortcut c can
+also be used.
+
+To be distinguished from:
+
+    trim
+
+that removes all but the x:, y:, z:, and t:
+registers."""
+
+    stack = Stack([Decimal('0.0'), Decimal('0.0'), Decimal('0.0'), Decimal('0.0')])
+    return stack
+
+
+def drop(stack, item, window):  # command: drop or d
+    """Drop the last element off the stack. This operation is
+very useful when you put a value on the stack that is
+a mistake. In combination with either ru (rollup),
+rd (rolldown) or s (swap), you can manipulate the
+contents of the stack without having to c (clear) and
+retype.
+
+Example:
+
+    4 3 drop --> x: 4
+    or
+    4 3 d --> x: 4"""
+    if stack:
+        stack.pop()
+    return stack
+
+
+def dup(stack, item, window):  # command: dup or <ENTER>
+    """Duplicate the value in the x: register. <ENTER> with
+nothing else on the command line will also duplicate x.
+
+Examples (1):
+
+    4 dup --> x: 4  y: 4
+
+Example (2):
+
+    4 <enter> <enter> --> y: 4  x: 4"""
+    x = stack.x
+    stack.push(x)
+    return stack
+
+
+def get_lastx(stack, lastx_list, window=None):  # command: lastx
+    """Put the last x: value on the stack.
+
+Examples:
+    4 5 ^ --> x: 1024
+
+    lastx --> y: 1024  x: 5
+
+    3 4 --> y: 3  x: 4
+    lastx --> x: 4 (duplicates x:)"""
+    stack.push(Decimal(str(lastx_list[-2])))
+    return stack
+
+
+def list_stack(stack, item, window):  # command: list
+    """Display the contents of the entire stack."""
+    stack_names = [' x', ' y', ' z', ' t']
+    window.addstr('\n')
+
+    # stack must always have at least 4 elements
+    stack.pad(4)
+
+    # add blank stack_names, as needed
+    r = '  '
+    for i in range(len(stack) - 4):
+        stack_names.append(r)
+
+    window.addstr('='*15 + ' CURRENT STACK ' + '='*15 + '\n')
+    for register in range(len(stack)-1, -1, -1):
+        # get the number of decimals from {settings}
+        dp = settings['dec_point']
+
+        if (stack[register] > 1e9 or stack[register] < (-1 * 1e8)) and (stack[register] != 0.0):
+            # switch to scientific notation
+            fs = ('{:.0' + dp + 'e}').format(stack[register])
+        else:
+            # switch to regular number notation
+            fs = ('{:.0' + dp + 'f}').format(stack[register])
+
+        # line up decimal points
+        p = 11 + len(fs) - fs.find('.')
+
+        window.addstr(stack_names[register] + ':' + ('{:>' + str(p) + '}').format(fs) + '\n')
+
+    window.addstr('='*45 + '\n\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, "\nPress <ENTER> to continue...")
+
+    return stack
+
+
+def print_tape(window, stack, entered_list, lastx_list, user_dict, mem, settings, tape):  # command: tape
+    """Display the tape (a running record of all operations)
+from the current session. By selecting a specific line
+in the tape, the user can re-run a particular operation.
+The tape is not saved between sessions."""
+
+    if tape:
+        tape = tape[0:-1] if tape[-1] == 'tape' else tape
+    window.addstr('\n' + '='*19 + ' TAPE ' + '='*20 + '\n')
+
+    # Print each of the items store in [tape] in the terminal.
+    ndx = 0
+    while True:
+        try:
+            command_line = ''
+            for i in tape[ndx]:
+                command_line += str(i) + " "
+            window.addstr(str(ndx+1) + ". " + command_line + '\n')
+            window.refresh()
+            ndx += 1
+            if ndx >= len(tape):
+                break
+        except IndexError:
+            break
+
+    window.addstr('='*45 + '\n\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, "Press <ENTER> to continue or select a line number...")
+
+    # If the user selects an item number from the tape, clear the screen and show that item in the terminal as if the user entered it.
+    if len(input) > 0:
+        window.move(8, 0)
+        window.clrtobot()
+        command_line = ''
+        for i in tape[int(input)-1]:
+            command_line += str(i) + " "
+        window.refresh()
+
+        # Copy the command to the system clipboard and provide instruction to user on how to execute the command, if they so wish.
+        import pyperclip as pc  # for copying text (the command line) to the clipboard
+        pc.copy(command_line)
+        waiter = get_user_input(window, None, None, "\nPress <ENTER> then CTRL-v to paste\nyour selection to the command line...")
+
+    return tape
+
+
+def roll_up(stack, item, window):  # command: rollup or ru
+    """rollup (shortcut ru) rolls the stack up.
+
+x:-->y:, y:-->z:, z:-->t:, and t: wraps around to
+become x:."""
+    x, y, z, t = stack.x, stack.y, stack.z, stack.t
+    stack.x, stack.y, stack.z, stack.t = t, x, y, z
+
+    return stack
+
+
+def roll_down(stack, item, window):  # command: rolldown or rd
+    """rolldown (shortcut rd) rolls the stack down.
+
+t:-->z:, z:-->y:, y:-->x:, and x: wraps around to
+become t:."""
+    x, y, z, t = stack.x, stack.y, stack.z, stack.t
+    stack.x, stack.y, stack.z, stack.t = y, z, t, x
+    return stack
+
+
+def round_y(stack, item, window):  # command: round or r
+    """Round y: by x:.
+
+Example
+
+    3.1416 2 round --> x: 3.14
+
+You can also use a shortcut for this operation:
+    3.1416 2 r --> x: 3.14"""
+    x, y = int(stack.x), stack.y
+    if x < 0:
+        show_error(window, '\nCannot round by a negative number.\n', prompt="\n")
+    else:
+        stack.pop()
+        stack.x = Decimal(str(round(y, x)))
+    return stack
+
+
+def split_number(stack, item, window):  # command: split
+    """Splits x: into integer and decimal parts, leaving the
+original value on the stack.
+
+Example:
+    3.1416 split --> z: 3.1416  y: 3  x: 0.1416"""
+    n = stack.x
+    n_int = int(n)
+    n_dec = n - n_int
+    stack.push(Decimal(str(n_int)))
+    stack.push(Decimal(str(n_dec)))
+    return stack
+
+
+def sqrt(stack, item, window):    # command: sqrt
+    """Find the square root of x:.
+
+Example:
+    25 sqrt --> x: 5"""
+    x = stack.x
+    if x >= 0:
+        stack.pop()
+        stack.push(Decimal(str(math.sqrt(x))))
+    else:
+        show_error(window, 'Square root of a negative number is undefined.\n', prompt="")
+    return stack
+
+
+# The median is found by sorting up to this many numbers at once; for a bigger stack, see stack_median().
+stats_sort_limit = 100000
+stats_buckets = 1024
+
+
+def stack_median(stack, count, low, high):
+    """
+    Return the median of the top "count" numbers on the stack, all of which lie between "low" and "high". Up to stats_sort_limit numbers are simply sorted. A bigger stack is never copied as a whole: each pass over it counts the numbers into buckets between "low" and "high", and the next pass looks only at the bucket holding the middle of the numbers, until few enough are left to sort. NaNs are left out of a bigger stack.
+    """
+    if count <= stats_sort_limit or not (low.is_finite() and high.is_finite()):
+        import statistics
+        return statistics.median(itertools.islice(stack, count))
+
+    while low < high:
+        width = stats_context.divide(stats_context.subtract(high, low), stats_buckets)
+        counts = [0] * stats_buckets
+        lows, highs = [None] * stats_buckets, [None] * stats_buckets
+        total = below = 0
+        for value in itertools.islice(stack, count):
+            if value.is_nan():
+                continue
+            total += 1
+            if value < low:
+                below += 1
+            elif value <= high:
+                # Bigger numbers never land in a lower bucket, so the numbers in a bucket are exactly those between its lowest and highest.
+                bucket = min(int(stats_context.divide(stats_context.subtract(value, low), width)), stats_buckets - 1)
+                counts[bucket] += 1
+                if lows[bucket] is None or value < lows[bucket]:
+                    lows[bucket] = value
+                if highs[bucket] is None or value > highs[bucket]:
+                    highs[bucket] = value
+
+        # The median is the number ranked "first" (counting from 0), or halfway between it and the next one.
+        first, second = (total - 1) // 2, total // 2
+        bucket, seen = 0, below
+        while first >= seen + counts[bucket]:
+            seen += counts[bucket]
+            bucket += 1
+        if second >= seen + counts[bucket]:
+            after = next(b for b in range(bucket + 1, stats_buckets) if counts[b])
+            return (highs[bucket] + lows[after]) / 2
+        low, high = lows[bucket], highs[bucket]
+        if counts[bucket] <= stats_sort_limit:
+            middle = sorted(value for value in itertools.islice(stack, count) if not value.is_nan() and low <= value <= high)
+            if first == second:
+                return middle[first - seen]
+            return (middle[first - seen] + middle[second - seen]) / 2
+    return low
+
+
+def stats(stack, settings, window):     # command: stats
+    """Summary stats for stack.
+
+Note: This function is non-destructive: the stack is
+left intact.
+
+Results include:
+-- Count
+-- Mean
+-- Median
+-- Standard deviation
+-- Minimum
+-- Maximum
+-- Sum
+The question of what is included can be addressed best
+by example:
+
+0.0000
+0.0000
+0.0000
+0.0000
+100.0000
+0.0000
+2.0000
+3.0000
+
+============ SUMMARY STATISTICS =============
+        Count:4.0000
+         Mean:26.2500
+       Median:2.5000
+      Std Dev:49.1825
+      Minimum:0.0000
+      Maximum:100.0000
+          Sum:105.0000
+=============================================
+
+The -0- between 100 and 2 is included, but the zeroes
+"above" 100 are not. The program starts at the "top"
+of the stack and discards each zero until it gets to a
+non-zero number.
+
+Count, mean, standard deviation, minimum, maximum, and
+sum are kept up to date as numbers are put on and taken
+off the stack, so they come back at once, however big
+the stack is. The median still needs every number: up
+to 100,000 numbers are sorted, and a bigger stack is
+searched a few times over instead of being copied."""
+
+    # Count, sum, etc. are kept up to date as the stack changes (see Stack.summary()), so only the zeros at the bottom have to be found here.
+    summary = stack.summary()
+    size, zeros = len(stack), 0
+    while zeros < size - 1 and stack[size - 1 - zeros] == 0:
+        zeros += 1
+    window.addstr('\n')
+
+    # Zeros add nothing to the sums, and are counted apart from the other numbers, so leaving them out doesn't need a scan.
+    cnt = summary.count - zeros
+    minimum, maximum = summary.extremes_without(zeros)
+    if minimum is None:
+        # Only NaNs are left.
+        minimum = maximum = Decimal('NaN')
+    summary.count = cnt
+
+    # get the stats: count, mean, median, min, max, sum; save sd for later
+    mn = summary.mean
+    md = stack_median(stack, cnt, minimum, maximum)
+    sm = +summary.total
+
+    fs = '{:.' + settings['dec_point'] + 'f}'
+    window.addstr('='*12 + ' SUMMARY STATISTICS ' + '='*13 + '\n')
+    window.addstr('        Count:' + fs.format(cnt) + '\n')
+    window.addstr('         Mean:' + fs.format(mn) + '\n')
+    window.addstr('       Median:' + fs.format(md) + '\n')
+
+    err = ''  # required if there's a statistics error
+    # get standard deviation
+    sd = summary.stdev
+    if sd is not None:
+        window.addstr('      Std Dev:' + fs.format(sd) + '\n')
+    else:
+        err = "Standard deviation requires at least two non-zero data points."
+        window.addstr('      Std Dev: not computed\n')
+
+    window.addstr('      Minimum:' + fs.format(minimum) + '\n')
+    window.addstr('      Maximum:' + fs.format(maximum) + '\n')
+    window.addstr('          Sum:' + fs.format(sm) + '\n')
+    if err:
+        window.addstr('\n' + err + '\n\n')
+
+    window.addstr('='*45 + '\n')
+    window.addstr("Zero values 'above' the first (top) non-zero element in\nthe stack were ignored. Use <list> to inspect stack." + '\n\n')
+    window.refresh()
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+    return stack
+
+
+def swap(stack, item, window):    # command: swap or s
+    """Swap x: and y: values on the stack.
+
+Example (1):
+    y: 3  x: 4 swap --> y: 4  x: 3
+
+Example (2):
+    y: 4  x: 3 s --> y: 3  x: 4
+
+Note that example (2) uses a shortcut. To list
+shortcuts, type:
+
+    short"""
+    stack.x, stack.y = stack.y, stack.x
+    return stack
+
+
+def trim_stack(stack, item, window):  # command: trim
+    """Remove all elements on the stack except
+x:, y:, z:, t:.
+
+Note: You can use
+
+    list
+
+to inspect the entire stack."""
+    stack.trim(4)
+    return stack
+
+
+# ==== COLOR FUNCTIONS =============================
+
+def hex_to_rgb(stack, item=None, window=None):  # command: rgb or enter "#..."
+    """Convert hex color to rgb.
+
+Example:
+    # b31b1b rgb --> z: 179  y: 27  x: 27
+    or
+    # b31b1b --> z: 179  y: 27  x: 27
+
+NOTE 1: To detect a hex value, the string you enter
+must begin with "#" (without the quotes).
+
+NOTE 2: Entering "#" and <ENTER> is sufficient to
+convert a hex color to rgb. Issuing the "rgb"
+command works, but if ada detects the "#" character,
+conversion to rgb is assumed automatically."""
+
+    try:
+        if item[0] == '#':
+            item = item[1:]
+            try:
+                r, g, b = int(item[0:2], 16), int(item[2:4], 16), int(item[4:6], 16)
+            except ValueError:
+                show_error(window, 'Not a valid hex color.\n')
+                return stack
+
+            stack.push(Decimal(str(r)))
+            stack.push(Decimal(str(g)))
+            stack.push(Decimal(str(b)))
+        else:
+            show_error(window, 'You must provide a hex value.\nExample: #b31b1b\n')
+    except:
+        pass
+    return stack
+
+
+def rgb_to_hex(stack, item, window):  # command: hex
+    """Convert rgb color (z:, y:, x:) to hex color.
+
+Example:
+    179 27 27 hex --> #b31b1b
+
+Since the result is a string, the stack is unmodified."""
+    r, g, b = int(stack.z), int(stack.y), int(stack.x)
+    c = list(range(0, 256))
+    if r in c and g in c and b in c:
+        window.addstr('\n\n' + '='*45 + '\n')
+        window.addstr('#' + str(hex(r)[2:]) + str(hex(g)[2:]) + str(hex(b)[2:]) + '\n')
+        window.addstr('='*45 + '\n')
+        window.refresh()
+        input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+    else:
+        show_error(window, 'r, g, or b not in the\nrange of 0 to 255.\n')
+    return stack
+
+
+def get_hex_alpha(stack, item, window):  # command: alpha
+    """Put a percent alpha value (between 0 and 100) in x:
+
+This operation returns the hex equivalent, reported as
+a string.
+
+Example:
+    75 alpha --> BF"""
+    if stack.x >= 0 and stack.x <= 100:
+        n = str(int(stack.x))
+        window.addstr('\n' + '='*45 + '\n')
+        window.addstr('alpha: ' + alpha[n] + '\n')
+        window.addstr('='*45 + '\n\n')
+        window.refresh()
+        input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+    else:
+        show_error(window, "Alpha value must be between 0 and 100." + '\n')
+
+    return stack
+
+
+def list_alpha(stack, item, window):  # command: list_alpha
+    """List alpha values and their hex equivalents."""
+
+    max_rows, max_cols = get_terminal_dims(window)
+    current_row, current_col = get_current_yx(window)
+
+    window.addstr('\n' + '='*15 + ' ALPHA VALUES ' + '='*16 + '\n')
+    row_num = 9
+    for k, v in alpha.items():
+        window.addstr('{:>3}'.format(k) + ": " + v + '\n')
+        row_num += 1
+        if row_num >= max_rows-5:
+            window.refresh()
+            input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+            window.move(8, 0)
+            window.clrtobot()
+            window.move(9, 0)
+            row_num = 9
+
+    window.addstr('='*45 + '\n\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+    return stack
+
+
+# ==== COMMON CONVERSIONS =============================
+
+def ci(stack, item, window):
+    """Convert cm to inches.\n\nExample:
+
+2.54 inch --> x: 1 (converts 2.54 cm to 1 inch)"""
+    # 1 in = 2.54 cm
+    stack.x = stack.x / Decimal(str(2.54))
+    return stack
+
+
+def ic(stack, item, window):
+    """Convert inches to cm.\n\nExample:
+
+1.00 cm --> 2.54 (converts 1 inch to 2.54 cm)"""
+    # 1 in = 2.54 cm
+    stack.x = stack.x * Decimal(2.54)
+    return stack
+
+
+def lengths(stack, item, window):  # command: i
+    """
+Convert a decimal measurement to a fraction. For
+example, you can easily determine what is the
+equivalent measure of 2.25 inches in eighths. Very
+handy for woodworking.
+
+Example (1)
+    2.25 8 i
+
+        t:          2.2500
+        z:          2.0000
+        y:          2.0000
+        x:          8.0000
+
+Translation:
+    2.25" equals 2 and 2/8"
+
+============================================
+
+Example (2)
+    3.65 32 i
+
+        t:          3.6500
+        z:          3.0000
+        y:         20.8000
+        x:         32.0000
+
+    3.65" equals 3 20.8/32"
+
+============================================
+
+Example (3)
+    3.25 64i
+
+        t:          3.2500
+        z:          3.0000
+        y:         16.0000
+        x:         64.0000
+
+    3.25" equals 3 16/64" """
+
+    # Convert a decimal measurement to 1/8", 1/16", 1/32", or 1/64"
+    # Enter: X.XX >> 8, 16, 32, or 64 >> i
+
+    if stack.x == 0:
+        show_error(window, 'Enter: 3.25 then 8i\nReturns: z,y,z... 3.25 3 2 8 meaning 3.25" =  3 2/8"\n', prompt="")
+    else:
+        n = stack.y
+        n_int = int(stack.y)
+        decimal = Decimal(str(n - n_int))
+        inches = stack.x
+        stack.pop()
+        stack.push(Decimal(str(n_int)))
+        stack.push(Decimal(str(decimal * inches)))
+        stack.push(Decimal(str(inches)))
+
+    return stack
+
+
+def ftoc(stack, item, window):   # command: fc
+    """Convert temperature from F to C.
+
+Example:
+
+    212 fc --> 100 (degrees Centigrade)"""
+    # e.g.: enter 32 ftco and return 0
+    # C = (5/9)*(°F-32)
+    result = Decimal('5') / Decimal('9') * (stack.x - Decimal('32'))
+    stack.pop()
+    stack.push(Decimal(str(round(result, 1))))
+
+    return stack
+
+
+def ctof(stack, item, window):  # command: cf
+    """Convert temperature from C to F.
+
+Example:
+
+    100 cf --> 212 (degrees Fahrenheit)"""
+    # e.g.: enter 0C ctof and return 32F
+    # F = (9/5)*(°C)+32
+    result = ((Decimal('9') / Decimal('5')) * stack.x) + Decimal('32.0')
+    stack.pop()
+    stack.push(Decimal(str(round(result, 1))))
+    return stack
+
+
+def go(stack, item, window):    # command go
+    """Convert weight from grams to ounces.
+
+Example:
+
+    453.5924 go --> 16 (ounces)"""
+    # e.g.: enter 16g and return 453.59237
+    stack.x = stack.x * Decimal('16.0') / Decimal('453.59237')
+    return stack
+
+
+def og(stack, item, window):    # command og
+    """Convert weight from ounces to grams.
+
+Example:
+
+    16 og --> 453.5924 (grams)"""
+    # e.g.: enter 16g and return 453.59237
+    stack.x = stack.x * Decimal('453.59237') / Decimal('16.0')
+    return stack
+
+
+def kp(stack, item, window):    # command kp
+    """Convert kilograms to pounds.
+
+Example:
+
+    1 kp --> 2.204_622_621_8 (pounds)"""
+    # e.g: enter 1 kp and return 2.2046
+    stack.x = stack.x * Decimal('2.204_622_621_8')
+    return stack
+
+
+def pk(stack, item, window):    # command pk
+    """Convert pounds to kilograms.
+
+Example:
+
+    1 pk --> 2.204_622_621_8 (kilograms)"""
+    # e.g: enter 1 pound and return 0.4536
+    stack.x = stack.x / Decimal('2.204_622_621_8')
+    return stack
+
+
+def km(stack, item, window):    # command km
+    """Convert kilometers to miles.
+
+Example:
+
+    1 km --> 0.621_371_192_24 (miles)"""
+    # e.g: enter 1 kilometer and return 0.6214
+    stack.x = stack.x * Decimal('0.621_371_192_24')
+    return stack
+
+
+def mk(stack, item, window):    # command mk
+    """Convert miles to kilometers.
+
+Example:
+
+    1 mk --> 1.609344 (kilometer)"""
+    # e.g: enter 1 mile and return 1.6093
+    stack.x = stack.x / Decimal('0.621_371_192_24')
+    return stack
+
+
+def cm(stack, item, window):    # command cm
+    """Convert cm H2O to mmHg.
+
+Example:
+
+    5 cm --> 3.6778 (mmHg))"""
+    stack.x = stack.x / Decimal('1.3595100263597')
+    return stack
+
+
+def mc(stack, item, window):    # command mc
+    """Convert mmHg to 6.7976 cm H2O.
+
+Example:
+
+    5 mc --> 6.7976 (cm H2O)"""
+    stack.x = stack.x * Decimal('1.3595100263597')
+    return stack
+
+
+# ==== MEMORY REGISTER FUNCTIONS =============================
+
+def mem_add(stack, mem, window):  # command: M+
+    """Add x: to the y: memory register.
+
+Example:
+    1 453
+    M+
+
+adds 453 to the current value of the #1 memory register.
+If the register doesn't exist, it will be created.
+
+Type:
+
+    ML
+
+to inspect (list) the memory registers."""
+    # memory registers range from 1 to infinity
+    if Decimal(stack.y) == int(stack.y) and stack.y > 0:
+        register, register_value = stack.y, stack.x
+    else:
+        show_error(window, 'Register numbers are positive integers, only.' + '\n', prompt="")
+        return stack, mem
+
+    # if the register already exists, add value to what's there
+    if register in mem.keys():
+        current_value = mem[register]
+        # just in case register holds something other than a number
+        try:
+            stack.pop()
+            stack.pop()
+            mem.update({register: register_value + current_value})
+        except:
+            show_error(window, 'No operation conducted.\n', prompt="")
+    else:
+        try:
+            stack.pop()
+            stack.pop()
+            mem.update({register: register_value})
+        except:
+            show_error(window, 'No operation conducted.\n', prompt="")
+
+    return stack, mem
+
+
+def mem_sub(stack, mem, window):  # command: M-
+    """Subtract x: from the y: memory register.
+
+Example:
+    3 12
+    M-
+
+Subtracts 12 from the current value of the #3 memory
+register. If the register doesn't exist, it will be
+created.
+
+Type:
+
+    ML
+
+to inspect (list) the memory registers."""
+    # Memory registers range from 1 to some very large number.
+    if Decimal(stack.y) == int(stack.y):
+        register, register_value = stack.y, stack.x
+    else:
+        show_error(window, 'Register numbers are positive integers, only.' + '\n', prompt="")
+        return stack, mem
+
+    # If the register already exists, add value to what's there
+    if register in mem.keys():
+        current_value = mem[register]
+        # just in case register holds something other than a number
+        try:
+            stack.pop()
+            stack.pop()
+            mem.update({register: current_value - register_value})
+        except:
+            show_error(window, 'No operation conducted.\n', prompt="")
+    else:
+        try:
+            stack.pop()
+            stack.pop()
+            mem.update({register: register_value})
+        except:
+            show_error(window, 'No operation conducted.\n', prompt="")
+
+    return stack, mem
+
+
+def mem_recall(stack, mem, window):  # command: MR
+    """Puts the value in the selected memory register on the stack.
+
+Example:
+    12 MR
+
+puts the value of the #12 memory register on the stack.
+
+Type:
+
+    ML
+
+to inspect (list) the memory registers."""
+    if Decimal(stack.x) == int(stack.x) and stack.x > 0:
+        register = int(stack.x)
+    else:
+        show_error(window, 'Register numbers are positive integers, only.' + '\n', prompt="")
+
+    # first, make sure the register exists in {mem}
+    if register in mem.keys():
+        stack.pop()
+        stack.push(mem[register])
+    else:
+        show_error(window, 'Memory register' + '\n' + str(int(stack.x)) + '\n' + 'does not exist.' + '\n' + 'Use\n\n\tML\n\nto list registers.' + '\n', prompt="")
+
+    return stack, mem
+
+
+def mem_list(stack, mem, window):  # command: ML
+    """List all elements of memory register.
+
+To create a memory register, use M+ or M-. Example:
+
+     1 42 M+
+
+This command creates register 1 and adds "42" to it."""
+    # dictionaries are not sorted, so temporarily
+    # sort {mem} by key (register number)
+    sorted_mem = dict(sorted(mem.items()))
+
+    if mem:
+        window.addstr('\n' + '='*15 + ' MEMORY STACK ' + '='*16 + '\n')
+        for k, v in sorted_mem.items():
+            window.addstr('Register ' + str(int(k)) + ': ' + str(v) + '\n')
+        window.addstr('='*45 + '\n\n')
+
+    else:
+        window.addstr('\n' + '='*55 + '\n')
+        window.addstr('\nNo memory registers exist at this time. Sorry.\n\n')
+        window.addstr('For help, type:\n\n')
+        window.addstr('   h M+   or   h M-\n\n')
+        window.addstr('='*55 + '\n\n')
+
+    window.refresh()
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+
+    return stack, mem
+
+
+def mem_del(stack, mem, window):  # command: MD
+    """Delete one, or a range, of memory registers. When
+deleting a range of registers, the order of the
+register numbers in x: and y: does not matter.
+Deletion is inclusive of the numbers you enter.
+Because, registers are identified with integers, the
+numbers in x: (and y:) need to be integers.
+
+NOTE 1: Make sure the stack is clear before entering
+    register numbers since, pending confirmation,
+    this operation uses whatever numbers appear in
+    x: and y: as the range of registers to delete.
+
+NOTE 2: Floats (e.g., 2.3) in x: or y: will be converted
+to integers. The resulting register numbers may or may
+not be what you intended.
+
+Example (1):
+    1 MD --> deletes #1 memory register
+
+Example (2):
+    10 3 MD --> deletes memory registers #3 to #10,
+                inclusive
+
+Example (3):
+    4 MD --> deletes memory register 4; if a value,
+    say 8, was left accidentally in y:, then a range
+    of registers from 4 to 8 will be deleted.
+    Confirmation before deletion prevents disaster in
+    such cases.
+
+Type:
+
+    ML
+
+to inspect (list) the memory registers."""
+
+    # NOTE: Get the register numbers from stack.x and stack.y. Register numbers must be positive integers greater than zero. There is no register -0-.
+    register1, register2 = int(abs(stack.x)), int(abs(stack.y))
+
+    # Make sure register2, if it isn't -0-, is >= register1
+    if (register1 > register2) and (register2 != 0):
+        register1, register2 = register2, register1
+
+    # If user wants to delete only a single register. In this case, register2 is 0.
+    if register2 == 0:
+        prompt = '\nAre you sure you want to delete register ' + str(register1) + '? (Y/N) '
+        confirm = get_user_input(window, None, None, prompt)
+        if confirm.upper() == 'Y':
+            try:
+                mem.pop(Decimal(str(register1)))
+            except KeyError:
+                input = get_user_input(window, None, None, "\nMemory register " + str(register1) + " does not exist.\nPress <ENTER> to continue...")
+            return stack, mem
+        else:
+            return stack, mem
+
+    # If user wants to delete a range of registers.
+    else:
+        prompt = '\nAre you sure you want to delete all registers\n' + 'between register ' + str(register1) + ' and register ' + str(register2) + ', inclusive? (Y/N) '
+        confirm = get_user_input(window, None, None, prompt)
+
+        register_names = []
+        if confirm.upper() == 'Y':
+
+            # Remove registers between register1 and register2, inclusive.
+            for i in range(register1, register2+1):
+
+                # Convert the register number to a potential key in {mem}.
+                r = Decimal(str(i))
+
+                # NOTE: If a KeyError is raised, then one or more memory registers that the user wants to delete do not exist. Delete registers up to the KeyError, but abort because one cause of such an error is if the user wants to delete registers 1 to 100, when 1 to 10 was intended. We don't want 100 messages to display.
+
+                try:
+
+                    mem.pop(r)
+                    # Keep track of which registers have been deleted so far... maybe only 1!
+                    register_names.append(str(i))
+
+                except KeyError:
+                    if register_names:
+
+                        # Make a single string out of the register numbers in "register_names".
+                        register_names = ', '.join(register_names)
+                        # Report out to the user which registers have been deleted and that deletion is now going to be aborted (due to a KeyError).
+
+                        if len(register_names) > 1:
+                            window.addstr("\nRegisters " + register_names + " were deleted.\n")
+                            window.addstr("\nOne or more memory registers between " + str(register1) + " and " + str(register2) +
+                                          " do not exist.\n\nUse <ML> to inspect a list of the memory registers.\n")
+
+                        else:
+                            window.addstr("\nRegister " + register_names + " was deleted.\n")
+                            window.addstr("\nOne or more memory registers between " + str(register1) +
+                                          " and " + str(register2) + " do not exist.\n\nUse <ML> to inspect a list of the memory registers.\n")
+                            window.refresh()
+                            input = get_user_input(window, None, None, "\nPress <ENTER> to continue...")
+
+                    else:
+                        window.addstr("\nNo registers were deleted. Use <ML> to inspect\na list of the memory registers.\n")
+                        window.refresh()
+                        input = get_user_input(window, None, None, "\nPress <ENTER> to continue...")
+
+                    # NOTE: Putting "return" here exits after the first KeyError, preventing a very long loop if the user enters a huge number as register 2.
+                    return stack, mem
+
+            return stack, mem
+        else:
+            return stack, mem
+
+
+# ==== HELP and TUTORIALS =======================
+
+def help(stack, item, window):    # command: help
+    """For help on help, type:
+        help"""
+
+    txt = """
+=================== HELP ====================
+Type:
+    index: table of contents of calculator commands
+   basics: the basics of RPN
+ advanced: how to use THIS calculator
+userhelp: how to create user-defined operations
+  phrases: a list of user-friendly phrases
+
+You can also type:
+
+    h [command]
+
+to get information about a specific command. Example:
+
+    h sqrt
+============================================="""
+
+    show_help(window, txt)
+
+    return stack
+
+
+def help_fxn(stack, item, window):
+    """Help for a single command.
+
+Example:
+
+    h sqrt --> Find the square root of x:.
+    """
+
+    if item in op1.keys():
+        f = op1[item]
+    elif item in op2.keys():
+        f = op2[item]
+    elif item in commands.keys():
+        f = commands[item]
+    elif item in constants.keys():
+        f = constants[item]
+    elif item in shortcuts.keys():
+        f = shortcuts[item]
+    else:
+        show_error(window, 'Help not found.\n')
+        return stack
+
+    # Now that you have the function name, go back to func and get the docString
+    docstring_text = f[0].__doc__.splitlines()
+
+    window.addstr('\n' + '='*55 + '\n\n')
+    max_terminal_rows, max_terminal_cols = get_terminal_dims(window)
+
+    row_num, line_width = 10, 56
+    for ndx, i in enumerate(docstring_text):
+        row_num += 1
+        if row_num == max_terminal_rows - 4:
+            r, c = max_terminal_rows - 4, 29
+            window.addstr('\n')
+            input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+            window.move(9, 0)
+            window.clrtobot()
+            window.move(9, 0)
+            window.refresh()
+            row_num = 9
+
+        window.addstr(i + '\n')
+        window.refresh()
+
+    window.addstr('\n' + '='*55 + '\n')
+    window.addstr('\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, "Press <ENTER> to continue...")
+
+    return stack
+
+
+def basics(stack, item, window):
+    """The basics of RPN.
+
+Type:
+
+    basics
+
+to display an introduction to how RPN calculators
+work."""
+    txt = """============= HELP: RPN BASICS ==============
+A RPN (reverse polish notation) calculator has no "equals" < = > key. Rather, numbers are placed on a "stack" and then one or more operations are invoked to act on the stack values. The results of most operations are placed back on the stack. The size of the stack is limited by computer memory but can easily hold millions of numbers (good luck with that!). However, the first four items, or registers, in the stack, have names: x: (keyboard), y: (accumulate), z: (temporary), and t: (top).
+
+Here's an example of how RPN works:
+
+Type:
+
+    3 <ENTER>      4 <ENTER>
+
+Result:
+
+    t:          0.0000
+    z:          0.0000
+    y:          3.0000
+    x:          4.0000
+
+When 3 is entered, it goes to the x: register. Then, when 4 is entered, 3 is moved to the y: register and 4 is placed in the x: register. Now, you can do anything you want with those two numbers. Let's add them.
+
+Type:
+
+    + <ENTER>
+
+The x: and y: registers are added, and the result (7) appears on the stack.
+
+The speed of RPN is realized when entering complicated operations all on one line:
+
+Type:
+
+    3 4 dup + +
+
+ada parses the whole operation at once. After "dup" (duplicate), the stack looks like this:
+
+    t:          0.0000
+    z:          3.0000
+    y:          4.0000
+    x:          4.0000
+
+The first + adds y: (4) and x: (4) to yield 8.
+
+    t:          0.0000
+    z:          0.0000
+    y:          3.0000
+    x:          8.0000
+
+The second + adds the new y: and the new x: to yield 11.
+
+    t:          0.0000
+    z:          0.0000
+    y:          0.0000
+    x:         11.0000
+
+You can also group items using parentheses (nested groups are allowed!).
+
+Example:
+
+    (145 5+)(111 20+) *
+
+The result of the first group is placed on the stack in x:. Then it is moved to y: when the second group is executed and placed in x:. Then the multiplication operator multiplies x: and y:. This type of operation is where the real power of RPN is realized.
+
+Reverse polish notation makes it possible to never use parentheses, but they sure help us humans! Try the above calculation with and without parentheses and you'll see that the result is the same. On a non-RPN calculator, performing this calculation with and without grouping results in different values.
+============================================="""
+
+    show_help(window, txt)
+
+    return stack
+
+
+def advanced(stack, item, window):
+    """Advanced help: how to use this calculator: ada.
+
+Type:
+
+    advanced
+
+for information about advanced use of RPN and, in
+particular, this command-line calculator."""
+
+    txt = """=========== HELP: HOW TO USE ada ============
+
+INTRO and PRECISION
+ada is a command line calculator, designed for speed of both user interaction and calculations. Results of calculations are accurate to 28 decimal places due to use of python's "decimal" package. Most calculators use a "float" number type with an accuracy to 14 places. For example, using the "float" number type:
+
+    0.1 / 0.3 =  0.3333333333333333703407674875
+
+Whereas, using the "decimal" number type:
+
+    0.1 / 0.3 = 0.3333333333333333333333333333
+
+
+OPERATIONS and HELP
+You can get a list of available calculator operations by typing:
+
+    index
+
+or more detailed information by typing:
+
+    h [command]
+
+where [command] is any command in the lists of commands, operations, and shortcuts. All of the common calculator operations are available.
+
+Numbers entered in a sequence MUST be separated by spaces, for obvious reasons. A single shortcut can follow a number directly, but sequences of shortcuts or operations using words must use spaces. For examples of valid and invalid operations, put the following numbers on the stack:
+
+    t:          0.0000
+    z:          4.0000
+    y:          7.0000
+    x:          3.0000
+
+We want to drop 3, swap 4 and 7, then get the square root of the x: register (4), to yield the result: 2.0. Valid and invalid operations:
+
+    (1) 4 7 3 d s sqrt (valid)
+    (2) 4 7 3d s sqrt  (valid)
+    (3) 4 7 3ds sqrt   (invalid)
+    (4) 4 7 3 dssqrt   (invalid)
+
+Why "dssqrt" is invalid should be clear. The computer can't know what you meant. Was it "d s s qrt", with the last command being a mistake) or "d s sqrt"? The easiest rule (though it's not really a rule) is to put spaces between every item in the command line. Except for functions related to the memory registers (M+, MR, etc.), commands/operators use lower case only. Not having to use the <shift> key increases speed of entry.
+
+THE TAPE
+ada keeps track of operations you use, and these can be displayed by typing:
+
+    tape
+
+The tape provides a running list of operations entered during the current session. Type:
+
+    h tape
+
+for more information about the tape.
+
+
+ADDITIONAL FEATURES
+Besides the stack, ada provides three other features of interest. Type:
+
+    h [related commands]
+
+for more detailed information on each of the three.
+
+1. Memory registers: These registers are nearly unlimited in number and are separate from the stack. They are identified by integers (register 1, register 2, etc.). You can add to or subtract from these registers, delete registers, and list contents of all registers you have created. Contents of registers that you recall (MR) are placed on the stack. Memory registers are saved between sessions. Incorporating memory register in user-defined operations can be particularly useful. [related commands: M+, M-, MR, MD, and ML]
+
+2. User-defined operations: These provide a means for extending the available operations. You can store constants or whole operations, by name. User-defined operations are saved between sessions. [related commands: user, userop]
+
+3. Conversion between RGB and hex colors, including alpha values. [related commands: alpha, rgb, and hex]
+
+There's more! Explore the index and h [command] to see more of ada's capabilities.
+============================================="""
+
+    show_help(window, txt)
+
+    return stack
+
+
+def user_defined_help(stack, item, window):  # command: userhelp
+    """Get help on how to define, edit, or delete user-defined
+operations or constants.
+
+    Type:
+
+        user
+
+    to create a user-defined operation.
+
+    Type
+
+        usercon
+
+    to list currently available user-defined constants
+    and operations."""
+
+    txt = """Define, edit, or delete a user-defined operation or constant. A common use-case for user-defined operations would be to add a conversion that is not included in the base calculator. For example, the calculator can convert Fahrenheit temperatures to centigrade. What if you needed to convert Fahrenheit to degrees Kelvin? Simply create a user-defined operation that takes the x: register value and uses it in a formula:
+
+    (°F − 32) × 5/9 + 273.15 = K
+
+On an RPN calculator, the formula would be:
+
+    (x: 32 -) 5 x 9 / 273.15 +
+        where x: is the value in the x: register.
+
+Name that operation however you want and there you have it!
+
+Once defined, constants/operations are saved to file and they are retrieved automatically when the calculator starts. Names must be lower case and cannot contain spaces. You cannot redefine system names (e.g., "swap" or "clear"). You can define two types of named operations:
+
+(1) Numerical constants. These are numbers.
+
+    Example:
+        ultimate:  42.0  [life's meaning]
+
+(2) Operations. These are strings.
+
+    Example (1):
+        (150 140 -) 2 / 140 +
+
+    Example (2):
+        (y: x: - ) 2 / 140 +
+
+The latter example show use of register names in an operation. Here is how to construct these types of operation. Let's create this operation:
+
+    (x: y: +) y: *
+
+What this expression does: User puts three numbers on the stack. The user-defined operation adds the last two numbers, then multiplies the result by the first number that was entered.
+
+NOTE: Keep in mind that during evaluation of the operation, the stack contents change as operations are executed. We'll see this happen in this example...
+
+-- Let's put the following three values on the stack.
+
+    z:          7.0000
+    y:          3.0000
+    x:          1.0000
+
+-- When the operation [ (x: y: +) y: * ] is run, the + operator adds x: and y:. y: is removed and x: is replaced with the result: 4. z: drops down to the y: register:
+
+    z:          0.0000
+    y:          7.0000
+    x:          4.0000
+
+-- Then the current x: and y: are multiplied and the result, 28, is put in the x: register:
+
+    z:          0.0000
+    y:          0.0000
+    x:         28.0000
+
+NOTES:
+(1) The non-obvious point is that, in an operation, the registers (e.g., "x:") are not variable names, but refer to the stack at THAT point in the operation's execution.
+
+(2) Register names can save a lot of time when repeating simple calculations, such as getting the mid-point between two values. Create and save the following operation, say as "mid".
+
+    y: x: s dup rd - 2 / s d +
+
+Put any two values on the stack, and run the operation by typing:
+
+    mid
+
+An easy way to get an operation: use the command line to do what you need, then copy the steps from the tape. Format into one line, if needed, and then paste (CTRL-V, not CTRL-v) the operation into the VALUE field when you create the user-defined operation using:
+
+    user
+
+(3) User-defined constant/operation names can be used anywhere on the command line, just like built-in operations, and inside other user-defined operations.
+
+For example:
+
+    100 50 mid      -- 75
+    100 50 mid 2 *  -- 150
+
+Within a longer line, a name can only have lowercase
+letters and "_" (the first letter may be a capital).
+Other names (e.g., "k2" or "myOp") can only be used on
+their own line.
+
+If a user-defined operation has the same name as a
+built-in one, the user-defined operation is used when
+the name is on its own line, and the built-in one is
+used within a longer line.
+
+(4) Memory registers can act as variables, and may be better suited for some complicated operations. See help for M+, M-, MR, MD, and ML (e.g., h M+ or h MR)
+
+Type:
+
+    userop
+
+to list the current user-defined operations."""
+
+    show_help(window, txt)
+
+    return stack
+
+
+def show_error(window, txt, width=45, prompt="Press <ENTER> to continue..."):
+    """
+    Show an error message, "txt", between two lines of "=", and wait for <ENTER> (unless "prompt" is None). Every error that ada reports is shown this way, so that batch mode knows the line failed (see BatchWindow).
+    """
+    window.addstr('\n' + '='*width + '\n')
+    window.addstr(txt)
+    window.addstr('='*width + '\n\n')
+    window.refresh()
+    if isinstance(window, BatchWindow):
+        window.failed = True
+    if prompt is not None:
+        input = get_user_input(window, None, None, prompt)
+
+
+def show_help(window, txt):
+    max_terminal_rows, max_terminal_cols = get_terminal_dims(window)
+    help_text = '\n'.join([fold(txt, max_terminal_cols-2) for txt in txt.splitlines()])
+    help_text = help_text.split('\n')
+
+    row_num = 9
+    window.move(9, 0)
+    for i in help_text:
+        if row_num == max_terminal_rows - 5:
+            input = get_user_input(window, None, None, "\nPress <ENTER> to continue...")
+            window.move(9, 0)
+            window.clrtobot()
+            window.move(9, 0)
+            row_num = 9
+            window.refresh()
+        row_num += 1
+        window.move(row_num, 0)
+        window.addstr(i + '\n')
+
+    window.addstr('\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, "\nPress <ENTER> to continue...")
+
+    return None
+
+
+def fold(txt, max_terminal_cols=55):
+    """
+    Textwraps 'txt'; used by help_fxn(), help(), basics(), and advanced().
+    """
+    return textwrap.fill(txt, width=max_terminal_cols)
+
+
+# ==== UTILITY FUNCTIONS =============================
+
+def get_current_yx(window):
+    """
+    Get the current cursor position.
+
+    Args:
+        window ([curses.window]): current window
+
+    Returns:
+        current_location[0] -- [int], cursor location in y direction (rows)
+        current_location[1] -- [int], cursor location in x direction (columns)
+    """
+    current_location = window.getyx()
+    return current_location[0], current_location[1]
+
+
+def get_terminal_dims(window):
+    """
+    Get the dimensions of the current window.
+
+    Args:
+        window ([curses.window]): current window
+
+    Returns:
+        max_terminal[0] -- int, y dimension of terminal (rows)
+        max_terminal[1] -- int, x dimension of terminal (columns)
+    """
+    max_terminal = window.getmaxyx()
+    return max_terminal[0], max_terminal[1]
+
+
+def get_user_input(window, current_row, current_col, prompt_string):
+    """
+    As a replacement for input(), this function that gets users' input in the current window.
+
+    If current_row and/or current_col are "None", then this function will determine the current location of the cursor, which will be at the end of "prompt_string".
+
+    Args:
+        window ([curses.window]): [the current terminal window]
+        current_row ([int]): [the current location (row) of the cursor]
+        current_col ([int]): [the current location (column) of the cursor]
+        prompt_string ([str]): [what the prompt should read]
+
+    Returns:
+        [str]: [the user's input, converted from bytes to str]
+    """
+
+    # In batch mode there is no one to answer, so every prompt gets <ENTER> (or a journaled answer).
+    if isinstance(window, BatchWindow):
+        return window.getstr().decode(encoding='utf8')
+
+    import curses
+
+    window.addstr(prompt_string)
+
+    if current_row == None or current_col == None:
+        current_row, current_col = get_current_yx(window)
+
+    curses.echo()
+    input = window.getstr(current_row, current_col).decode(encoding='utf8')
+
+    curses.noecho()
+    return input
+
+
+def get_revision_number():
+    """
+    Manually run this function to get a revision number by uncommenting the first line of code in start()
+    """
+    from datetime import datetime
+
+    start_date = datetime(2021, 9, 10)
+    tday = datetime.today()
+    revision_delta = datetime.today() - start_date
+
+    return revision_delta
+
+
+def check_terminal_specs(window):
+    """
+    Determine if terminal is large enough to accomodate the calculator's functions. Column width is set at a minimum of 58 since the first line of the default menu is 55 characters wide.
+
+    Args:
+        window (curses.window): current terminal window
+    """
+
+    terminal_rows, terminal_cols = get_terminal_dims(window)
+
+    rows_flag = True if terminal_rows < 29 else False
+    cols_flag = True if terminal_cols < 58 else False
+    terminal_too_small = True if rows_flag or cols_flag else False
+
+    return terminal_too_small
+
+
+def about(stack, item, window):   # command: about
+    """Information about the author and program."""
+    rev_number = get_revision_number()
+    version_num = '4.0 rev ' + str(rev_number.days)
+
+    window.addstr('\n' + '='*45 + '\n')
+
+    txt1 = 'ada - an RPN calculator\n\n' + \
+        '  version: ' + version_num + '\n' + \
+        '   author: Richard E. Rawson\n\n'
+
+    txt2 = 'ada is named after Ada Lovelace (1815–1852), whose achievements included developing an algorithm showing how to calculate a sequence of numbers, forming the basis for the design of the modern computer. It was the first algorithm created expressly for a machine to perform.'
+
+    window.addstr('\n'.join([fold(txt1) for txt1 in txt1.splitlines()]) + '\n')
+    window.addstr('\n'.join([fold(txt2) for txt2 in txt2.splitlines()]) + '\n')
+
+    window.addstr('='*45 + '\n\n')
+    window.refresh()
+
+    input = get_user_input(window, None, None, 'Press <ENTER> to continue...')
+    return stack
+
+
+def version(stack, item, window):  # command: version
+    """Program, python, and module version info."""
+    rev_number = get_revision_number()
+    revision_date = 'Last update: 2021-11-20'
+    version_num = 'ada 4.01 rev ' + str(rev_number.days)
+    window.addstr('\n' + '='*45 + '\n')
+    window.addstr(version_num[0:18] + '\n')
+    window.addstr(revision_date + '\n\n')
+    txt = '    python: 3.8.0\n' + \
+        '    curses: 2.2\n' + \
+        '      json: 2.0.9\n' + \
+        ' pyperclip: 1.8.2\n\n'
+    window.addstr(txt)
+    window.addstr('='*45 + '\n\n')
+    window.refresh()
+    input = get_user_input(window, None, None, 'Press <ENTER> to continue...')
+
+    return stack
+
+
+def cache_info(stack, item, window):  # command: cache
+    """Statistics for the cache of compiled command lines.
+
+Every command line is compiled before it is run. The
+most recently used lines are kept, already compiled,
+so that entering the same line again (for example,
+from the tape) is faster.
+
+    hits -- lines that were found in the cache
+  misses -- lines that had to be compiled
+
+Lines and user-defined operations that run more than
+once are also translated into Python, if possible
+(see "set").
+
+  compiled -- programs translated into Python
+  rejected -- programs that can't be translated
+ fallbacks -- times a translated program ran into a
+              problem and was run step by step"""
+    window.addstr('\n' + '='*16 + ' LINE CACHE ' + '='*17 + '\n')
+    window.addstr('  Lines cached: ' + str(len(program_cache)) + ' of ' + str(program_cache_size) + '\n')
+    window.addstr('          Hits: ' + str(program_cache_stats['hits']) + '\n')
+    window.addstr('        Misses: ' + str(program_cache_stats['misses']) + '\n')
+    window.addstr('      Compiled: ' + str(native_stats['compiled']) + '\n')
+    window.addstr('      Rejected: ' + str(native_stats['rejected']) + '\n')
+    window.addstr('     Fallbacks: ' + str(native_stats['fallbacks']) + '\n')
+    window.addstr('='*45 + '\n\n')
+    window.refresh()
+    input = get_user_input(window, None, None, 'Press <ENTER> to continue...')
+
+    return stack
+
+
+def explain(stack, item, window):  # command: explain
+    """Show how a command line, or a user-defined operation,
+is compiled. The line is not run.
+
+Before a command line is run, numbers that are typed
+next to each other are worked out ahead of time, steps
+that undo each other (e.g., "s s" or "dup d") are
+removed, and some common steps are combined into one
+(e.g., "dup *"). Combined steps are shown in [ ].
+
+Example (1):
+    explain 2 3 + 4 * s s dup *
+    --> Compiled: 400
+
+Example (2):
+    explain mid
+    --> shows the compiled user-defined operation "mid"
+    """
+    if item == 'explain':
+        help_fxn(stack, item, window)
+        return stack
+
+    if item in user_programs:
+        program = user_programs[item]
+        entered = item + ': ' + ' '.join(program.items)
+    else:
+        program = compile_line(item)
+        entered = item
+    compiled = ' '.join(opcode.item for opcode in program.opcodes)
+    typed = len([text for text in program.items if text not in '()'])
+
+    window.addstr('\n' + '='*18 + ' EXPLAIN ' + '='*18 + '\n')
+    window.addstr(textwrap.fill(entered, 45, initial_indent=' Entered: ', subsequent_indent=' '*10) + '\n')
+    window.addstr('   Steps: ' + str(typed) + '\n')
+    window.addstr(textwrap.fill(compiled or '(nothing)', 45, initial_indent='Compiled: ', subsequent_indent=' '*10) + '\n')
+    window.addstr('   Steps: ' + str(len(program.opcodes)) + '\n')
+    window.addstr('='*45 + '\n\n')
+    window.refresh()
+    input = get_user_input(window, None, None, 'Press <ENTER> to continue...')
+
+    return stack
+
+
+def main(window):
+    """
+    Main function used to invoke curses.wrapper().
+
+    Args:
+        window (curses.window): current window object
+
+    Returns: None
+    """
+
+    RPN(stack, user_dict, lastx_list, mem, settings, tape, window)
+
+    return None
+
+
+def list_defs():
+    """
+    Generate list of functions and, optionally, docstrings for each function.
+    https://medium.com/python-pandemonium/python-introspection-with-the-inspect-module-2c85d5aa5a48
+
+    Last update:
+        RPN, evaluate_line, run_batch, message_text, read_jobs, init_worker,
+        run_job, run_worker, run_pipe, tokenize, compile_line, build_dispatch_table, resolve_item,
+        optimize, reduce_tail, square_x, power_mod, native_function,
+        initial_processing,
+        run_program, cache_info, explain, find_error,
+        print_register, format_number, number_formatter, get_file_data, get_lazy_file_data,
+        get_many_files_data, import_files, init_import_worker,
+        import_worker_file, import_binary_file, import_format,
+        read_number_file, compression, open_data_file,
+        file_extension, get_follow_data, follow_numbers, show_following,
+        print_running_stats, get_binary_data, map_binary_file,
+        read_compressed_binary_file, npy_header, read_numbers,
+        parse_lines, import_report, get_table_data, read_table_file, column_index, csv_chunks,
+        column_fields, jsonl_chunks, read_table, interleave_rows, decimal_places,
+        split_file_options, export_stack, write_numbers, save_session,
+        load_session, write_snapshot, read_snapshot, read_snapshot_header,
+        recover_session, saved_journal_seq, read_journal, set_aside_session, write_file_atomically, save_memory_registers,
+        save_settings, read_json_file, current_user_ops, segment_stats, manual, print_commands, print_phrases,
+        print_math_ops, print_shortcuts, print_constants, print_dict,
+        print_info_utility, calculator_settings, log, ceil, floor,
+        factorial, negate, sin, cos, tan, asin, acos, atan, pi_value,
+        deg, rad, absolute, random_number, add, sub, mul, truediv,
+        mod, power, convert_bin_to_dec, convert_dec_to_bin,
+        convert_dec_to_hex, convert_hex_to_dec, user_defined, clear,
+        drop, dup, get_lastx, list_stack, print_tape, roll_up, roll_down,
+        round_y, split_number, sqrt, stats, swap, trim_stack, hex_to_rgb,
+        rgb_to_hex, get_hex_alpha, list_alpha, ci, ic, lengths,
+        ftoc, ctof, go, og, kp, pk, km, mk, cm, mc, mem_add, mem_sub,
+        mem_recall, mem_list, mem_del, help, help_fxn, basics, advanced,
+        user_defined_help, show_error, show_help, fold, get_current_yx, get_terminal_dims,
+        get_user_input, get_revision_number, check_terminal_specs,
+        about, version, main, start
+    """
+    import ast
+
+    with open('calculator.py', 'r') as fd:
+        file_contents = fd.read()
+    module = ast.parse(file_contents)
+    function_definitions = [
+        node for node in module.body if isinstance(node, ast.FunctionDef)]
+
+    function_list = []
+    for f in function_definitions:
+        function_list.append(f.name)
+        # print(f.name)
+        # print(ast.get_docstring(f))
+        # print('\n')
+
+    # function_list.sort()
+    print(function_list)
+
+    return None
+
+
+# ==== ESTABLISH GLOBAL ENVIRONMENT (VARIABLES, etc.) =================================
+
+
+# ==== TABLES =============================
+
+# Created once, when ada is imported, and used by the functions above:
+#
+#          menu -- (tuple), menu items
+#           op1 -- {dict}, operations that modify or use x: only
+#           op2 -- {dict}, operations that require both x: and y:
+#      commands -- {dict}, analogous to verbal commands such as "roll down" or "swap"
+#     constants -- {dict}, physical constants
+#     shortcuts -- {dict}, shortcut keys for commands
+#         alpha -- {dict}, alpha codes for transparency values
+#       phrases -- {dict}, short phrases that make some conversion commands easier
+
+# Menu gets printed on screen 4 items to a line.
+menu = (
+    '<d>rop       ', '<s>wap       ', '<r>oll <u>p      ', '<r>oll<d>own',
+    '<n>eg        ', '<c>lear      ', '<userop>erations ', '<user>',
+    '<set>tings   ', '<index>      ', '<help>           ', '<q>uit       '
+)
+
+# Operations that use or modify x: only (stack.x).
+op1 = {
+    "": ('', ''),
+    "====": ('', '==== GENERAL ==========================='),
+    "abs": (absolute, "absolute value of x:"),
+    "ceil": (ceil, "6.3->7"),
+    "!": (factorial, "x: factorial"),
+    "floor": (floor, "6.9->6"),
+    "log": (log, "log10(x:)"),
+    "n": (negate, "negative of x:"),
+    # "negate": (negate, "Get the negative of x."),
+    "pi": (pi_value, "pi"),
+    "rand": (random_number, 'random int between x: and y:'),
+    "round": (round_y, 'round y: by x:'),
+    "sqrt": (sqrt, "sqrt(x:)"),
+    " ": ('', ''),
+    " ====": ('', '==== TRIGONOMETRY ======================'),
+    "cos": (cos, "cos(x:) -- x: must be radians"),
+    "sin": (sin, "sin(x:) -- x: must be radians"),
+    "tan": (tan, "tan(x:) -- x: must be radians"),
+    "acos": (acos, "acos(x:) -- x: must be radians"),
+    "asin": (asin, "asin(x:) -- x: must be radians"),
+    "atan": (atan, "atan(x:) -- x: must be radians"),
+    "deg": (deg, "convert angle x: in radians to degrees"),
+    "rad": (rad, "convert angle x: in degrees to radians"),
+    "  ": ('', ''),
+    "  ====": ('', '==== CONVERSIONS ======================='),
+    'decbin': (convert_dec_to_bin, 'Convert x: from decimal to binary.'),
+    "bindec": (convert_bin_to_dec, 'Convert "0b..." from binary to decimal.'),
+    "dechex": (convert_dec_to_hex, 'Convert x: from decimal to hex.'),
+    "hexdec": (convert_hex_to_dec, 'Convert "0x..." from hex to decimal.'),
+    'ic': (ic, 'Convert inches to centimeters.'),
+    'ci': (ci, 'Convert centimeters to inches.'),
+    'cf': (ctof, 'Convert centigrade to Fahrenheit.'),
+    'fc': (ftoc, 'Convert Fahrenheit to centigrade.'),
+    'go': (go, 'Convert weight from grams to ounces.'),
+    'og': (og, 'Convert weight from ounces to grams.'),
+    'i': (lengths, 'Convert decimal measure to fraction.'),
+    'kp': (kp, 'Convert kilograms to pounds.'),
+    'pk': (pk, 'Convert pounds to kilograms.'),
+    'km': (km, 'Convert kilometers to miles.'),
+    'mk': (mk, 'Convert miles to kilometers.'),
+    'cm': (cm, 'Convert cmH2O to mmHg.'),
+    'mc': (mc, 'Convert mmHg to cmH2O.')
+}
+
+# Operations that __require__ both x: and y: (stack.x and stack.y).
+op2 = {
+    "    ": ('', ''),
+    "====": ('', '==== STANDARD OPERATORS ================'),
+    "+": (add, "y: + x:"),
+    "-": (sub, "y: - x:"),
+    "*": (mul, "y: * x:"),
+    "x": (mul, "y: * x:"),
+    "/": (truediv, "y: / x:"),
+    "%": (mod, "modulo; remainder after division"),
+    "^": (power, "y: to the power in x:"),
+}
+
+# General commands that provide functions beyond math operators.
+commands = {
+    "      ====": ('', '==== GENERAL ==========================='),
+    "about": (about, "Info about the author and product."),
+    "cache": (cache_info, "Statistics for the command-line cache."),
+    "explain": (explain, "Show how a command line is compiled."),
+    "export": (export_stack, "Export the stack to a text or CSV file."),
+    "import": (get_file_data, "Import data from a text file."),
+    "load": (load_session, "Load a saved session (stack, registers, tape)."),
+    "save": (save_session, "Save the session (stack, registers, tape)."),
+    'set': (calculator_settings, 'Access and edit settings.'),
+    'version': (version, 'Program, python, and module version info.'),
+    "     ": ('', ''),
+    " ====": ('', '==== COLOR ============================='),
+    'alpha': (get_hex_alpha, 'Hex equivalent of RGB alpha value.'),
+    'hex': (rgb_to_hex, 'Convert rgb color (z:, y:, x:) to hex color.'),
+    "list_alpha": (list_alpha, "List all alpha values."),
+    'rgb': (hex_to_rgb, 'Convert hex color to rgb.'),
+    "      ": ('', ''),
+    "  ====": ('', '==== HELP =============================='),
+    'help': (help, 'How to get help.'),
+    "index": (manual, "Menu to access parts of the manual."),
+    "basics": (basics, "The basics of RPN."),
+    "advanced": (advanced, 'Advanced help: how to use ada.'),
+    "com": (print_commands, "List all commands and math operations."),
+    "math": (print_math_ops, "List math operations."),
+    "con": (print_constants, 'List constants.'),
+    "short": (print_shortcuts, 'Available shortcuts.'),
+    "userhelp": (user_defined_help, 'How to create user-defined operations.'),
+    "phrases": (print_phrases, 'List available phrases.'),
+    "       ": ('', ''),
+    "   ====": ('', '==== MEMORY REGISTERS =================='),
+    "M+": (mem_add, 'Add x: to y: memory register.'),
+    "M-": (mem_sub, 'Subtract x: from y: memory register.'),
+    "MR": (mem_recall, 'Put x: register value on stack.'),
+    "MD": (mem_del, 'Delete one or all memory registers.'),
+    "ML": (mem_list, 'List elements of memory register.'),
+    "        ": ('', ''),
+    "    ====": ('', '==== STACK MANIPULATION ================'),
+    "clear": (clear, "Clear all elements from the stack."),
+    "drop": (drop, "Drop the last element off the stack."),
+    "dup": (dup, "Duplicate the last stack element."),
+    # ! "lastx": (get_lastx, "Put the last x: value on the stack."),
+    "list": (list_stack, "Show the entire stack."),
+    "rolldown": (roll_down, "Roll stack down."),
+    "rollup": (roll_up, "Roll stack up."),
+    "split": (split_number, "Splits x: into integer and decimal parts."),
+    'stats': (stats, 'Summary stats (non-destructive).'),
+    "swap": (swap, "Swap x: and y: values on the stack."),
+    'tape': (print_tape, "Display tape from current session."),
+    "trim": (trim_stack, 'Remove stack, except the x:, y:, z:, and t:.'),
+    "         ": ('', ''),
+    "     ====": ('', '==== USER-DEFINED ======================'),
+    "userop": (print_dict, "List user-defined operations."),
+    "user": (user_defined, 'Add/edit user-defined operations.'),
+}
+
+# Values obtained from: http://www.onlineconversion.com
+# constant names MUST be lowercase.
+# NOTE: The Decimal type has a default precision of 28 places, while the float has 18 places.
+constants = {
+    "e": (Decimal('2.7182818284590452353602874714'), 'e (Euler\'s number)'),
+    "avogadro": (Decimal('6.0221409e+23'), "Avogadro's number"),
+    "golden_ratio": (Decimal('1.61803398874989484820'), 'golden ratio'),
+    "gram": (Decimal('0.03527396195'), "ounces in a gram"),
+    "inches_hg": (Decimal('25.399999705'), "inches of Hg in a mmHg"),
+    "light":  (Decimal('299792458'), "speed of light, m/s"),
+    "mmhg": (Decimal('0.53524017145'), "inches of water in a mmHg"),
+    "parsec": (Decimal('19173510995000'), 'miles in a parsec'),
+}
+
+shortcuts = {
+    'c': (clear, 'Clear all elements from the stack'),
+    'd': (drop, 'Drop the last element off the stack'),
+    'h': (help, 'Help for a single command'),
+    'n': (negate, 'Negative of x:'),
+    'q': ('', 'Quit'),
+    'r': (round_y, 'round y by x:'),
+    'rd': (roll_down, 'Roll the stack down'),
+    'ru': (roll_up, 'Roll the stack up'),
+    's': (swap, 'Swap x: and y: values on the stack'),
+}
+
+# Keys are "percent transparency" and values are "alpha code" for hex colors; 0% is transparent; 100% is no transparency.
+alpha = {
+    '100': 'FF',
+    '95': 'F2',
+    '90': 'E6',
+    '85': 'D9',
+    '80': 'CC',
+    '75': 'BF',
+    '70': 'B3',
+    '65': 'A6',
+    '60': '99',
+    '55': '8C',
+    '50': '80',
+    '45': '73',
+    '40': '66',
+    '35': '59',
+    '30': '4D',
+    '25': '40',
+    '20': '33',
+    '15': '26',
+    '10': '1A',
+    '5': '0D',
+    '0': '00'
+}
+
+phrases = {
+    'decimal to binary': ('decbin', 'Convert decimal to binary.'),
+    # 'binary to decimal': ('bindec', 'Convert "0b..."from binary to decimal.'),
+    'decimal to hex': ('dechex', 'Convert decimal to hex.'),
+    # 'hex to decimal': ('hexdec', 'Convert "0x..." from hex to decimal.'),
+    'inches to centimeters': ('ic', 'Convert inches to centimeters.'),
+    'centimeters to inches': ('ci', 'Convert centimeters to inches.'),
+    'centigrade to fahrenheit': ('cf', 'Convert centigrade to Fahrenheit.'),
+    'fahrenheit to centigrade': ('fc', 'Convert Fahrenheit to centigrade.'),
+    'grams to ounces': ('go', 'Convert from grams to ounces.'),
+    'ounces to grams': ('og', 'Convert from ounces to grams.'),
+    'decimal to fraction': ('i', 'Convert decimal to fraction.'),
+    'kilograms to pounds': ('kp', 'Convert kilograms to pounds.'),
+    'pounds to kilograms': ('pk', 'Convert pounds to kilograms.'),
+    'kilometers to miles': ('km', 'Convert kilometers to miles.'),
+    'miles to kilometers': ('mk', 'Convert miles to kilometers.'),
+    'cm water to mmhg': ('cm', 'Convert cm water to mmHg.'),
+    'mmhg to cm water': ('mc', 'Convert mmHg to cm water.'),
+    # The rest of this dictionary holds keys that might be type by the user because, well, they make sense.
+    'userops': ('userop', ''),
+    'user operations': ('userop', ''),
+    'useroperations': ('userop', ''),
+}
+
+
+def start():
+    """
+    Run ada: $ python ada.py. Read or create config.json, that contains settings chosen by the user. Then run batch, worker, or pipe mode, if one was asked for on the command line, or else the calculator itself.
+
+    Creating universally accessible global variables saves having to pass a large number of variables between functions. The global variables set here, that are modified by the program, include:
+
+            stack -- Stack, holds the stack; unlimited length
+       lastx_list -- [list], stores the last x: value
+              mem -- {dict}, dictionary of memory registers; saved between sessions
+             tape -- [list], the "tape"
+         settings -- {dict}, settings chosen by the user
+        user_dict -- {dict}, user-defined operations
+    """
+    global stack, lastx_list, tape, settings, user_dict, mem
+    import argparse
+    import curses
+
+    stack, entered_value = Stack([Decimal('0.0')]), 0.0
+    lastx_list, tape = [Decimal('0.0')], []
+
+    # Initialize setup by saving default settings to config.json.
+    # If the file already exists, then put contents in {settings}.
+    try:
+        settings = dict(read_json_file("config.json"))
+    except FileNotFoundError:
+        settings = {
+            'dec_point': '4',
+            'separator': ',',
+            'notation': 'normal',
+            'memory_limit': '256',
+            'native': 'on',
+            'autosave': 'on'
+        }
+        # If config.json does not exist, create it.
+        with open('config.json', 'w+') as file:
+            file.write(json.dumps(settings, ensure_ascii=False))
+
+    """
+    When calculator starts, read constants.json if it exists. This way, the user has access to user-defined operations without having to do anything special
+    """
+    build_dispatch_table()
+    user_dict = current_user_ops({})
+    try:
+        with open("memory_registers.json", 'r') as file:
+            memory = json.load(file)
+            mem = {Decimal(k): Decimal(v) for k, v in memory.items()}
+    except:
+        mem = {}
+
+    # Batch mode: run command lines from a file (--batch) and/or the command line (-e) without a terminal, print the register, and exit. See run_batch().
+    parser = argparse.ArgumentParser(description='ada - an RPN calculator')
+    parser.add_argument('--batch', metavar='FILE', help='run the command lines in FILE ("-" for stdin) and print the register')
+    parser.add_argument('-e', dest='lines', metavar='LINE', action='append', default=[], help='run LINE and print the register (may be repeated)')
+    parser.add_argument('--worker', metavar='PATH', help='run every line of the file PATH (or of every file in the directory PATH) as an independent job, and print x: for each')
+    parser.add_argument('--processes', metavar='N', type=int, help='number of worker processes (default: one per CPU)')
+    parser.add_argument('--pipe', metavar='LINE', help='run LINE on every line of numbers read from stdin and print x: for each')
+    args = parser.parse_args()
+
+    if args.pipe:
+        try:
+            problems = run_pipe(args.pipe, sys.stdin, sys.stdout, user_dict, mem, settings)
+        except BrokenPipeError:
+            # The program reading the results (e.g., "head") has stopped reading.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            problems = 0
+        sys.exit(1 if problems else 0)
+
+    if args.worker:
+        try:
+            problems = run_worker(args.worker, args.processes)
+        except OSError as error:
+            parser.error(str(error))
+        sys.exit(1 if problems else 0)
+
+    if args.batch or args.lines:
+        lines = []
+        if args.batch == '-':
+            lines = sys.stdin.read().splitlines()
+        elif args.batch:
+            try:
+                with open(args.batch, 'r') as file:
+                    lines = file.read().splitlines()
+            except OSError as error:
+                parser.error(str(error))
+        problems = run_batch(lines + args.lines, stack, user_dict, lastx_list, mem, settings, tape)
+        sys.exit(1 if problems else 0)
+
+    # Pick up the stack and tape where the last session left off, replaying the journal if ada didn't quit normally.
+    if settings.get('autosave', 'on') == 'on':
+        try:
+            stack, lastx_list, tape, user_dict = recover_session(stack, lastx_list, tape, user_dict, mem, settings)
+        except Exception as error:
+            # Whatever went wrong (a missing file, or a journaled line that can't be replayed), recovery must never stop ada from starting. Starting a new journal would write over the session, so move it out of the way first.
+            moved = set_aside_session()
+            print("|")
+            print("| The last session could not be recovered:")
+            print("| " + type(error).__name__ + ": " + str(error))
+            if moved is None:
+                # The files are still there, so keep them as they are by not journaling this session.
+                settings['autosave'] = 'off'
+                print("| Autosave is off for this session, so that")
+                print("| " + session_file + " and " + journal_file + " are left as they are.")
+            else:
+                print("| It was moved to " + ' and '.join(moved) + ".")
+            print("|")
+            input("Press <ENTER> to continue...")
+
+    # Confirm that the terminal size is appropriate. If so, run main().
+    terminal_too_small = curses.wrapper(check_terminal_specs)
+    curses.endwin
+    if terminal_too_small:
+        print("|")
+        print("| Terminal must be at least 58 wide. It must be 29")
+        print("| high to use multi-line functions, such as 'HELP'")
+        print("| or 'INDEX'.")
+        print("|")
+        print("|")
+        print("| <=== 58 wide =========================================>")
+        for i in range(20):
+            try:
+                print("|")
+            except:
+                break
+
+        print("| Set terminal dimensions using these guide lines.\n")
+        input("Press <ENTER> to exit...")
+    else:
+        curses.wrapper(main)
+
+    # When the program exits, print the program name,
+    # version number, and a short description.
+    txt1 = '\nada v4.0 - an RPN calculator' + '\n'
+    print(txt1)
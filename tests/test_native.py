@@ -0,0 +1,49 @@
+"""
+Tests for translating compiled command lines into Python functions (see native_function()): a line must leave the same stack and lastx whether it runs translated or one step at a time.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+import calculator
+
+LINES = [
+    '7 100 ^ 13 %',
+    '2 3 + 4 * s s dup *',
+    '(45 32 -) 5 x 9 / 273.15 +',
+    'x: y: *',
+    'y: 2 / x: s -',
+    'z: t: + x: +',
+    '3 4 x: y: * +',
+]
+
+
+def run_lines(native):
+    calculator.build_dispatch_table()
+    calculator.program_cache.clear()
+    stack, lastx_list, tape, mem = calculator.Stack([Decimal('0.0')]), [Decimal('0.0')], [], {}
+    user_dict = {}
+    settings = {'dec_point': '4', 'separator': ',', 'notation': 'normal', 'memory_limit': '256', 'native': native, 'autosave': 'off'}
+    window = calculator.BatchWindow()
+
+    # A line is translated the second time it runs, so run every line a few times, and keep the stack and lastx after each one.
+    results = []
+    for _ in range(calculator.native_threshold + 1):
+        for line in LINES:
+            stack, lastx_list, tape, user_dict, settings = calculator.evaluate_line(window, stack, line, lastx_list, user_dict, mem, settings, tape)
+            text, failed = window.take()
+            assert not failed, text
+            results.append((line, list(stack), list(lastx_list)))
+    return results
+
+
+def test_native_and_step_by_step_agree(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    compiled = calculator.native_stats['compiled']
+    native = run_lines('on')
+    assert calculator.native_stats['compiled'] >= compiled + len(LINES)
+
+    for (line, native_stack, native_lastx), (_, stack, lastx) in zip(native, run_lines('off')):
+        assert native_stack == stack, line
+        assert native_lastx == lastx, line
@@ -0,0 +1,42 @@
+"""
+Tests for recovering a session from its journal when ada starts (see recover_session()).
+
+ada keeps its tables in globals that are only set up when it runs as a program, so each test runs ada.py in a directory of its own.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ada = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'ada.py')
+
+
+def run_ada(folder, *args):
+    return subprocess.run([sys.executable, ada] + list(args), cwd=folder, stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=60)
+
+
+def test_replaying_a_follow_import_does_not_hang(tmp_path):
+    (tmp_path / 'config.json').write_text(json.dumps({'dec_point': '1', 'separator': '', 'notation': 'normal', 'autosave': 'on'}))
+    (tmp_path / 'sensor.log').write_text('1\n2\n')
+    assert run_ada(tmp_path, '-e', '3', '-e', 'save').returncode == 0
+
+    # A session that crashed after following a file, then entering 7.
+    records = [
+        {'seq': 1, 'line': 'import', 'answers': ['sensor.log follow', '']},
+        {'seq': 2, 'line': '7', 'answers': []},
+    ]
+    (tmp_path / 'session.journal').write_text(''.join(json.dumps(record) + '\n' for record in records))
+
+    # There is no terminal, so ada stops once the session has been recovered.
+    try:
+        run_ada(tmp_path)
+    except subprocess.TimeoutExpired:
+        pytest.fail('replaying "import [file] follow" did not finish')
+
+    assert (tmp_path / 'session.journal').read_text() == ''
+    result = run_ada(tmp_path, '-e', 'load')
+    assert result.stdout.split()[-4:] == ['y:', '3.0', 'x:', '7.0']
+